@@ -0,0 +1,310 @@
+"""Performance benchmark suite for the model engines.
+
+Times `run_calc`, `run_calc_batch`, `simulate_lifetime`,
+`run_financial_model` and `calculate_dppa_hourly` at realistic sizes (one
+hourly year, one 5-minute year, 1,000-scenario sweeps) on synthetic,
+deterministic profiles, recording best wall time and peak traced memory.
+
+Results can be saved as a JSON baseline and later runs checked against it:
+
+    python -m excel_replica.analysis.benchmark --save-baseline baseline.json
+    python -m excel_replica.analysis.benchmark --check baseline.json
+
+`--check` exits with status 1 when any case is slower than the baseline by
+more than `--time-threshold` or uses more memory than `--memory-threshold`
+(fractions, default 25% and 10%). Wall times depend on the machine, so save
+the baseline on the machine that runs the checks.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from excel_replica.model.calc_engine import HAS_NUMBA, CalcConfig, run_calc, run_calc_batch
+from excel_replica.model.dppa import DPPAConfig, calculate_dppa_hourly
+from excel_replica.model.financial import FinancialConfig, run_financial_batch, run_financial_model
+from excel_replica.model.lifetime import DegradationSchedule, simulate_lifetime, simulate_lifetime_hourly
+
+
+HOURS_PER_YEAR = 8760
+STEPS_5MIN_YEAR = 105_120
+N_SCENARIOS = 1000
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory for one benchmark case."""
+    name: str
+    seconds: float  # Best wall time over the repeats
+    peak_mib: float  # Peak traced (Python/NumPy) memory of one run
+    size: int  # Steps or scenarios processed
+
+
+def make_synthetic_year(hours: int = 8760, seed: int = 42, step_hours: float = 1.0) -> Dict[str, np.ndarray]:
+    """Build a reproducible solar/load profile resembling the 40 MWp audit site."""
+    rng = np.random.default_rng(seed)
+    hour_of_day = (np.arange(hours) * step_hours) % 24
+
+    daylight = np.clip(np.sin((hour_of_day - 6) / 12 * np.pi), 0.0, None)
+    solar_kw = 40_000.0 * daylight * rng.uniform(0.6, 1.0, hours)
+    load_kw = 18_000.0 + 6_000.0 * rng.random(hours)
+
+    period_flags = np.full(hours, "N")
+    period_flags[(hour_of_day >= 22) | (hour_of_day < 4)] = "O"
+    period_flags[((hour_of_day >= 9) & (hour_of_day < 11)) | ((hour_of_day >= 17) & (hour_of_day < 20))] = "P"
+
+    return {
+        "datetime": pd.Series(pd.date_range("2025-01-01", periods=hours, freq=pd.Timedelta(hours=step_hours))),
+        "solar_kw": solar_kw,
+        "load_kw": load_kw,
+        "period_flags": period_flags,
+        "allow_discharge": np.isin(period_flags, ["P", "N"]),
+    }
+
+
+def _benchmark_config(step_hours: float = 1.0) -> CalcConfig:
+    """BESS and tariff parameters used by all benchmarks."""
+    return CalcConfig(
+        step_hours=step_hours,
+        bess_capacity_kwh=56_100.0,
+        bess_power_kw=20_000.0,
+        bess_efficiency=0.95,
+        ca_peak=0.085,
+        ca_normal=0.049,
+        ca_offpeak=0.033,
+    )
+
+
+def _financial_config() -> FinancialConfig:
+    """CAPEX/OPEX in the range of the audit project."""
+    return FinancialConfig(
+        land_cost_usd=1_000_000,
+        bop_cost_usd=6_000_000,
+        pv_cost_usd=18_000_000,
+        bess_cost_usd=12_000_000,
+        om_pv_usd=400_000,
+        om_bess_usd=250_000,
+        insurance_pv_usd=60_000,
+        insurance_bess_usd=40_000,
+    )
+
+
+def _degradation(project_years: int = 25) -> DegradationSchedule:
+    """Linear PV/BESS degradation."""
+    years = np.arange(project_years)
+    return DegradationSchedule(pv_factor=1.0 - 0.005 * years, bess_factor=1.0 - 0.02 * (years % 10))
+
+
+def _calc_args(hours: int, step_hours: float = 1.0):
+    profile = make_synthetic_year(hours, step_hours=step_hours)
+    return (
+        profile["datetime"],
+        profile["solar_kw"],
+        profile["load_kw"],
+        profile["period_flags"],
+        profile["allow_discharge"],
+        _benchmark_config(step_hours),
+    )
+
+
+# Each case factory does the setup and returns (run, size); only `run` is timed
+def _case_run_calc(hours: int, step_hours: float = 1.0, backend: str = "auto", outputs_only: bool = False):
+    args = _calc_args(hours, step_hours)
+    return (lambda: run_calc(*args, backend=backend, outputs_only=outputs_only)), hours
+
+
+def _case_run_calc_batch(backend: str = "auto"):
+    _, solar, load, flags, allow, cfg = _calc_args(HOURS_PER_YEAR)
+    capacities = np.linspace(10_000.0, 100_000.0, N_SCENARIOS)
+    return (
+        lambda: run_calc_batch(solar, load, flags, allow, cfg, bess_capacity_kwh=capacities, backend=backend)
+    ), N_SCENARIOS
+
+
+def _case_simulate_lifetime():
+    year1 = run_calc(*_calc_args(HOURS_PER_YEAR), outputs_only=True).outputs
+    degradation = _degradation()
+    return (lambda: simulate_lifetime(year1, degradation)), 25
+
+
+def _case_simulate_lifetime_hourly():
+    _, solar, load, flags, allow, cfg = _calc_args(HOURS_PER_YEAR)
+    degradation = _degradation()
+    return (lambda: simulate_lifetime_hourly(solar, load, flags, allow, cfg, degradation)), 25 * HOURS_PER_YEAR
+
+
+def _lifetime_frame():
+    year1 = run_calc(*_calc_args(HOURS_PER_YEAR), outputs_only=True).outputs
+    return simulate_lifetime(year1, _degradation()).yearly
+
+
+def _case_run_financial_model():
+    lifetime = _lifetime_frame()
+    cfg = _financial_config()
+    return (lambda: run_financial_model(lifetime, 49.59, cfg)), 1
+
+
+def _case_run_financial_sweep():
+    lifetime = _lifetime_frame()
+    cfg = _financial_config()
+    prices = np.linspace(40.0, 60.0, N_SCENARIOS)
+
+    def run():
+        return [run_financial_model(lifetime, price, cfg).project_irr for price in prices]
+
+    return run, N_SCENARIOS
+
+
+def _case_run_financial_batch():
+    lifetime = _lifetime_frame()
+    cfg = _financial_config()
+    prices = np.linspace(40.0, 60.0, N_SCENARIOS)
+    return (lambda: run_financial_batch(lifetime, prices, cfg)), N_SCENARIOS
+
+
+def _case_calculate_dppa(hours: int, step_hours: float = 1.0):
+    datetimes, solar, load, flags, _, _ = _calc_args(hours, step_hours)
+    cfg = DPPAConfig(delta=step_hours)
+    return (lambda: calculate_dppa_hourly(datetimes, solar, load, flags, cfg)), hours
+
+
+BENCHMARK_CASES: Dict[str, Callable] = {
+    "run_calc_8760": lambda: _case_run_calc(HOURS_PER_YEAR),
+    "run_calc_8760_python": lambda: _case_run_calc(HOURS_PER_YEAR, backend="python"),
+    "run_calc_8760_outputs_only": lambda: _case_run_calc(HOURS_PER_YEAR, outputs_only=True),
+    "run_calc_105120": lambda: _case_run_calc(STEPS_5MIN_YEAR, step_hours=1 / 12),
+    "run_calc_batch_1000": lambda: _case_run_calc_batch(),
+    "simulate_lifetime": _case_simulate_lifetime,
+    "simulate_lifetime_hourly": _case_simulate_lifetime_hourly,
+    "run_financial_model": _case_run_financial_model,
+    "run_financial_model_1000": _case_run_financial_sweep,
+    "run_financial_batch_1000": _case_run_financial_batch,
+    "calculate_dppa_hourly_8760": lambda: _case_calculate_dppa(HOURS_PER_YEAR),
+    "calculate_dppa_hourly_105120": lambda: _case_calculate_dppa(STEPS_5MIN_YEAR, step_hours=1 / 12),
+}
+
+
+def run_benchmark(name: str, repeats: int = 3) -> BenchmarkResult:
+    """Run one case: a warm-up, `repeats` timed runs, then one traced run."""
+    run, size = BENCHMARK_CASES[name]()
+
+    # Warm-up run (triggers JIT compilation for the numba backend)
+    run()
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    # Memory is traced in a separate run so tracing overhead does not skew timings
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(name=name, seconds=min(timings), peak_mib=peak / 2**20, size=size)
+
+
+def run_suite(names: Optional[List[str]] = None, repeats: int = 3) -> Dict[str, BenchmarkResult]:
+    """Run the selected (default: all) benchmark cases."""
+    return {name: run_benchmark(name, repeats) for name in (names or list(BENCHMARK_CASES))}
+
+
+def save_baseline(results: Dict[str, BenchmarkResult], path: Path) -> None:
+    """Write results to a JSON baseline."""
+    payload = {
+        "numba": HAS_NUMBA,
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    Path(path).write_text(json.dumps(payload, indent=2))
+
+
+def load_baseline(path: Path) -> Dict[str, BenchmarkResult]:
+    """Read a JSON baseline written by `save_baseline`."""
+    payload = json.loads(Path(path).read_text())
+    return {name: BenchmarkResult(**values) for name, values in payload["results"].items()}
+
+
+def compare_to_baseline(
+    results: Dict[str, BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    time_threshold: float = 0.25,
+    memory_threshold: float = 0.10,
+    min_seconds: float = 0.001,
+    min_mib: float = 1.0,
+) -> List[str]:
+    """Return one message per regression beyond the thresholds.
+
+    Time and memory increases below `min_seconds` / `min_mib` are ignored so
+    sub-millisecond cases do not fail on timer noise.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result.seconds > base.seconds * (1 + time_threshold) and result.seconds - base.seconds > min_seconds:
+            regressions.append(
+                f"{name}: {result.seconds*1000:.2f} ms vs baseline {base.seconds*1000:.2f} ms "
+                f"(+{(result.seconds / base.seconds - 1) * 100:.0f}%)"
+            )
+        if result.peak_mib > base.peak_mib * (1 + memory_threshold) and result.peak_mib - base.peak_mib > min_mib:
+            regressions.append(
+                f"{name}: {result.peak_mib:.1f} MiB vs baseline {base.peak_mib:.1f} MiB "
+                f"(+{(result.peak_mib / base.peak_mib - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the model engines")
+    parser.add_argument("--cases", nargs="+", choices=sorted(BENCHMARK_CASES), help="Cases to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--save-baseline", type=Path, help="Write results to this JSON baseline")
+    parser.add_argument("--check", type=Path, help="Fail on regressions against this JSON baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25)
+    parser.add_argument("--memory-threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    if not HAS_NUMBA:
+        print("numba not installed; 'auto' cases use the Python backend (pip install numba)")
+
+    print(f"\n{'case':<32} {'time (ms)':>12} {'peak (MiB)':>12} {'size':>10}")
+    results = {}
+    for name in args.cases or list(BENCHMARK_CASES):
+        result = run_benchmark(name, args.repeats)
+        results[name] = result
+        print(f"{name:<32} {result.seconds*1000:12.2f} {result.peak_mib:12.1f} {result.size:10,d}")
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.check:
+        regressions = compare_to_baseline(
+            results, load_baseline(args.check), args.time_threshold, args.memory_threshold
+        )
+        if regressions:
+            print("\nRegressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print(f"\nNo regressions against {args.check}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Import-time report for the CLI entry points.
+
+Short-lived batch processes pay the import cost of every module on their
+startup path. This runs `python -X importtime` in a fresh interpreter for
+each entry point and reports the total and the slowest top-level packages,
+so a heavy import that creeps back onto the startup path is easy to spot.
+
+Usage:
+    python -m excel_replica.analysis.import_report
+    python -m excel_replica.analysis.import_report excel_replica.run_pipeline --top 5
+    python -m excel_replica.analysis.import_report --forbid numba matplotlib scipy
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+
+ENTRY_POINTS = (
+    "excel_replica.run_pipeline",
+    "excel_replica.analysis.sensitivity",
+    "excel_replica.analysis.monte_carlo",
+    "excel_replica.analysis.visualize",
+)
+
+# Optional heavy packages that no entry point should import at module load
+LAZY_PACKAGES = ("numba", "matplotlib", "scipy", "plotly")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportTiming:
+    """One line of `-X importtime` output (times in seconds)."""
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """Import cost of one entry point."""
+    module: str
+    total_seconds: float
+    packages: Dict[str, float]  # Top-level package -> self seconds (all its modules)
+
+    def top(self, n: int) -> List[tuple]:
+        return sorted(self.packages.items(), key=lambda item: -item[1])[:n]
+
+
+def parse_importtime(stderr: str) -> List[ImportTiming]:
+    """Parse `python -X importtime` stderr into timings."""
+    timings = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(
+                module=module,
+                self_seconds=int(self_us) / 1e6,
+                cumulative_seconds=int(cumulative_us) / 1e6,
+                depth=len(indent) // 2,
+            ))
+    return timings
+
+
+def summarize(module: str, timings: List[ImportTiming]) -> ImportReport:
+    """Total import time of `module` and self time per top-level package.
+
+    Each module's self time is attributed to its top-level package, so a
+    package imported by another (numpy by pandas) counts once, under its
+    own name, and not again in its importer's total.
+    """
+    total = next((t.cumulative_seconds for t in timings if t.module == module), 0.0)
+    packages: Dict[str, float] = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        packages[package] = packages.get(package, 0.0) + timing.self_seconds
+    return ImportReport(module=module, total_seconds=total, packages=packages)
+
+
+def measure_import(module: str, python: Optional[str] = None) -> ImportReport:
+    """Import `module` in a fresh interpreter and report its import cost."""
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    return summarize(module, parse_importtime(completed.stderr))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print the report; exits 1 if a forbidden package is imported."""
+    parser = argparse.ArgumentParser(description="Report import time of the CLI entry points.")
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_POINTS), help="Modules to import")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level packages to list")
+    parser.add_argument(
+        "--forbid", nargs="*", default=None, metavar="PACKAGE",
+        help=f"Fail if any of these is imported at load (default with no names: {' '.join(LAZY_PACKAGES)})",
+    )
+    args = parser.parse_args(argv)
+    forbidden = None if args.forbid is None else (args.forbid or list(LAZY_PACKAGES))
+
+    failed = False
+    for module in args.modules:
+        report = measure_import(module)
+        print(f"{module}: {report.total_seconds * 1000:.0f} ms")
+        for package, seconds in report.top(args.top):
+            print(f"  {package:<24} {seconds * 1000:8.1f} ms")
+        if forbidden:
+            loaded = sorted(set(forbidden) & set(report.packages))
+            if loaded:
+                print(f"  FAIL: imports {', '.join(loaded)} at load")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
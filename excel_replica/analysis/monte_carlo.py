@@ -13,8 +13,9 @@ import numpy as np
 import pandas as pd
 
 from excel_replica.run_pipeline import load_financial_config
-from excel_replica.model.financial import FinancialConfig, run_financial_model
-from excel_replica.model.lifetime import load_degradation_from_excel, simulate_lifetime
+from excel_replica.model.financial import FinancialConfig, run_financial_batch
+from excel_replica.model.lifetime import load_degradation_from_excel
+from excel_replica.utils.excel_reader import ExcelReader
 
 
 np.random.seed(42)  # Reproducibility
@@ -40,20 +41,6 @@ class MonteCarloConfig:
     base_discharge_mwh: float = 8677.22
 
 
-@dataclass
-class MonteCarloResult:
-    """Result from a single Monte Carlo run."""
-    run_id: int
-    revenue_mult: float
-    capex_mult: float
-    opex_mult: float
-    solar_mult: float
-    project_irr: float
-    equity_irr: float
-    npv: float
-    payback_years: float
-
-
 def run_monte_carlo(config: MonteCarloConfig) -> pd.DataFrame:
     """Run Monte Carlo simulation.
     
@@ -64,111 +51,70 @@ def run_monte_carlo(config: MonteCarloConfig) -> pd.DataFrame:
         DataFrame with all simulation results.
     """
     # Load base configuration
-    fin_cfg_base = load_financial_config(config.excel_path)
-    degradation = load_degradation_from_excel(config.excel_path)
+    with ExcelReader(config.excel_path) as reader:
+        fin_cfg_base = load_financial_config(reader)
+        degradation = load_degradation_from_excel(reader)
     
-    results = []
     start_time = time.time()
-    
-    print(f"\n=== Running {config.n_simulations} Monte Carlo Simulations ===\n")
-    
-    for i in range(config.n_simulations):
-        if (i + 1) % 100 == 0:
-            elapsed = time.time() - start_time
-            rate = (i + 1) / elapsed
-            remaining = (config.n_simulations - i - 1) / rate
-            print(f"  Progress: {i+1}/{config.n_simulations} ({elapsed:.1f}s elapsed, ~{remaining:.1f}s remaining)")
-        
-        # Sample random multipliers
-        revenue_mult = np.random.normal(
-            config.revenue_uncertainty[0],
-            config.revenue_uncertainty[1]
-        )
-        capex_mult = np.random.normal(
-            config.capex_uncertainty[0],
-            config.capex_uncertainty[1]
-        )
-        opex_mult = np.random.normal(
-            config.opex_uncertainty[0],
-            config.opex_uncertainty[1]
-        )
-        solar_mult = np.random.normal(
-            config.solar_gen_uncertainty[0],
-            config.solar_gen_uncertainty[1]
-        )
-        
-        # Clamp to reasonable bounds
-        revenue_mult = max(0.5, min(1.5, revenue_mult))
-        capex_mult = max(0.7, min(1.3, capex_mult))
-        opex_mult = max(0.6, min(1.4, opex_mult))
-        solar_mult = max(0.8, min(1.2, solar_mult))
-        
-        # Apply multipliers to Year 1 outputs
-        year1_outputs = {
-            "solar_gen_mwh": config.base_solar_gen_mwh * solar_mult,
-            "discharge_mwh": config.base_discharge_mwh * solar_mult,
-            "power_surplus_mwh": 1087.26 * solar_mult,
-            "direct_pv_mwh": 60000.0 * solar_mult,
-            "charge_mwh": 9614.65 * solar_mult,
-        }
-        
-        # Run lifetime simulation
-        lifetime = simulate_lifetime(year1_outputs, degradation)
-        
-        # Apply multipliers to financial config
-        fin_cfg = FinancialConfig(
-            land_cost_usd=fin_cfg_base.land_cost_usd * capex_mult,
-            bop_cost_usd=fin_cfg_base.bop_cost_usd * capex_mult,
-            pv_cost_usd=fin_cfg_base.pv_cost_usd * capex_mult,
-            bess_cost_usd=fin_cfg_base.bess_cost_usd * capex_mult,
-            om_pv_usd=fin_cfg_base.om_pv_usd * opex_mult,
-            om_bess_usd=fin_cfg_base.om_bess_usd * opex_mult,
-            insurance_pv_usd=fin_cfg_base.insurance_pv_usd * opex_mult,
-            insurance_bess_usd=fin_cfg_base.insurance_bess_usd * opex_mult,
-            other_opex_usd=fin_cfg_base.other_opex_usd * opex_mult,
-            land_lease_usd=fin_cfg_base.land_lease_usd,
-            leverage_ratio=fin_cfg_base.leverage_ratio,
-            debt_tenor_years=fin_cfg_base.debt_tenor_years,
-            interest_rate=fin_cfg_base.interest_rate,
-            discount_rate=fin_cfg_base.discount_rate,
-        )
-        
-        # Run financial model
-        revenue = config.base_revenue_per_mwh * revenue_mult
-        fin_results = run_financial_model(lifetime.yearly, revenue, fin_cfg)
-        
-        results.append(MonteCarloResult(
-            run_id=i,
-            revenue_mult=revenue_mult,
-            capex_mult=capex_mult,
-            opex_mult=opex_mult,
-            solar_mult=solar_mult,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
+    n = config.n_simulations
+
+    print(f"\n=== Running {n} Monte Carlo Simulations ===\n")
+
+    # Sample all multipliers up front (same draw order as one run at a time:
+    # revenue, capex, opex, solar per run) and clamp to reasonable bounds
+    draws = np.random.standard_normal((n, 4))
+    revenue_mult = config.revenue_uncertainty[0] + config.revenue_uncertainty[1] * draws[:, 0]
+    capex_mult = config.capex_uncertainty[0] + config.capex_uncertainty[1] * draws[:, 1]
+    opex_mult = config.opex_uncertainty[0] + config.opex_uncertainty[1] * draws[:, 2]
+    solar_mult = config.solar_gen_uncertainty[0] + config.solar_gen_uncertainty[1] * draws[:, 3]
+
+    revenue_mult = np.clip(revenue_mult, 0.5, 1.5)
+    capex_mult = np.clip(capex_mult, 0.7, 1.3)
+    opex_mult = np.clip(opex_mult, 0.6, 1.4)
+    solar_mult = np.clip(solar_mult, 0.8, 1.2)
+
+    # Lifetime solar generation per run (simulate_lifetime's SolarGen_MWh)
+    solar_gen_mwh = (config.base_solar_gen_mwh * solar_mult)[:, None] * np.asarray(degradation.pv_factor)[None, :]
+
+    # Apply multipliers to the financial config; every run shares the rest
+    fin_cfg = FinancialConfig(
+        land_lease_usd=fin_cfg_base.land_lease_usd,
+        leverage_ratio=fin_cfg_base.leverage_ratio,
+        debt_tenor_years=fin_cfg_base.debt_tenor_years,
+        interest_rate=fin_cfg_base.interest_rate,
+        discount_rate=fin_cfg_base.discount_rate,
+    )
+    params = {
+        name: getattr(fin_cfg_base, name) * capex_mult
+        for name in ("land_cost_usd", "bop_cost_usd", "pv_cost_usd", "bess_cost_usd")
+    }
+    params.update({
+        name: getattr(fin_cfg_base, name) * opex_mult
+        for name in ("om_pv_usd", "om_bess_usd", "insurance_pv_usd", "insurance_bess_usd", "other_opex_usd")
+    })
+
+    # Run all financial models at once
+    fin_results = run_financial_batch(
+        solar_gen_mwh, config.base_revenue_per_mwh * revenue_mult, fin_cfg, params
+    )
+
     elapsed = time.time() - start_time
-    print(f"\nCompleted {config.n_simulations} simulations in {elapsed:.1f}s")
-    
-    # Convert to DataFrame
-    df = pd.DataFrame([
-        {
-            "Run_ID": r.run_id,
-            "Revenue_Mult": r.revenue_mult,
-            "CAPEX_Mult": r.capex_mult,
-            "OPEX_Mult": r.opex_mult,
-            "Solar_Mult": r.solar_mult,
-            "Project_IRR": r.project_irr,
-            "Equity_IRR": r.equity_irr,
-            "NPV_USD": r.npv,
-            "Payback_Years": r.payback_years,
-        }
-        for r in results
-    ])
-    
-    return df
+    print(f"\nCompleted {n} simulations in {elapsed:.1f}s")
+    n_multiple = int(np.count_nonzero(fin_results.project_irr_multiple | fin_results.equity_irr_multiple))
+    if n_multiple:
+        print(f"  Note: {n_multiple} runs have multiple IRRs (the rate closest to zero is reported)")
+
+    return pd.DataFrame({
+        "Run_ID": np.arange(n),
+        "Revenue_Mult": revenue_mult,
+        "CAPEX_Mult": capex_mult,
+        "OPEX_Mult": opex_mult,
+        "Solar_Mult": solar_mult,
+        "Project_IRR": fin_results.project_irr,
+        "Equity_IRR": fin_results.equity_irr,
+        "NPV_USD": fin_results.npv,
+        "Payback_Years": fin_results.payback_years,
+    })
 
 
 def calculate_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
@@ -18,8 +18,9 @@ from excel_replica.run_pipeline import (
     load_calc_config,
     load_financial_config,
 )
-from excel_replica.model.financial import FinancialConfig, run_financial_model
+from excel_replica.model.financial import FinancialBatchResults, FinancialConfig, run_financial_batch
 from excel_replica.model.lifetime import load_degradation_from_excel, simulate_lifetime
+from excel_replica.utils.excel_reader import ExcelReader
 
 
 @dataclass
@@ -47,6 +48,40 @@ class SensitivityResult:
     payback_years: float
 
 
+# FinancialConfig fields the CAPEX/OPEX/rate sweeps take from the base config
+_CAPEX_FIELDS = ("land_cost_usd", "bop_cost_usd", "pv_cost_usd", "bess_cost_usd")
+_OPEX_FIELDS = ("om_pv_usd", "om_bess_usd", "insurance_pv_usd", "insurance_bess_usd", "other_opex_usd")
+_SWEEP_BASE_FIELDS = _CAPEX_FIELDS + _OPEX_FIELDS + (
+    "land_lease_usd", "leverage_ratio", "debt_tenor_years", "interest_rate", "discount_rate",
+)
+
+
+def _batch_rows(
+    parameter: str,
+    values,
+    batch: FinancialBatchResults,
+    rows: slice = slice(None),
+) -> List[SensitivityResult]:
+    """SensitivityResult rows for a slice of a batched run."""
+    return [
+        SensitivityResult(
+            parameter=parameter,
+            value=value,
+            project_irr=float(project_irr),
+            equity_irr=float(equity_irr),
+            npv=float(npv),
+            payback_years=float(payback),
+        )
+        for value, project_irr, equity_irr, npv, payback in zip(
+            values,
+            batch.project_irr[rows],
+            batch.equity_irr[rows],
+            batch.npv[rows],
+            batch.payback_years[rows],
+        )
+    ]
+
+
 def run_sensitivity_analysis(config: SensitivityConfig) -> pd.DataFrame:
     """Run sensitivity analysis on key parameters.
     
@@ -59,11 +94,12 @@ def run_sensitivity_analysis(config: SensitivityConfig) -> pd.DataFrame:
     results = []
     
     # Load base configuration
-    fin_cfg_base = load_financial_config(config.excel_path)
-    degradation = load_degradation_from_excel(config.excel_path)
+    with ExcelReader(config.excel_path) as reader:
+        fin_cfg_base = load_financial_config(reader)
+        degradation = load_degradation_from_excel(reader)
     
     # Run base pipeline to get Year 1 outputs
-    base_config = PipelineConfig(excel_path=config.excel_path, run_dppa=False)
+    base_config = PipelineConfig(excel_path=config.excel_path, run_dppa=False, keep_hourly=False)
     base_results = run_pipeline(base_config)
     
     year1_outputs = {
@@ -76,137 +112,44 @@ def run_sensitivity_analysis(config: SensitivityConfig) -> pd.DataFrame:
     lifetime = simulate_lifetime(year1_outputs, degradation)
     
     print("\n=== Running Sensitivity Analysis ===\n")
-    
+
     # 1. Revenue sensitivity
     print("Revenue sensitivity...")
-    for mult in config.revenue_range:
-        revenue = config.base_revenue_per_mwh * mult
-        fin_results = run_financial_model(lifetime.yearly, revenue, fin_cfg_base)
-        results.append(SensitivityResult(
-            parameter="Revenue",
-            value=mult,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
-    # 2. CAPEX sensitivity
-    print("CAPEX sensitivity...")
-    for mult in config.capex_range:
-        fin_cfg = FinancialConfig(
-            land_cost_usd=fin_cfg_base.land_cost_usd * mult,
-            bop_cost_usd=fin_cfg_base.bop_cost_usd * mult,
-            pv_cost_usd=fin_cfg_base.pv_cost_usd * mult,
-            bess_cost_usd=fin_cfg_base.bess_cost_usd * mult,
-            om_pv_usd=fin_cfg_base.om_pv_usd,
-            om_bess_usd=fin_cfg_base.om_bess_usd,
-            insurance_pv_usd=fin_cfg_base.insurance_pv_usd,
-            insurance_bess_usd=fin_cfg_base.insurance_bess_usd,
-            other_opex_usd=fin_cfg_base.other_opex_usd,
-            land_lease_usd=fin_cfg_base.land_lease_usd,
-            leverage_ratio=fin_cfg_base.leverage_ratio,
-            debt_tenor_years=fin_cfg_base.debt_tenor_years,
-            interest_rate=fin_cfg_base.interest_rate,
-            discount_rate=fin_cfg_base.discount_rate,
-        )
-        fin_results = run_financial_model(lifetime.yearly, config.base_revenue_per_mwh, fin_cfg)
-        results.append(SensitivityResult(
-            parameter="CAPEX",
-            value=mult,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
-    # 3. OPEX sensitivity
-    print("OPEX sensitivity...")
-    for mult in config.opex_range:
-        fin_cfg = FinancialConfig(
-            land_cost_usd=fin_cfg_base.land_cost_usd,
-            bop_cost_usd=fin_cfg_base.bop_cost_usd,
-            pv_cost_usd=fin_cfg_base.pv_cost_usd,
-            bess_cost_usd=fin_cfg_base.bess_cost_usd,
-            om_pv_usd=fin_cfg_base.om_pv_usd * mult,
-            om_bess_usd=fin_cfg_base.om_bess_usd * mult,
-            insurance_pv_usd=fin_cfg_base.insurance_pv_usd * mult,
-            insurance_bess_usd=fin_cfg_base.insurance_bess_usd * mult,
-            other_opex_usd=fin_cfg_base.other_opex_usd * mult,
-            land_lease_usd=fin_cfg_base.land_lease_usd,
-            leverage_ratio=fin_cfg_base.leverage_ratio,
-            debt_tenor_years=fin_cfg_base.debt_tenor_years,
-            interest_rate=fin_cfg_base.interest_rate,
-            discount_rate=fin_cfg_base.discount_rate,
-        )
-        fin_results = run_financial_model(lifetime.yearly, config.base_revenue_per_mwh, fin_cfg)
-        results.append(SensitivityResult(
-            parameter="OPEX",
-            value=mult,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
-    # 4. Interest rate sensitivity
-    print("Interest rate sensitivity...")
-    for rate in config.interest_rate_range:
-        fin_cfg = FinancialConfig(
-            land_cost_usd=fin_cfg_base.land_cost_usd,
-            bop_cost_usd=fin_cfg_base.bop_cost_usd,
-            pv_cost_usd=fin_cfg_base.pv_cost_usd,
-            bess_cost_usd=fin_cfg_base.bess_cost_usd,
-            om_pv_usd=fin_cfg_base.om_pv_usd,
-            om_bess_usd=fin_cfg_base.om_bess_usd,
-            insurance_pv_usd=fin_cfg_base.insurance_pv_usd,
-            insurance_bess_usd=fin_cfg_base.insurance_bess_usd,
-            other_opex_usd=fin_cfg_base.other_opex_usd,
-            land_lease_usd=fin_cfg_base.land_lease_usd,
-            leverage_ratio=fin_cfg_base.leverage_ratio,
-            debt_tenor_years=fin_cfg_base.debt_tenor_years,
-            interest_rate=rate,
-            discount_rate=fin_cfg_base.discount_rate,
-        )
-        fin_results = run_financial_model(lifetime.yearly, config.base_revenue_per_mwh, fin_cfg)
-        results.append(SensitivityResult(
-            parameter="Interest_Rate",
-            value=rate,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
-    # 5. Discount rate sensitivity
-    print("Discount rate sensitivity...")
-    for rate in config.discount_rate_range:
-        fin_cfg = FinancialConfig(
-            land_cost_usd=fin_cfg_base.land_cost_usd,
-            bop_cost_usd=fin_cfg_base.bop_cost_usd,
-            pv_cost_usd=fin_cfg_base.pv_cost_usd,
-            bess_cost_usd=fin_cfg_base.bess_cost_usd,
-            om_pv_usd=fin_cfg_base.om_pv_usd,
-            om_bess_usd=fin_cfg_base.om_bess_usd,
-            insurance_pv_usd=fin_cfg_base.insurance_pv_usd,
-            insurance_bess_usd=fin_cfg_base.insurance_bess_usd,
-            other_opex_usd=fin_cfg_base.other_opex_usd,
-            land_lease_usd=fin_cfg_base.land_lease_usd,
-            leverage_ratio=fin_cfg_base.leverage_ratio,
-            debt_tenor_years=fin_cfg_base.debt_tenor_years,
-            interest_rate=fin_cfg_base.interest_rate,
-            discount_rate=rate,
-        )
-        fin_results = run_financial_model(lifetime.yearly, config.base_revenue_per_mwh, fin_cfg)
-        results.append(SensitivityResult(
-            parameter="Discount_Rate",
-            value=rate,
-            project_irr=fin_results.project_irr,
-            equity_irr=fin_results.equity_irr,
-            npv=fin_results.npv,
-            payback_years=fin_results.payback_years,
-        ))
-    
+    revenue_mults = np.asarray(config.revenue_range, dtype=np.float64)
+    batch = run_financial_batch(
+        lifetime.yearly, config.base_revenue_per_mwh * revenue_mults, fin_cfg_base
+    )
+    results.extend(_batch_rows("Revenue", revenue_mults, batch))
+
+    # 2-5. CAPEX, OPEX, interest and discount rate sensitivity, one batch on
+    # the core config (remaining fields at their defaults)
+    print("CAPEX, OPEX, interest rate and discount rate sensitivity...")
+    fin_cfg = FinancialConfig(**{name: getattr(fin_cfg_base, name) for name in _SWEEP_BASE_FIELDS})
+    sweeps = [
+        ("CAPEX", config.capex_range),
+        ("OPEX", config.opex_range),
+        ("Interest_Rate", config.interest_rate_range),
+        ("Discount_Rate", config.discount_rate_range),
+    ]
+    params = {name: [] for name in _CAPEX_FIELDS + _OPEX_FIELDS + ("interest_rate", "discount_rate")}
+    for parameter, values in sweeps:
+        for value in values:
+            capex_mult = value if parameter == "CAPEX" else 1.0
+            opex_mult = value if parameter == "OPEX" else 1.0
+            for name in _CAPEX_FIELDS:
+                params[name].append(getattr(fin_cfg_base, name) * capex_mult)
+            for name in _OPEX_FIELDS:
+                params[name].append(getattr(fin_cfg_base, name) * opex_mult)
+            params["interest_rate"].append(value if parameter == "Interest_Rate" else fin_cfg_base.interest_rate)
+            params["discount_rate"].append(value if parameter == "Discount_Rate" else fin_cfg_base.discount_rate)
+    if params["interest_rate"]:
+        batch = run_financial_batch(lifetime.yearly, config.base_revenue_per_mwh, fin_cfg, params)
+        offset = 0
+        for parameter, values in sweeps:
+            rows = slice(offset, offset + len(values))
+            results.extend(_batch_rows(parameter, values, batch, rows))
+            offset += len(values)
+
     # Convert to DataFrame
     df = pd.DataFrame([
         {
@@ -7,19 +7,24 @@ Generates charts for:
 - IRR probability curves
 """
 
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
-try:
+# matplotlib is imported by the first chart, not at module load
+HAS_MATPLOTLIB = importlib.util.find_spec("matplotlib") is not None
+if not HAS_MATPLOTLIB:
+    print("Warning: matplotlib not installed. Install with: pip install matplotlib")
+
+
+def _pyplot():
+    """Return (matplotlib.pyplot, matplotlib.ticker), importing them on first use."""
     import matplotlib.pyplot as plt
     import matplotlib.ticker as mticker
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib not installed. Install with: pip install matplotlib")
+    return plt, mticker
 
 
 def plot_tornado_chart(
@@ -37,6 +42,7 @@ def plot_tornado_chart(
     if not HAS_MATPLOTLIB:
         print("matplotlib required for visualization")
         return
+    plt, mticker = _pyplot()
     
     # Calculate ranges for each parameter
     tornado_data = []
@@ -111,6 +117,7 @@ def plot_monte_carlo_histogram(
     if not HAS_MATPLOTLIB:
         print("matplotlib required for visualization")
         return
+    plt, mticker = _pyplot()
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -164,6 +171,7 @@ def plot_cash_flow_waterfall(
     if not HAS_MATPLOTLIB:
         print("matplotlib required for visualization")
         return
+    plt, mticker = _pyplot()
     
     df = yearly_df.head(years_to_show)
     
@@ -210,6 +218,7 @@ def plot_irr_probability_curve(
     if not HAS_MATPLOTLIB:
         print("matplotlib required for visualization")
         return
+    plt, mticker = _pyplot()
     
     if hurdle_rates is None:
         hurdle_rates = [0.05, 0.08, 0.10]
@@ -1,21 +1,95 @@
 """Load assumption parameters and named ranges."""
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Union
 
-import pandas as pd
+from excel_replica.model.calc_engine import CalcConfig
+from excel_replica.model.financial import FinancialConfig
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
 
 
 @dataclass
 class AssumptionConfig:
     step_hours: float
     strategy_mode: int
-    bess_capacity_kwh: float
+    bess_capacity_kwh: float  # Total storage capacity (usable = total x DoD)
     bess_power_kw: float
     bess_efficiency: float
     min_reserve_soc_kwh: float
+    depth_of_discharge: float = 0.85
+    exchange_rate: float = 25455.0  # VND/USD
+    ca_normal_vnd: float = 1253.0  # TOU tariffs, VND/kWh
+    ca_peak_vnd: float = 2162.0
+    ca_offpeak_vnd: float = 843.0
 
+    def to_calc_config(self) -> CalcConfig:
+        """Calc engine configuration: usable capacity and USD/kWh tariffs."""
+        exchange_rate = float(self.exchange_rate)
+        return CalcConfig(
+            step_hours=float(self.step_hours),
+            bess_capacity_kwh=self.bess_capacity_kwh * self.depth_of_discharge,
+            bess_power_kw=self.bess_power_kw,
+            bess_efficiency=self.bess_efficiency,
+            min_soc_kwh=self.min_reserve_soc_kwh,
+            ca_peak=float(self.ca_peak_vnd) / exchange_rate,
+            ca_normal=float(self.ca_normal_vnd) / exchange_rate,
+            ca_offpeak=float(self.ca_offpeak_vnd) / exchange_rate,
+        )
 
-def load_assumptions(df: pd.DataFrame, named_ranges: Dict[str, str]) -> AssumptionConfig:
-    """Parse the Assumption sheet and named ranges into a config object."""
-    raise NotImplementedError("Implement Assumption parsing.")
+
+def load_assumptions(source: Union[Path, ExcelReader]) -> AssumptionConfig:
+    """Parse the Assumption sheet named ranges (path or open ExcelReader)."""
+    with reader_session(source) as reader:
+        return AssumptionConfig(
+            step_hours=float(reader.get_value("StepHours", 1.0)),
+            strategy_mode=int(reader.get_value("Strategy_mode", 1)),
+            bess_capacity_kwh=reader.get_value("Total_BESS_Storage_Capacity", 66000.0),
+            bess_power_kw=reader.get_value("Total_BESS_Power_Output", 20000.0),
+            bess_efficiency=reader.get_value("Charge_discharge_efficiency", 0.95),
+            min_reserve_soc_kwh=reader.get_value("Min_Reserve_SOC", 0.0),
+            depth_of_discharge=reader.get_value("DoD", 0.85),
+            exchange_rate=reader.get_value("Exchange_rate", 25455.0),
+            ca_normal_vnd=reader.get_value("Ca_normal", 1253.0),
+            ca_peak_vnd=reader.get_value("Ca_peak", 2162.0),
+            ca_offpeak_vnd=reader.get_value("Ca_offpeak", 843.0),
+        )
+
+
+def load_calc_config(source: Union[Path, ExcelReader]) -> CalcConfig:
+    """Load BESS and tariff configuration using named ranges (path or open ExcelReader)."""
+    return load_assumptions(source).to_calc_config()
+
+
+def load_financial_config(source: Union[Path, ExcelReader]) -> FinancialConfig:
+    """Load financial configuration using named ranges (path or open ExcelReader)."""
+    with reader_session(source) as reader:
+        solar_kwp = reader.get_value("Actual_installation_capacity", 40360.0)
+        solar_mwp = solar_kwp / 1000.0
+        bess_mwh = reader.get_value("Total_BESS_Storage_Capacity", 66000.0) / 1000.0
+
+        # Get debt parameters
+        base_rate = reader.get_value("Debt_Base_Rate", 0.02)
+        margin = reader.get_value("Debt_Margin", 0.065)
+        interest_rate = base_rate + margin
+
+        debt_size = reader.get_value("Final_Debt_Size", 24_584_997)
+        total_capex = reader.get_value("Total_CAPEX", 49_513_200)
+        leverage_ratio = debt_size / total_capex
+
+        return FinancialConfig(
+            land_cost_usd=reader.get_value("Land_acquisition", 1_200_000),
+            bop_cost_usd=4_843_200, # Handled as fixed in Excel
+            pv_cost_usd=solar_mwp * 750_000,
+            bess_cost_usd=bess_mwh * 200_000,
+            om_pv_usd=242_160,
+            om_bess_usd=132_000,
+            insurance_pv_usd=75_675,
+            insurance_bess_usd=33_000,
+            other_opex_usd=161_440,
+            land_lease_usd=0,
+            leverage_ratio=leverage_ratio,
+            debt_tenor_years=10,  # Excel uses 10-year debt tenor
+            interest_rate=interest_rate,
+            discount_rate=0.10,
+        )
@@ -1,10 +1,13 @@
 """Load and normalize the Data Input sheet."""
 
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Union
 
 import pandas as pd
 
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
+
 
 @dataclass
 class DataInput:
@@ -13,6 +16,17 @@ class DataInput:
     load_kw: pd.Series
 
 
-def load_data_input(df: pd.DataFrame) -> DataInput:
-    """Extract the hourly solar and load profiles from the Data Input sheet."""
-    raise NotImplementedError("Implement Data Input parsing.")
+def load_data_input(source: Union[Path, ExcelReader], sheet_name: str = "Calc") -> DataInput:
+    """Extract the hourly solar and load profiles (path or open ExcelReader).
+
+    The Calc sheet carries the Data Input profiles already aligned to the
+    simulation timeline (DateTime, SolarGen_kW, Load_kW), so it is the
+    default source.
+    """
+    with reader_session(source) as reader:
+        df = reader.get_df(sheet_name)
+    return DataInput(
+        datetime=pd.to_datetime(df["DateTime"]),
+        solar_profile_kw=df["SolarGen_kW"].astype(float),
+        load_kw=df["Load_kW"].astype(float),
+    )
@@ -1,10 +1,28 @@
 """Load PV/BESS degradation factors from Loss sheet."""
 
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Union
 
-import pandas as pd
+import numpy as np
 
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
 
-def load_loss_factors(df: pd.DataFrame) -> Dict[str, List[float]]:
-    """Return PV/BESS degradation arrays."""
-    raise NotImplementedError("Implement Loss factor parsing.")
+
+# Loss sheet columns: Year, Battery Loss, Battery, PV Loss, PV, Battery wt Replacement.
+# Years 1-25 are on rows 3-27; PV is column E, BESS with augmentation column F.
+LOSS_FACTOR_RANGE = "Loss!$E$3:$F$27"
+
+
+def load_loss_factors(source: Union[Path, ExcelReader]) -> Dict[str, np.ndarray]:
+    """Return PV/BESS degradation arrays (path or open ExcelReader).
+
+    Returns:
+        Dict with `pv_factor` and `bess_factor` (25 values each). Blank or
+        non-numeric cells default to 1.0 (no degradation).
+    """
+    with reader_session(source) as reader:
+        block = reader.get_range(LOSS_FACTOR_RANGE, fill=1.0)
+    return {
+        "pv_factor": np.ascontiguousarray(block[:, 0]),
+        "bess_factor": np.ascontiguousarray(block[:, 1]),
+    }
@@ -1,10 +1,27 @@
 """Load Other Input sheet parameters and flags."""
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Union
 
-import pandas as pd
+from excel_replica.utils.excel_reader import ExcelReader, parse_cell_address, reader_session
 
 
-def load_other_inputs(df: pd.DataFrame) -> Dict[str, float]:
-    """Extract optional parameters used by strategy/financial calculations."""
-    raise NotImplementedError("Implement Other Input parsing.")
+OTHER_INPUT_SHEET = "Other Input"
+
+
+def load_other_inputs(source: Union[Path, ExcelReader]) -> Dict[str, float]:
+    """Extract the named Other Input cells (retail tariffs by voltage level).
+
+    Returns:
+        Dict of named range -> value (e.g. "Peak_22"); blank cells are omitted.
+    """
+    with reader_session(source) as reader:
+        values = {}
+        for name, address in reader.named_ranges.items():
+            cell = parse_cell_address(address)
+            if cell is None or cell[0] != OTHER_INPUT_SHEET:
+                continue
+            val = reader.get_value(name)
+            if val is not None:
+                values[name] = val
+        return values
@@ -0,0 +1,183 @@
+"""Columnar hourly profile bundles.
+
+The hourly profiles (DateTime, SolarGen_kW, Load_kW, TimePeriodFlag,
+DischargeConditionFlag) are read from the Calc sheet on every run. Parsing
+8,760+ xlsx rows costs far more than a dispatch run, so `import_profiles`
+converts them once to a directory of typed `.npy` arrays, one per column:
+
+    profiles/
+        manifest.json          source workbook, content hash, rows, dtypes
+        datetime.npy           datetime64[ns]
+        solar_kw.npy           float64
+        load_kw.npy            float64
+        period_flags.npy       fixed-width unicode ('P', 'N', 'O')
+        allow_discharge.npy    bool
+
+`load_profiles` memory-maps the arrays (no parse, no copy), so a run starts
+in milliseconds and worker processes loading the same bundle share the
+page cache instead of each holding a copy.
+
+Usage:
+    python -m excel_replica.inputs.profiles model.xlsx profiles/
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from excel_replica.utils.excel_cache import atomic_write, file_sha256
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
+
+
+BUNDLE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Arrays in a bundle, one <name>.npy each (HourlyProfiles field names)
+PROFILE_COLUMNS = ("datetime", "solar_kw", "load_kw", "period_flags", "allow_discharge")
+
+
+@dataclass
+class HourlyProfiles:
+    """Hourly dispatch inputs as typed arrays (memory-mapped when loaded from a bundle)."""
+    datetime: np.ndarray  # datetime64[ns]
+    solar_kw: np.ndarray
+    load_kw: np.ndarray
+    period_flags: np.ndarray  # 'P' / 'N' / 'O'
+    allow_discharge: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.load_kw)
+
+    @property
+    def datetime_series(self) -> pd.Series:
+        """Timestamps as a pandas Series, as `run_calc` expects."""
+        return pd.Series(self.datetime)
+
+
+def profiles_from_frame(calc_df: pd.DataFrame) -> HourlyProfiles:
+    """Extract typed profile arrays from a Calc sheet DataFrame.
+
+    Without a DischargeConditionFlag column, discharge is allowed in peak
+    and normal periods.
+    """
+    period_flags = calc_df["TimePeriodFlag"].astype(str).str.upper().to_numpy(dtype=str)
+
+    if "DischargeConditionFlag" in calc_df.columns:
+        allow_discharge = calc_df["DischargeConditionFlag"].astype(bool).to_numpy()
+    else:
+        allow_discharge = np.isin(period_flags, ["P", "N"])
+
+    return HourlyProfiles(
+        datetime=pd.to_datetime(calc_df["DateTime"]).to_numpy(dtype="datetime64[ns]"),
+        solar_kw=calc_df["SolarGen_kW"].astype(float).to_numpy(),
+        load_kw=calc_df["Load_kW"].astype(float).to_numpy(),
+        period_flags=period_flags,
+        allow_discharge=allow_discharge,
+    )
+
+
+def load_profiles_from_excel(source: Union[Path, ExcelReader], sheet_name: str = "Calc") -> HourlyProfiles:
+    """Read the hourly profiles from a workbook (path or open ExcelReader)."""
+    with reader_session(source) as reader:
+        return profiles_from_frame(reader.get_df(sheet_name))
+
+
+def _save_array(path: str, array: np.ndarray) -> None:
+    # Write through a handle: np.save would append ".npy" to the temp name
+    with open(path, "wb") as f:
+        np.save(f, np.ascontiguousarray(array))
+
+
+def save_profiles(profiles: HourlyProfiles, bundle_dir: Path, source: Optional[Path] = None) -> Path:
+    """Write profiles as a .npy bundle; returns the manifest path.
+
+    Each array is written atomically and the manifest last, so a reader
+    never sees a half-written bundle.
+    """
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    for name in PROFILE_COLUMNS:
+        atomic_write(bundle_dir / f"{name}.npy", lambda tmp, name=name: _save_array(tmp, getattr(profiles, name)))
+
+    manifest = {
+        "version": BUNDLE_VERSION,
+        "rows": len(profiles),
+        "columns": {name: str(np.asarray(getattr(profiles, name)).dtype) for name in PROFILE_COLUMNS},
+    }
+    if source is not None:
+        manifest["source"] = str(Path(source).resolve())
+        manifest["source_sha256"] = file_sha256(Path(source))
+
+    manifest_path = bundle_dir / MANIFEST_NAME
+    atomic_write(manifest_path, lambda tmp: Path(tmp).write_text(json.dumps(manifest, indent=1)))
+    return manifest_path
+
+
+def import_profiles(excel_path: Path, bundle_dir: Path, sheet_name: str = "Calc") -> HourlyProfiles:
+    """Convert a workbook's hourly profiles to a .npy bundle (one-time import)."""
+    profiles = load_profiles_from_excel(Path(excel_path), sheet_name)
+    save_profiles(profiles, bundle_dir, source=excel_path)
+    return profiles
+
+
+def read_manifest(bundle_dir: Path) -> dict:
+    """Return a bundle's manifest; raises FileNotFoundError if it is not a bundle."""
+    manifest = json.loads((Path(bundle_dir) / MANIFEST_NAME).read_text())
+    if manifest.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported profile bundle version: {manifest.get('version')}")
+    return manifest
+
+
+def is_stale(bundle_dir: Path, excel_path: Path) -> bool:
+    """True if the bundle was not imported from the current contents of `excel_path`."""
+    try:
+        manifest = read_manifest(bundle_dir)
+    except (OSError, ValueError):
+        return True
+    return manifest.get("source_sha256") != file_sha256(Path(excel_path))
+
+
+def load_profiles(bundle_dir: Path, mmap_mode: Optional[str] = "r") -> HourlyProfiles:
+    """Load a .npy profile bundle.
+
+    Args:
+        bundle_dir: Directory written by `import_profiles`.
+        mmap_mode: `np.load` memory-map mode; "r" (default) maps read-only
+            pages shared between processes, None reads into memory.
+
+    Returns:
+        HourlyProfiles backed by the bundle's files.
+    """
+    bundle_dir = Path(bundle_dir)
+    manifest = read_manifest(bundle_dir)
+    arrays = {name: np.load(bundle_dir / f"{name}.npy", mmap_mode=mmap_mode) for name in PROFILE_COLUMNS}
+
+    rows = manifest["rows"]
+    for name, array in arrays.items():
+        if len(array) != rows:
+            raise ValueError(f"Profile bundle column {name} has {len(array)} rows, manifest says {rows}")
+
+    return HourlyProfiles(**arrays)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point: import a workbook's hourly profiles."""
+    parser = argparse.ArgumentParser(description="Import hourly profiles to a memory-mappable .npy bundle.")
+    parser.add_argument("excel_path", type=Path, help="Source workbook")
+    parser.add_argument("bundle_dir", type=Path, help="Output bundle directory")
+    parser.add_argument("--sheet", default="Calc", help="Sheet holding the hourly profiles (default: Calc)")
+    args = parser.parse_args(argv)
+
+    profiles = import_profiles(args.excel_path, args.bundle_dir, args.sheet)
+    print(f"Imported {len(profiles)} rows from {args.excel_path} to {args.bundle_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""One-shot loading of every model input into an immutable bundle.
+
+`load_project_inputs` opens the workbook once, runs every loader
+(Assumption, Loss, Financial, DPPA, hourly profiles) and returns a frozen,
+picklable `ProjectInputs` of NumPy arrays, config dataclasses and scalars.
+Build it once and hand it to `run_pipeline(config, inputs=...)` or to
+worker processes, instead of every run reopening the xlsx.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from excel_replica.inputs.assumptions import load_calc_config, load_financial_config
+from excel_replica.inputs.loss_factors import LOSS_FACTOR_RANGE
+from excel_replica.inputs.profiles import HourlyProfiles, is_stale, load_profiles, load_profiles_from_excel
+from excel_replica.model.calc_engine import CalcConfig
+from excel_replica.model.dppa import DPPAConfig, load_dppa_config_from_excel
+from excel_replica.model.financial import (
+    DATES_RANGE,
+    EBITDA_RANGE,
+    NET_FCFE_RANGE,
+    FinancialConfig,
+    load_excel_dates,
+    load_excel_ebitda,
+    load_excel_net_fcfe,
+)
+from excel_replica.model.lifetime import DegradationSchedule, load_degradation_from_excel
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
+from excel_replica.utils.time_utils import infer_step_hours
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Read-only view of an array (the array itself is left untouched)."""
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+    return view
+
+
+@dataclass(frozen=True)
+class ProjectInputs:
+    """Every input of a model run, loaded once.
+
+    The bundle is frozen and its arrays are read-only. The config
+    dataclasses are private copies; derive variants with
+    `dataclasses.replace` rather than mutating them.
+    """
+    calc: CalcConfig  # step_hours matches the profile timestamps
+    financial: FinancialConfig
+    degradation: DegradationSchedule
+    profiles: HourlyProfiles
+    dppa: Optional[DPPAConfig] = None
+    excel_ebitda: Optional[Tuple[float, ...]] = None
+    excel_net_fcfe: Optional[Tuple[float, ...]] = None
+    excel_dates: Optional[Tuple[Optional[pd.Timestamp], ...]] = None
+    source: str = ""
+
+    def __post_init__(self):
+        # Copy the configs so callers keep no handle to the bundle's state
+        for name in ("calc", "financial", "dppa"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, dataclasses.replace(value))
+        object.__setattr__(self, "degradation", DegradationSchedule(
+            pv_factor=_read_only(self.degradation.pv_factor),
+            bess_factor=_read_only(self.degradation.bess_factor),
+        ))
+        object.__setattr__(self, "profiles", HourlyProfiles(**{
+            field.name: _read_only(getattr(self.profiles, field.name))
+            for field in dataclasses.fields(HourlyProfiles)
+        }))
+        for name in ("excel_ebitda", "excel_net_fcfe", "excel_dates"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, tuple(value))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled arrays are read-only again
+        return self.__class__, tuple(getattr(self, field.name) for field in dataclasses.fields(self))
+
+
+def load_project_inputs(
+    source: Union[Path, ExcelReader],
+    profiles_path: Optional[Path] = None,
+    include_dppa: bool = True,
+    include_excel_financials: bool = True,
+    max_workers: Optional[int] = None,
+) -> ProjectInputs:
+    """Load all model inputs from a workbook (path or open ExcelReader).
+
+    Args:
+        source: Workbook path or open ExcelReader.
+        profiles_path: Optional .npy bundle from `excel_replica.inputs.profiles`;
+            used instead of parsing the Calc sheet. Raises ValueError if it
+            was not imported from the workbook's current contents.
+        include_dppa: Load the DPPA configuration.
+        include_excel_financials: Load the Excel EBITDA, Net FCFE and date
+            rows used for exact-match financial runs.
+        max_workers: Processes used to read the sheets concurrently
+            (default: one per sheet); 1 reads them one after another.
+
+    Returns:
+        ProjectInputs. Its calc step size is inferred from the profile
+        timestamps (sub-hourly profiles set the step).
+    """
+    with reader_session(source) as reader:
+        # Read every sheet's inputs in parallel up front; the loaders below
+        # then hit the session's memory cache
+        ranges = [LOSS_FACTOR_RANGE]
+        if include_excel_financials:
+            ranges += [EBITDA_RANGE, NET_FCFE_RANGE, DATES_RANGE]
+        reader.preload(
+            frames=["Calc"] if profiles_path is None else [],
+            ranges=ranges,
+            max_workers=max_workers,
+        )
+
+        if profiles_path is not None:
+            if is_stale(profiles_path, reader.excel_path):
+                raise ValueError(
+                    f"Profile bundle {profiles_path} is stale for {reader.excel_path}; "
+                    "re-run `python -m excel_replica.inputs.profiles` to re-import it"
+                )
+            profiles = load_profiles(profiles_path)
+        else:
+            profiles = load_profiles_from_excel(reader)
+
+        calc_cfg = load_calc_config(reader)
+        calc_cfg.step_hours = infer_step_hours(profiles.datetime_series, default=calc_cfg.step_hours)
+
+        extra = {}
+        if include_dppa:
+            extra["dppa"] = load_dppa_config_from_excel(reader)
+        if include_excel_financials:
+            extra["excel_ebitda"] = load_excel_ebitda(reader)
+            extra["excel_net_fcfe"] = load_excel_net_fcfe(reader)
+            extra["excel_dates"] = load_excel_dates(reader)
+
+        return ProjectInputs(
+            calc=calc_cfg,
+            financial=load_financial_config(reader),
+            degradation=load_degradation_from_excel(reader),
+            profiles=profiles,
+            source=str(reader.excel_path),
+            **extra,
+        )
@@ -8,12 +8,30 @@ Key columns:
 - TOU cost columns (Ca_peak, Ca_normal, Ca_offpeak)
 """
 
+import functools
+import importlib.util
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+# numba is imported on first use of the numba backend, not here: it costs
+# ~0.2 s of startup that runs on the Python backend never need
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+BACKENDS = ("auto", "python", "numba")
+
+# TOU period codes (int8) used to index the tariff table
+TOU_NORMAL = 0
+TOU_PEAK = 1
+TOU_OFFPEAK = 2
+TOU_PERIODS = ("normal", "peak", "offpeak")
+
+# Checkpoint row: SOC, six running totals, (4 x periods) running period totals
+CHECKPOINT_WIDTH = 7 + 4 * len(TOU_PERIODS)
+
 
 @dataclass
 class CalcConfig:
@@ -26,22 +44,475 @@ class CalcConfig:
     ca_peak: float = 0.0
     ca_normal: float = 0.0
     ca_offpeak: float = 0.0
+    reserve_soc_kwh: float = 0.0  # SOC held back from discharge
+    discharge_target_kw: float = 0.0  # Discharge only covers net load above this
+
+
+@dataclass
+class CalcState:
+    """Resumable SOC state at the end of a Calc run."""
+    steps: int  # Number of steps simulated
+    soc_kwh: float  # SOC after the last step (pass as initial_soc_kwh to resume)
+
+
+@dataclass
+class CalcCheckpoints:
+    """Periodic snapshots taken before every `every`-th step of a Calc run."""
+    every: int
+    soc_kwh: np.ndarray  # (n,) SOC before the checkpoint step
+    totals: np.ndarray  # (n, 6) running direct PV, charge, discharge, surplus, grid load, TOU cost
+    period_totals: np.ndarray  # (n, 4, periods) running per-period totals
 
 
 @dataclass
 class CalcResults:
-    """Results from Calc engine."""
-    hourly: pd.DataFrame
+    """Results from Calc engine (`hourly` is None for outputs-only runs)."""
+    hourly: Optional[pd.DataFrame]
     outputs: Dict[str, float] = field(default_factory=dict)
+    state: Optional[CalcState] = None
+    checkpoints: Optional[CalcCheckpoints] = None
+
+
+@dataclass
+class CalcBatchResults:
+    """Results from a batched Calc run (one value per scenario)."""
+    params: Dict[str, np.ndarray]
+    outputs: Dict[str, np.ndarray] = field(default_factory=dict)
 
 
-def _tou_tariff(period_flag: str, cfg: CalcConfig) -> float:
-    """Return tariff rate based on TOU period flag (P/N/O)."""
-    if period_flag == "P":
-        return cfg.ca_peak
-    elif period_flag == "O":
-        return cfg.ca_offpeak
-    return cfg.ca_normal
+def encode_tou_periods(period_flags: np.ndarray) -> np.ndarray:
+    """Encode TOU period flags ('P', 'N', 'O') as int8 period codes.
+
+    'P' maps to TOU_PEAK, 'O' to TOU_OFFPEAK and anything else to TOU_NORMAL,
+    matching the Calc sheet SWITCH. Integer input is taken as already encoded
+    and must be a valid code (0..len(TOU_PERIODS)-1); the numba kernels index
+    the tariff table with it unchecked.
+    """
+    flags = np.asarray(period_flags)
+    if np.issubdtype(flags.dtype, np.integer):
+        if np.any((flags < 0) | (flags >= len(TOU_PERIODS))):
+            raise ValueError(f"TOU period codes must be in 0..{len(TOU_PERIODS) - 1}")
+        return flags.astype(np.int8, copy=False)
+
+    codes = np.full(flags.shape, TOU_NORMAL, dtype=np.int8)
+    codes[flags == "P"] = TOU_PEAK
+    codes[flags == "O"] = TOU_OFFPEAK
+    return codes
+
+
+def tou_tariff_table(cfg: CalcConfig) -> np.ndarray:
+    """Return tariff rates indexed by TOU period code."""
+    table = np.zeros(len(TOU_PERIODS))
+    table[TOU_NORMAL] = cfg.ca_normal
+    table[TOU_PEAK] = cfg.ca_peak
+    table[TOU_OFFPEAK] = cfg.ca_offpeak
+    return table
+
+
+def _dispatch_loop(
+    solar_kw,
+    load_kw,
+    allow_discharge,
+    period_codes,
+    tariff_table,
+    capacity_kwh,
+    power_kw,
+    efficiency,
+    min_soc_kwh,
+    reserve_kwh,
+    target_kw,
+    step_hours,
+    store_hourly,
+    initial_soc,
+    checkpoint_every,
+    checkpoints,
+    period_totals,
+    direct_pv_kw,
+    charge_kwh,
+    discharge_kwh,
+    soc_kwh,
+    power_surplus_kw,
+    grid_load_kw,
+):
+    """Hourly SOC recursion shared by all backends.
+
+    Starting from `initial_soc`, returns the totals (direct PV, charge,
+    discharge, surplus, grid load, TOU cost) and the final SOC. Direct PV,
+    discharge, grid load and TOU cost are also accumulated per TOU period
+    into the flat `period_totals` (4 x periods).
+
+    Discharge is limited to net load above `target_kw` and to SOC above
+    `reserve_kwh`; with both at zero this is the Excel Calc rule, and the
+    dispatch strategies in `excel_replica.model.dispatch` set them.
+
+    When `store_hourly` is true the per-hour output sequences are filled in
+    place; otherwise they may be empty. When `checkpoint_every` > 0, a row of
+    CHECKPOINT_WIDTH values (SOC, the six totals, the period totals) is
+    written to the flat `checkpoints` before every `checkpoint_every`-th step.
+
+    The body only uses indexing, min/max and float arithmetic so the same
+    source runs as plain Python (on lists) and as a Numba kernel (on arrays)
+    with identical results.
+    """
+    n_periods = len(tariff_table)
+    current_soc = initial_soc
+    total_direct_pv = 0.0
+    total_charge = 0.0
+    total_discharge = 0.0
+    total_surplus = 0.0
+    total_grid_load = 0.0
+    total_tou_cost = 0.0
+
+    for h in range(len(load_kw)):
+        if checkpoint_every > 0 and h % checkpoint_every == 0:
+            row = (h // checkpoint_every) * (7 + 4 * n_periods)
+            checkpoints[row] = current_soc
+            checkpoints[row + 1] = total_direct_pv
+            checkpoints[row + 2] = total_charge
+            checkpoints[row + 3] = total_discharge
+            checkpoints[row + 4] = total_surplus
+            checkpoints[row + 5] = total_grid_load
+            checkpoints[row + 6] = total_tou_cost
+            for j in range(4 * n_periods):
+                checkpoints[row + 7 + j] = period_totals[j]
+
+        # Direct PV consumption = min(solar, load)
+        direct_pv = min(solar_kw[h], load_kw[h])
+
+        # Excess solar available for charging
+        excess_solar = max(solar_kw[h] - load_kw[h], 0.0)
+
+        # Charging logic
+        headroom = capacity_kwh - current_soc
+        max_charge = min(power_kw * step_hours, headroom / efficiency)
+        actual_charge = min(excess_solar * step_hours, max_charge)
+        current_soc += actual_charge * efficiency
+
+        # Discharging logic
+        actual_discharge = 0.0
+        net_load = load_kw[h] - solar_kw[h]
+        if allow_discharge[h] and net_load > target_kw and current_soc > min_soc_kwh:
+            # Excel uses SOC * eff for available, min_soc is only a threshold check
+            available_discharge = max(current_soc - reserve_kwh, 0.0) * efficiency
+            max_discharge = min(power_kw * step_hours, available_discharge)
+            actual_discharge = min((net_load - target_kw) * step_hours, max_discharge)
+            current_soc -= actual_discharge / efficiency
+
+        current_soc = max(0.0, min(current_soc, capacity_kwh))
+
+        # Power surplus (grid export)
+        consumed = direct_pv + actual_charge / step_hours
+        power_surplus = max(solar_kw[h] - consumed, 0.0)
+
+        # Grid load (import)
+        supplied = direct_pv + actual_discharge / step_hours
+        grid_load = max(load_kw[h] - supplied, 0.0)
+
+        # TOU cost
+        period = period_codes[h]
+        tou_cost = grid_load * step_hours * tariff_table[period]
+
+        if store_hourly:
+            direct_pv_kw[h] = direct_pv
+            charge_kwh[h] = actual_charge
+            discharge_kwh[h] = actual_discharge
+            soc_kwh[h] = current_soc
+            power_surplus_kw[h] = power_surplus
+            grid_load_kw[h] = grid_load
+
+        total_direct_pv += direct_pv
+        total_charge += actual_charge
+        total_discharge += actual_discharge
+        total_surplus += power_surplus
+        total_grid_load += grid_load
+        total_tou_cost += tou_cost
+
+        period_totals[period] += direct_pv
+        period_totals[n_periods + period] += actual_discharge
+        period_totals[2 * n_periods + period] += grid_load
+        period_totals[3 * n_periods + period] += tou_cost
+
+    return (
+        total_direct_pv,
+        total_charge,
+        total_discharge,
+        total_surplus,
+        total_grid_load,
+        total_tou_cost,
+        current_soc,
+    )
+
+
+def _dispatch_batch_loop(
+    solar_kw,
+    load_kw,
+    allow_discharge,
+    period_codes,
+    tariff_table,
+    capacity_kwh,
+    power_kw,
+    efficiency,
+    min_soc_kwh,
+    reserve_kwh,
+    target_kw,
+    step_hours,
+    totals,
+    period_totals,
+):
+    """Scenario-by-scenario version of the batch step, compiled with Numba.
+
+    Profiles are (hours, 1) when shared or (hours, N) when stacked. Totals are
+    accumulated into `totals` (6, N): direct PV, charge, discharge, surplus,
+    grid load and TOU cost, and into `period_totals` (4, periods, N): direct
+    PV, discharge, grid load and TOU cost per TOU period. Per-hour arithmetic
+    mirrors `_dispatch_loop`.
+    """
+    n = capacity_kwh.shape[0]
+    soc = np.zeros(n)
+
+    for h in range(solar_kw.shape[0]):
+        period = period_codes[h]
+        tariff = tariff_table[period]
+        for i in range(n):
+            solar = solar_kw[h, i if solar_kw.shape[1] > 1 else 0]
+            load = load_kw[h, i if load_kw.shape[1] > 1 else 0]
+            allow = allow_discharge[h, i if allow_discharge.shape[1] > 1 else 0]
+
+            direct_pv = min(solar, load)
+            excess_solar = max(solar - load, 0.0)
+
+            headroom = capacity_kwh[i] - soc[i]
+            max_charge = min(power_kw[i] * step_hours, headroom / efficiency[i])
+            charge = min(excess_solar * step_hours, max_charge)
+            current_soc = soc[i] + charge * efficiency[i]
+
+            discharge = 0.0
+            net_load = load - solar
+            if allow and net_load > target_kw and current_soc > min_soc_kwh[i]:
+                available_discharge = max(current_soc - reserve_kwh, 0.0) * efficiency[i]
+                max_discharge = min(power_kw[i] * step_hours, available_discharge)
+                discharge = min((net_load - target_kw) * step_hours, max_discharge)
+                current_soc -= discharge / efficiency[i]
+
+            soc[i] = max(0.0, min(current_soc, capacity_kwh[i]))
+
+            surplus = max(solar - (direct_pv + charge / step_hours), 0.0)
+            grid_load = max(load - (direct_pv + discharge / step_hours), 0.0)
+
+            tou_cost = grid_load * step_hours * tariff
+
+            totals[0, i] += direct_pv
+            totals[1, i] += charge
+            totals[2, i] += discharge
+            totals[3, i] += surplus
+            totals[4, i] += grid_load
+            totals[5, i] += tou_cost
+
+            period_totals[0, period, i] += direct_pv
+            period_totals[1, period, i] += discharge
+            period_totals[2, period, i] += grid_load
+            period_totals[3, period, i] += tou_cost
+
+
+def _dispatch_batch_numpy(
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    allow_discharge: np.ndarray,
+    period_codes: np.ndarray,
+    tariff_table: np.ndarray,
+    capacity_kwh: np.ndarray,
+    power_kw: np.ndarray,
+    efficiency: np.ndarray,
+    min_soc_kwh: np.ndarray,
+    reserve_kwh: float,
+    target_kw: float,
+    step_hours: float,
+    totals: np.ndarray,
+    period_totals: np.ndarray,
+) -> None:
+    """Vectorized batch step: one pass over time, (N,) state per hour."""
+    soc = np.zeros(capacity_kwh.shape[0])
+    max_power = power_kw * step_hours
+
+    for h in range(solar_kw.shape[0]):
+        solar = solar_kw[h]
+        load = load_kw[h]
+
+        direct_pv = np.minimum(solar, load)
+        excess_solar = np.maximum(solar - load, 0.0)
+
+        max_charge = np.minimum(max_power, (capacity_kwh - soc) / efficiency)
+        charge = np.minimum(excess_solar * step_hours, max_charge)
+        soc = soc + charge * efficiency
+
+        net_load = load - solar
+        can_discharge = allow_discharge[h] & (net_load > target_kw) & (soc > min_soc_kwh)
+        max_discharge = np.minimum(max_power, np.maximum(soc - reserve_kwh, 0.0) * efficiency)
+        discharge = np.where(can_discharge, np.minimum((net_load - target_kw) * step_hours, max_discharge), 0.0)
+        soc = np.where(can_discharge, soc - discharge / efficiency, soc)
+
+        soc = np.maximum(0.0, np.minimum(soc, capacity_kwh))
+
+        surplus = np.maximum(solar - (direct_pv + charge / step_hours), 0.0)
+        grid_load = np.maximum(load - (direct_pv + discharge / step_hours), 0.0)
+
+        period = period_codes[h]
+        tou_cost = grid_load * step_hours * tariff_table[period]
+
+        totals[0] += direct_pv
+        totals[1] += charge
+        totals[2] += discharge
+        totals[3] += surplus
+        totals[4] += grid_load
+        totals[5] += tou_cost
+
+        period_totals[0, period] += direct_pv
+        period_totals[1, period] += discharge
+        period_totals[2, period] += grid_load
+        period_totals[3, period] += tou_cost
+
+
+@functools.lru_cache(maxsize=None)
+def _jit(kernel: Callable) -> Callable:
+    """numba-compiled version of a kernel (compiled or loaded from numba's cache once)."""
+    import numba
+    return numba.njit(cache=True)(kernel)
+
+
+def _resolve_backend(backend: str) -> str:
+    """Map the requested backend name to the one that will actually run."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Expected one of {BACKENDS}.")
+    if backend == "auto":
+        return "numba" if HAS_NUMBA else "python"
+    if backend == "numba" and not HAS_NUMBA:
+        raise ImportError("backend='numba' requires numba. Install with: pip install numba")
+    return backend
+
+
+def _run_dispatch(
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    allow_discharge: np.ndarray,
+    period_codes: np.ndarray,
+    cfg: CalcConfig,
+    backend: str,
+    store_hourly: bool = True,
+    initial_soc: float = 0.0,
+    checkpoint_every: int = 0,
+) -> Tuple[List[np.ndarray], Tuple[float, ...], np.ndarray, np.ndarray]:
+    """Run the SOC recursion.
+
+    Returns the six per-hour output arrays (empty when `store_hourly` is
+    false), the running totals followed by the final SOC, the (4, periods)
+    per-period totals and the (checkpoints, CHECKPOINT_WIDTH) snapshot rows
+    (empty when `checkpoint_every` is 0).
+    """
+    tariff_table = tou_tariff_table(cfg)
+    hours = len(load_kw) if store_hourly else 0
+    n_checkpoints = -(-len(load_kw) // checkpoint_every) if checkpoint_every > 0 else 0
+    params = (
+        tariff_table,
+        float(cfg.bess_capacity_kwh),
+        float(cfg.bess_power_kw),
+        float(cfg.bess_efficiency),
+        float(cfg.min_soc_kwh),
+        float(cfg.reserve_soc_kwh),
+        float(cfg.discharge_target_kw),
+        float(cfg.step_hours),
+        store_hourly,
+        float(initial_soc),
+        int(checkpoint_every),
+    )
+    period_shape = (4, len(tariff_table))
+    checkpoint_shape = (n_checkpoints, CHECKPOINT_WIDTH)
+
+    if _resolve_backend(backend) == "numba":
+        arrays = [np.zeros(hours) for _ in range(6)]
+        checkpoints = np.zeros(n_checkpoints * CHECKPOINT_WIDTH)
+        period_totals = np.zeros(period_shape[0] * period_shape[1])
+        totals = _jit(_dispatch_loop)(
+            np.ascontiguousarray(solar_kw, dtype=np.float64),
+            np.ascontiguousarray(load_kw, dtype=np.float64),
+            np.ascontiguousarray(allow_discharge, dtype=np.bool_),
+            np.ascontiguousarray(period_codes, dtype=np.int8),
+            *params,
+            checkpoints,
+            period_totals,
+            *arrays,
+        )
+        return (
+            arrays,
+            totals,
+            period_totals.reshape(period_shape),
+            checkpoints.reshape(checkpoint_shape),
+        )
+
+    # Python floats are much cheaper to index than NumPy scalars and use the
+    # same IEEE double arithmetic, so the fallback loops over lists.
+    lists = [[0.0] * hours for _ in range(6)]
+    checkpoints = [0.0] * (n_checkpoints * CHECKPOINT_WIDTH)
+    period_totals = [0.0] * (period_shape[0] * period_shape[1])
+    totals = _dispatch_loop(
+        np.asarray(solar_kw, dtype=np.float64).tolist(),
+        np.asarray(load_kw, dtype=np.float64).tolist(),
+        np.asarray(allow_discharge, dtype=bool).tolist(),
+        np.asarray(period_codes, dtype=np.int8).tolist(),
+        tariff_table.tolist(),
+        *params[1:],
+        checkpoints,
+        period_totals,
+        *lists,
+    )
+    return (
+        [np.array(values) for values in lists],
+        totals,
+        np.array(period_totals).reshape(period_shape),
+        np.array(checkpoints).reshape(checkpoint_shape),
+    )
+
+
+def _unpack_checkpoints(rows: np.ndarray, every: int) -> CalcCheckpoints:
+    """Split flat (n, CHECKPOINT_WIDTH) snapshot rows into CalcCheckpoints."""
+    return CalcCheckpoints(
+        every=every,
+        soc_kwh=rows[:, 0].copy(),
+        totals=rows[:, 1:7].copy(),
+        period_totals=rows[:, 7:].reshape(len(rows), 4, len(TOU_PERIODS)).copy(),
+    )
+
+
+def _totals_outputs(
+    solar_gen_mwh: float,
+    totals: np.ndarray,
+    period_totals: np.ndarray,
+    step_hours: float,
+) -> Dict[str, float]:
+    """Convert the six loop-accumulated totals into named outputs."""
+    direct_pv, charge, discharge, surplus, grid_load, tou_cost = totals
+    outputs = {
+        "solar_gen_mwh": solar_gen_mwh,
+        "direct_pv_mwh": direct_pv * step_hours / 1000,
+        "charge_mwh": charge / 1000,
+        "discharge_mwh": discharge / 1000,
+        "power_surplus_mwh": surplus * step_hours / 1000,
+        "grid_load_mwh": grid_load * step_hours / 1000,
+        "total_tou_cost": tou_cost,
+    }
+    outputs.update(_period_outputs(period_totals, step_hours))
+    return outputs
+
+
+def _period_outputs(period_totals: np.ndarray, step_hours: float) -> Dict[str, float]:
+    """Name the (4, periods) per-period totals as MWh and cost outputs."""
+    direct_pv, discharge, grid_load, tou_cost = period_totals
+    outputs = {}
+    for code, period in enumerate(TOU_PERIODS):
+        outputs[f"direct_pv_{period}_mwh"] = direct_pv[code] * step_hours / 1000
+        outputs[f"discharge_{period}_mwh"] = discharge[code] / 1000
+        outputs[f"grid_load_{period}_mwh"] = grid_load[code] * step_hours / 1000
+        outputs[f"tou_cost_{period}"] = tou_cost[code]
+    return outputs
 
 
 def run_calc(
@@ -51,75 +522,374 @@ def run_calc(
     period_flags: np.ndarray,
     allow_discharge: np.ndarray,
     cfg: CalcConfig,
+    backend: str = "auto",
+    outputs_only: bool = False,
+    dtype: Optional[np.dtype] = None,
+    initial_soc_kwh: float = 0.0,
+    checkpoint_every: Optional[int] = None,
 ) -> CalcResults:
     """Run the hourly Calc formulas and return results.
 
     Args:
-        datetime_series: Hourly datetime index.
-        solar_kw: Hourly solar generation (kW).
-        load_kw: Hourly load demand (kW).
-        period_flags: TOU period flags ('P', 'N', 'O').
+        datetime_series: Timestamp per step (hourly or sub-hourly; the step
+            length comes from `cfg.step_hours`).
+        solar_kw: Solar generation per step (kW).
+        load_kw: Load demand per step (kW).
+        period_flags: TOU period flags ('P', 'N', 'O') or int8 period codes
+            from `encode_tou_periods`.
         allow_discharge: Boolean array for discharge permission.
         cfg: CalcConfig with BESS and tariff parameters.
+        backend: SOC loop backend: 'python', 'numba' (requires numba) or
+            'auto' (numba when installed). All backends give identical results.
+        outputs_only: If True, accumulate the totals inside the SOC loop and
+            skip the per-hour arrays and DataFrame (`hourly` is None). Totals
+            match the full run up to floating-point summation order.
+        dtype: Storage dtype for the hourly float columns (e.g. np.float32 to
+            halve memory on sub-hourly runs). The SOC loop always runs in
+            float64.
+        initial_soc_kwh: SOC before the first step, e.g. `state.soc_kwh` of
+            a previous run to continue it.
+        checkpoint_every: Snapshot the SOC and running totals before every
+            N-th step so `rerun_calc_from` can re-dispatch from an edited
+            step without replaying the prefix.
 
     Returns:
-        CalcResults with hourly DataFrame and aggregated outputs.
+        CalcResults with hourly DataFrame, aggregated outputs, the final
+        CalcState and (if requested) CalcCheckpoints.
     """
-    hours = len(load_kw)
+    if checkpoint_every is not None and checkpoint_every <= 0:
+        raise ValueError("checkpoint_every must be positive")
 
-    # Output arrays
-    direct_pv_kw = np.zeros(hours)
-    charge_kwh = np.zeros(hours)
-    discharge_kwh = np.zeros(hours)
-    soc_kwh = np.zeros(hours)
-    power_surplus_kw = np.zeros(hours)
-    grid_load_kw = np.zeros(hours)
-    tou_cost = np.zeros(hours)
+    results, _ = _calc_segment(
+        datetime_series, solar_kw, load_kw, period_flags, allow_discharge, cfg,
+        backend, outputs_only, dtype,
+        initial_soc=initial_soc_kwh,
+        checkpoint_every=checkpoint_every or 0,
+    )
+    return results
 
-    current_soc = 0.0
 
-    for h in range(hours):
-        # Direct PV consumption = min(solar, load)
-        direct_pv_kw[h] = min(solar_kw[h], load_kw[h])
+def rerun_calc_from(
+    previous: CalcResults,
+    start_step: int,
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    backend: str = "auto",
+) -> CalcResults:
+    """Re-dispatch a checkpointed run after inputs change from `start_step`.
 
-        # Excess solar available for charging
-        excess_solar = max(solar_kw[h] - load_kw[h], 0.0)
+    Inputs before `start_step` must be unchanged from the run that produced
+    `previous` (same BESS config and tariffs). Dispatch resumes from the last
+    checkpoint at or before `start_step`; the prefix hourly rows and running
+    totals are reused, so editing late in the year costs only the remaining
+    steps. Results match a fresh checkpointed `run_calc` on the edited inputs
+    (outputs up to floating-point summation order).
 
-        # Charging logic
-        headroom = cfg.bess_capacity_kwh - current_soc
-        max_charge = min(cfg.bess_power_kw * cfg.step_hours, headroom / cfg.bess_efficiency)
-        actual_charge = min(excess_solar * cfg.step_hours, max_charge)
-        charge_kwh[h] = actual_charge
-        current_soc += actual_charge * cfg.bess_efficiency
+    Args:
+        previous: Results of `run_calc(..., checkpoint_every=...)`.
+        start_step: First step whose inputs changed.
+        datetime_series, solar_kw, load_kw, period_flags, allow_discharge,
+            cfg: Full-length edited inputs, as passed to `run_calc`.
+        backend: SOC loop backend ('python', 'numba' or 'auto').
 
-        # Discharging logic
-        net_load = load_kw[h] - solar_kw[h]
-        if allow_discharge[h] and net_load > 0 and current_soc > cfg.min_soc_kwh:
-            # Excel uses SOC * eff for available, min_soc is only a threshold check
-            available_discharge = current_soc * cfg.bess_efficiency
-            max_discharge = min(cfg.bess_power_kw * cfg.step_hours, available_discharge)
-            actual_discharge = min(net_load * cfg.step_hours, max_discharge)
-            discharge_kwh[h] = actual_discharge
-            current_soc -= actual_discharge / cfg.bess_efficiency
+    Returns:
+        CalcResults in the same mode (full or outputs-only) as `previous`,
+        with refreshed state and checkpoints.
+    """
+    checkpoints = previous.checkpoints
+    if checkpoints is None or previous.state is None:
+        raise ValueError("rerun_calc_from requires a run_calc result with checkpoint_every set")
+    if not 0 <= start_step <= previous.state.steps:
+        raise ValueError(f"start_step {start_step} outside 0..{previous.state.steps}")
 
-        current_soc = max(0.0, min(current_soc, cfg.bess_capacity_kwh))
-        soc_kwh[h] = current_soc
+    every = checkpoints.every
+    index = min(start_step // every, len(checkpoints.soc_kwh) - 1)
+    resume = index * every
+    outputs_only = previous.hourly is None
 
-        # Power surplus (grid export)
-        consumed = direct_pv_kw[h] + charge_kwh[h] / cfg.step_hours
-        power_surplus_kw[h] = max(solar_kw[h] - consumed, 0.0)
+    period_codes = encode_tou_periods(period_flags)
+    hourly_arrays, totals, period_totals, rows = _run_dispatch(
+        solar_kw[resume:], load_kw[resume:], allow_discharge[resume:], period_codes[resume:], cfg, backend,
+        store_hourly=not outputs_only,
+        initial_soc=checkpoints.soc_kwh[index],
+        checkpoint_every=every,
+    )
 
-        # Grid load (import)
-        supplied = direct_pv_kw[h] + discharge_kwh[h] / cfg.step_hours
-        grid_load_kw[h] = max(load_kw[h] - supplied, 0.0)
+    # Tail snapshots restart from zero totals: offset them by the prefix
+    tail = _unpack_checkpoints(rows, every)
+    spliced = CalcCheckpoints(
+        every=every,
+        soc_kwh=np.concatenate([checkpoints.soc_kwh[:index], tail.soc_kwh]),
+        totals=np.concatenate([checkpoints.totals[:index], tail.totals + checkpoints.totals[index]]),
+        period_totals=np.concatenate([
+            checkpoints.period_totals[:index],
+            tail.period_totals + checkpoints.period_totals[index],
+        ]),
+    )
+    state = CalcState(steps=len(load_kw), soc_kwh=totals[-1])
+    solar_gen_mwh = np.sum(solar_kw, dtype=np.float64) * cfg.step_hours / 1000
 
-        # TOU cost
-        tariff = _tou_tariff(period_flags[h], cfg)
-        tou_cost[h] = grid_load_kw[h] * cfg.step_hours * tariff
+    if outputs_only:
+        outputs = _totals_outputs(
+            solar_gen_mwh,
+            checkpoints.totals[index] + np.asarray(totals[:-1]),
+            checkpoints.period_totals[index] + period_totals,
+            cfg.step_hours,
+        )
+        return CalcResults(hourly=None, outputs=outputs, state=state, checkpoints=spliced)
 
-    # Build hourly DataFrame
-    hourly = pd.DataFrame({
-        "DateTime": datetime_series,
+    tail_grid_load_kw = hourly_arrays[5]
+    tail_frame = _hourly_frame(
+        _slice_steps(datetime_series, resume),
+        solar_kw[resume:],
+        load_kw[resume:],
+        period_flags[resume:],
+        hourly_arrays,
+        tail_grid_load_kw * cfg.step_hours * tou_tariff_table(cfg)[period_codes[resume:]],
+        previous.hourly["SOC_kWh"].dtype,
+    )
+    hourly = pd.concat([previous.hourly.iloc[:resume], tail_frame], ignore_index=True)
+    outputs = _hourly_outputs(
+        solar_gen_mwh,
+        period_codes,
+        *(
+            hourly[column].to_numpy(dtype=np.float64)
+            for column in (
+                "DirectPVConsumption_kW", "ChargeEnergy_kWh", "DischargeEnergy_kWh",
+                "PowerSurplus_kW", "GridLoad_kW", "TOUCost",
+            )
+        ),
+        cfg.step_hours,
+    )
+    return CalcResults(hourly=hourly, outputs=outputs, state=state, checkpoints=spliced)
+
+
+def _slice_steps(datetime_series, start: int, stop: Optional[int] = None):
+    """Return the timestamps of steps [start, stop) (Series or array)."""
+    if isinstance(datetime_series, pd.Series):
+        return datetime_series.iloc[start:stop]
+    return datetime_series[start:stop]
+
+
+def run_calc_chunked(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    chunk_steps: int = 35_040,
+    backend: str = "auto",
+    on_chunk: Optional[Callable[[CalcResults], None]] = None,
+    dtype: Optional[np.dtype] = None,
+) -> CalcResults:
+    """Run the Calc formulas over long or sub-hourly profiles in chunks.
+
+    The profiles are processed `chunk_steps` at a time with SOC carried across
+    chunk boundaries, so results match a single `run_calc` while only one
+    chunk of float64 working arrays is alive at once. Inputs may be float32 or
+    memory-mapped arrays. No full-length DataFrame is built: pass `on_chunk`
+    to receive each chunk's CalcResults (e.g. to append it to a file).
+
+    Args:
+        datetime_series: Timestamp per step.
+        solar_kw: Solar generation per step (kW).
+        load_kw: Load demand per step (kW).
+        period_flags: TOU period flags or int8 period codes.
+        allow_discharge: Boolean array for discharge permission.
+        cfg: CalcConfig with BESS and tariff parameters.
+        chunk_steps: Steps per chunk (default: one year of 15-minute data).
+        backend: SOC loop backend ('python', 'numba' or 'auto').
+        on_chunk: Optional callback receiving each chunk's CalcResults with
+            its hourly DataFrame.
+        dtype: Storage dtype for the chunk DataFrames' float columns.
+
+    Returns:
+        CalcResults with hourly=None and outputs summed over all chunks.
+    """
+    if chunk_steps <= 0:
+        raise ValueError("chunk_steps must be positive")
+
+    outputs: Dict[str, float] = {}
+    soc = 0.0
+    for start in range(0, len(load_kw), chunk_steps):
+        stop = start + chunk_steps
+        chunk, soc = _calc_segment(
+            _slice_steps(datetime_series, start, stop),
+            solar_kw[start:stop],
+            load_kw[start:stop],
+            period_flags[start:stop],
+            allow_discharge[start:stop],
+            cfg,
+            backend,
+            on_chunk is None,
+            dtype,
+            initial_soc=soc,
+        )
+        if on_chunk is not None:
+            on_chunk(chunk)
+        for key, value in chunk.outputs.items():
+            outputs[key] = outputs.get(key, 0.0) + value
+
+    return CalcResults(hourly=None, outputs=outputs)
+
+
+def _calc_segment(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    backend: str,
+    outputs_only: bool,
+    dtype: Optional[np.dtype],
+    initial_soc: float = 0.0,
+    checkpoint_every: int = 0,
+) -> Tuple[CalcResults, float]:
+    """Run the Calc formulas from `initial_soc`; return results and final SOC."""
+    period_codes = encode_tou_periods(period_flags)
+    solar_gen_mwh = np.sum(solar_kw, dtype=np.float64) * cfg.step_hours / 1000
+
+    hourly_arrays, totals, period_totals, rows = _run_dispatch(
+        solar_kw, load_kw, allow_discharge, period_codes, cfg, backend,
+        store_hourly=not outputs_only,
+        initial_soc=initial_soc,
+        checkpoint_every=checkpoint_every,
+    )
+    final_soc = totals[-1]
+    state = CalcState(steps=len(load_kw), soc_kwh=final_soc)
+    checkpoints = _unpack_checkpoints(rows, checkpoint_every) if checkpoint_every > 0 else None
+
+    if outputs_only:
+        outputs = _totals_outputs(solar_gen_mwh, totals[:-1], period_totals, cfg.step_hours)
+        return CalcResults(hourly=None, outputs=outputs, state=state, checkpoints=checkpoints), final_soc
+
+    direct_pv_kw, charge_kwh, discharge_kwh, _, power_surplus_kw, grid_load_kw = hourly_arrays
+
+    # TOU cost: one gather from the tariff table
+    tou_cost = grid_load_kw * cfg.step_hours * tou_tariff_table(cfg)[period_codes]
+
+    hourly = _hourly_frame(datetime_series, solar_kw, load_kw, period_flags, hourly_arrays, tou_cost, dtype)
+    outputs = _hourly_outputs(
+        solar_gen_mwh,
+        period_codes,
+        direct_pv_kw,
+        charge_kwh,
+        discharge_kwh,
+        power_surplus_kw,
+        grid_load_kw,
+        tou_cost,
+        cfg.step_hours,
+    )
+    return CalcResults(hourly=hourly, outputs=outputs, state=state, checkpoints=checkpoints), final_soc
+
+
+def replay_schedule(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    charge_kwh: np.ndarray,
+    discharge_kwh: np.ndarray,
+    soc_kwh: np.ndarray,
+    cfg: CalcConfig,
+) -> CalcResults:
+    """Build Calc results for an externally computed BESS schedule.
+
+    Direct PV, surplus, grid load and TOU cost follow the Calc formulas for
+    the given per-step charge/discharge energies (e.g. from the LP optimizer
+    in `excel_replica.model.optimal_dispatch`), so the outputs are directly
+    comparable with `run_calc`.
+    """
+    step_hours = cfg.step_hours
+    solar_kw = np.asarray(solar_kw, dtype=np.float64)
+    load_kw = np.asarray(load_kw, dtype=np.float64)
+    charge_kwh = np.asarray(charge_kwh, dtype=np.float64)
+    discharge_kwh = np.asarray(discharge_kwh, dtype=np.float64)
+    period_codes = encode_tou_periods(period_flags)
+
+    direct_pv_kw = np.minimum(solar_kw, load_kw)
+    power_surplus_kw = np.maximum(solar_kw - (direct_pv_kw + charge_kwh / step_hours), 0.0)
+    grid_load_kw = np.maximum(load_kw - (direct_pv_kw + discharge_kwh / step_hours), 0.0)
+    tou_cost = grid_load_kw * step_hours * tou_tariff_table(cfg)[period_codes]
+
+    hourly_arrays = [
+        direct_pv_kw, charge_kwh, discharge_kwh, np.asarray(soc_kwh, dtype=np.float64),
+        power_surplus_kw, grid_load_kw,
+    ]
+    hourly = _hourly_frame(datetime_series, solar_kw, load_kw, period_flags, hourly_arrays, tou_cost, None)
+    outputs = _hourly_outputs(
+        np.sum(solar_kw) * step_hours / 1000,
+        period_codes,
+        direct_pv_kw,
+        charge_kwh,
+        discharge_kwh,
+        power_surplus_kw,
+        grid_load_kw,
+        tou_cost,
+        step_hours,
+    )
+    state = CalcState(steps=len(load_kw), soc_kwh=float(soc_kwh[-1]) if len(soc_kwh) else 0.0)
+    return CalcResults(hourly=hourly, outputs=outputs, state=state)
+
+
+def _hourly_outputs(
+    solar_gen_mwh: float,
+    period_codes: np.ndarray,
+    direct_pv_kw: np.ndarray,
+    charge_kwh: np.ndarray,
+    discharge_kwh: np.ndarray,
+    power_surplus_kw: np.ndarray,
+    grid_load_kw: np.ndarray,
+    tou_cost: np.ndarray,
+    step_hours: float,
+) -> Dict[str, float]:
+    """Aggregate per-hour columns into the named outputs (MWh)."""
+    outputs = {
+        "solar_gen_mwh": solar_gen_mwh,
+        "direct_pv_mwh": np.sum(direct_pv_kw) * step_hours / 1000,
+        "charge_mwh": np.sum(charge_kwh) / 1000,
+        "discharge_mwh": np.sum(discharge_kwh) / 1000,
+        "power_surplus_mwh": np.sum(power_surplus_kw) * step_hours / 1000,
+        "grid_load_mwh": np.sum(grid_load_kw) * step_hours / 1000,
+        "total_tou_cost": np.sum(tou_cost),
+    }
+
+    # Per-period splits: one bincount per column over the period codes
+    n_periods = len(TOU_PERIODS)
+    period_totals = np.vstack([
+        np.bincount(period_codes, weights=column, minlength=n_periods)
+        for column in (direct_pv_kw, discharge_kwh, grid_load_kw, tou_cost)
+    ])
+    outputs.update(_period_outputs(period_totals, step_hours))
+    return outputs
+
+
+def _hourly_frame(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    hourly_arrays: List[np.ndarray],
+    tou_cost: np.ndarray,
+    dtype: Optional[np.dtype],
+) -> pd.DataFrame:
+    """Build the hourly Calc DataFrame from the dispatch arrays."""
+    (
+        direct_pv_kw,
+        charge_kwh,
+        discharge_kwh,
+        soc_kwh,
+        power_surplus_kw,
+        grid_load_kw,
+    ) = hourly_arrays
+
+    columns = {
         "SolarGen_kW": solar_kw,
         "Load_kW": load_kw,
         "DirectPVConsumption_kW": direct_pv_kw,
@@ -128,19 +898,126 @@ def run_calc(
         "SOC_kWh": soc_kwh,
         "PowerSurplus_kW": power_surplus_kw,
         "GridLoad_kW": grid_load_kw,
-        "TimePeriodFlag": period_flags,
         "TOUCost": tou_cost,
+    }
+    if dtype is not None:
+        columns = {name: np.asarray(values).astype(dtype, copy=False) for name, values in columns.items()}
+
+    return pd.DataFrame({
+        "DateTime": datetime_series,
+        "SolarGen_kW": columns["SolarGen_kW"],
+        "Load_kW": columns["Load_kW"],
+        "DirectPVConsumption_kW": columns["DirectPVConsumption_kW"],
+        "ChargeEnergy_kWh": columns["ChargeEnergy_kWh"],
+        "DischargeEnergy_kWh": columns["DischargeEnergy_kWh"],
+        "SOC_kWh": columns["SOC_kWh"],
+        "PowerSurplus_kW": columns["PowerSurplus_kW"],
+        "GridLoad_kW": columns["GridLoad_kW"],
+        "TimePeriodFlag": period_flags,
+        "TOUCost": columns["TOUCost"],
     })
 
-    # Aggregated outputs (MWh)
+
+def _time_major(profile: np.ndarray, n: int, dtype) -> np.ndarray:
+    """Return a profile as a contiguous (hours, 1) or (hours, N) array."""
+    profile = np.asarray(profile, dtype=dtype)
+    if profile.ndim == 1:
+        return profile[:, None]
+    if profile.ndim != 2 or profile.shape[0] not in (1, n):
+        raise ValueError(f"Profile stack must have shape (hours,) or ({n}, hours), got {profile.shape}")
+    return np.ascontiguousarray(profile.T)
+
+
+def run_calc_batch(
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    bess_capacity_kwh: Optional[np.ndarray] = None,
+    bess_power_kw: Optional[np.ndarray] = None,
+    bess_efficiency: Optional[np.ndarray] = None,
+    min_soc_kwh: Optional[np.ndarray] = None,
+    backend: str = "auto",
+) -> CalcBatchResults:
+    """Run N BESS sizing scenarios through the Calc formulas in one time pass.
+
+    All scenarios advance in lockstep with an (N,) SOC state, so a sizing sweep
+    costs one loop over the hours instead of one `run_calc` call per scenario.
+    Per-hour values are identical to `run_calc`; totals are accumulated hour by
+    hour and may differ from `run_calc` in the last few bits.
+
+    Args:
+        solar_kw: Hourly solar generation (kW), shape (hours,) or (N, hours).
+        load_kw: Hourly load demand (kW), shape (hours,) or (N, hours).
+        period_flags: TOU period flags ('P', 'N', 'O') or int8 period codes,
+            shared by all scenarios.
+        allow_discharge: Discharge permission, shape (hours,) or (N, hours).
+        cfg: Base CalcConfig; supplies tariffs, step and any parameter not given.
+        bess_capacity_kwh: Usable capacity per scenario (kWh).
+        bess_power_kw: Power rating per scenario (kW).
+        bess_efficiency: Charge/discharge efficiency per scenario.
+        min_soc_kwh: Minimum SOC threshold per scenario (kWh).
+        backend: 'python' (NumPy), 'numba' or 'auto'.
+
+    Returns:
+        CalcBatchResults with the broadcast parameters and (N,) output arrays.
+    """
+    capacity, power, efficiency, min_soc = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(cfg_value if value is None else value, dtype=np.float64))
+            for value, cfg_value in (
+                (bess_capacity_kwh, cfg.bess_capacity_kwh),
+                (bess_power_kw, cfg.bess_power_kw),
+                (bess_efficiency, cfg.bess_efficiency),
+                (min_soc_kwh, cfg.min_soc_kwh),
+            )
+        )
+    )
+    n = max(
+        [capacity.shape[0]]
+        + [np.shape(p)[0] for p in (solar_kw, load_kw, allow_discharge) if np.ndim(p) == 2]
+    )
+    capacity, power, efficiency, min_soc = (
+        np.ascontiguousarray(np.broadcast_to(p, (n,))) for p in (capacity, power, efficiency, min_soc)
+    )
+
+    solar = _time_major(solar_kw, n, np.float64)
+    load = _time_major(load_kw, n, np.float64)
+    allow = _time_major(allow_discharge, n, np.bool_)
+    period_codes = encode_tou_periods(period_flags)
+    tariff_table = tou_tariff_table(cfg)
+    step_hours = float(cfg.step_hours)
+
+    totals = np.zeros((6, n))
+    period_totals = np.zeros((4, len(TOU_PERIODS), n))
+    kernel = _jit(_dispatch_batch_loop) if _resolve_backend(backend) == "numba" else _dispatch_batch_numpy
+    kernel(
+        solar, load, allow, period_codes, tariff_table,
+        capacity, power, efficiency, min_soc,
+        float(cfg.reserve_soc_kwh), float(cfg.discharge_target_kw), step_hours,
+        totals, period_totals,
+    )
+
+    direct_pv, charge, discharge, surplus, grid_load, tou_cost = totals
+    solar_total = np.broadcast_to(solar.sum(axis=0), (n,))
+
     outputs = {
-        "solar_gen_mwh": np.sum(solar_kw) * cfg.step_hours / 1000,
-        "direct_pv_mwh": np.sum(direct_pv_kw) * cfg.step_hours / 1000,
-        "charge_mwh": np.sum(charge_kwh) / 1000,
-        "discharge_mwh": np.sum(discharge_kwh) / 1000,
-        "power_surplus_mwh": np.sum(power_surplus_kw) * cfg.step_hours / 1000,
-        "grid_load_mwh": np.sum(grid_load_kw) * cfg.step_hours / 1000,
-        "total_tou_cost": np.sum(tou_cost),
+        "solar_gen_mwh": solar_total * step_hours / 1000,
+        "direct_pv_mwh": direct_pv * step_hours / 1000,
+        "charge_mwh": charge / 1000,
+        "discharge_mwh": discharge / 1000,
+        "power_surplus_mwh": surplus * step_hours / 1000,
+        "grid_load_mwh": grid_load * step_hours / 1000,
+        "total_tou_cost": tou_cost,
+    }
+    outputs.update(_period_outputs(period_totals, step_hours))
+
+    params = {
+        "bess_capacity_kwh": capacity,
+        "bess_power_kw": power,
+        "bess_efficiency": efficiency,
+        "min_soc_kwh": min_soc,
     }
 
-    return CalcResults(hourly=hourly, outputs=outputs)
+    return CalcBatchResults(params=params, outputs=outputs)
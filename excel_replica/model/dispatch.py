@@ -1,10 +1,194 @@
-"""Dispatch logic and control flags."""
+"""Dispatch logic and control flags.
 
-from typing import Dict
+Dispatch strategies only decide *when* the battery may discharge and *how
+much* it may give up; the hourly SOC recursion itself is always the Calc
+engine kernel (`run_calc` / `run_calc_batch`, Python or Numba). A strategy is
+a function that turns the base AllowDischarge mask and CalcConfig into the
+mask and config the kernel runs with:
 
+- excel_clone: Excel Calc rule (AllowDischarge as given)
+- peak_only: discharge only in peak TOU hours
+- reserve_held: keep a reserve SOC that is never discharged
+- peak_shaving: discharge only the net load above a target (kW)
+"""
+
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
 
+from excel_replica.model.calc_engine import (
+    TOU_PEAK,
+    CalcConfig,
+    CalcResults,
+    encode_tou_periods,
+    run_calc,
+)
+
+
+StrategyFn = Callable[..., Tuple[np.ndarray, CalcConfig]]
+
+
+@dataclass(frozen=True)
+class DispatchStrategy:
+    """A registered dispatch strategy."""
+    name: str
+    description: str
+    prepare: StrategyFn  # (allow_discharge, period_codes, cfg, **params) -> (allow_discharge, cfg)
+
+
+STRATEGIES: Dict[str, DispatchStrategy] = {}
+
+# Excel Strategy_mode values (Assumption!E33) with a known Python equivalent
+STRATEGY_MODES = {1: "excel_clone"}
+
+
+def register_strategy(name: str, description: str = "") -> Callable[[StrategyFn], StrategyFn]:
+    """Decorator adding a strategy function to STRATEGIES under `name`."""
+    def decorator(prepare: StrategyFn) -> StrategyFn:
+        STRATEGIES[name] = DispatchStrategy(name, description or (prepare.__doc__ or "").strip(), prepare)
+        return prepare
+    return decorator
+
+
+def get_strategy(strategy: Union[str, int]) -> DispatchStrategy:
+    """Look up a strategy by name or Excel Strategy_mode value."""
+    name = strategy
+    if isinstance(strategy, (int, float, np.number)) and float(strategy).is_integer():
+        name = STRATEGY_MODES.get(int(strategy), strategy)
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown dispatch strategy '{strategy}'. Expected one of {sorted(STRATEGIES)}.")
+    return STRATEGIES[name]
+
+
+@register_strategy("excel_clone")
+def excel_clone(allow_discharge: np.ndarray, period_codes: np.ndarray, cfg: CalcConfig) -> Tuple[np.ndarray, CalcConfig]:
+    """Excel Calc rule: discharge whenever AllowDischarge and net load > 0."""
+    return allow_discharge, cfg
+
+
+@register_strategy("peak_only")
+def peak_only(allow_discharge: np.ndarray, period_codes: np.ndarray, cfg: CalcConfig) -> Tuple[np.ndarray, CalcConfig]:
+    """Discharge only in peak TOU hours (still subject to AllowDischarge)."""
+    return allow_discharge & (period_codes == TOU_PEAK), cfg
+
+
+@register_strategy("reserve_held")
+def reserve_held(
+    allow_discharge: np.ndarray,
+    period_codes: np.ndarray,
+    cfg: CalcConfig,
+    reserve_soc_kwh: Optional[float] = None,
+    reserve_fraction: float = 0.1,
+) -> Tuple[np.ndarray, CalcConfig]:
+    """Hold a reserve SOC (default 10% of capacity) back from discharge."""
+    if reserve_soc_kwh is None:
+        reserve_soc_kwh = reserve_fraction * cfg.bess_capacity_kwh
+    cfg = replace(
+        cfg,
+        min_soc_kwh=max(cfg.min_soc_kwh, reserve_soc_kwh),
+        reserve_soc_kwh=reserve_soc_kwh,
+    )
+    return allow_discharge, cfg
+
+
+@register_strategy("peak_shaving")
+def peak_shaving(
+    allow_discharge: np.ndarray,
+    period_codes: np.ndarray,
+    cfg: CalcConfig,
+    target_kw: Optional[float] = None,
+) -> Tuple[np.ndarray, CalcConfig]:
+    """Discharge only to cap grid import at `target_kw`."""
+    if target_kw is None:
+        raise ValueError("peak_shaving requires target_kw")
+    return allow_discharge, replace(cfg, discharge_target_kw=float(target_kw))
+
+
+def prepare_dispatch(
+    strategy: Union[str, int],
+    allow_discharge: np.ndarray,
+    period_flags: np.ndarray,
+    cfg: CalcConfig,
+    **params,
+) -> Tuple[np.ndarray, CalcConfig]:
+    """Return the AllowDischarge mask and CalcConfig a strategy runs with.
+
+    The result can be passed to `run_calc`, `run_calc_batch` or any other
+    caller of the Calc kernel.
+    """
+    allow = np.asarray(allow_discharge, dtype=bool)
+    return get_strategy(strategy).prepare(allow, encode_tou_periods(period_flags), cfg, **params)
+
+
+def run_strategy(
+    strategy: Union[str, int],
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    backend: str = "auto",
+    outputs_only: bool = False,
+    **params,
+) -> CalcResults:
+    """Run the Calc engine under a registered dispatch strategy.
+
+    Args:
+        strategy: Strategy name (see STRATEGIES) or Excel Strategy_mode value.
+        datetime_series, solar_kw, load_kw, period_flags, allow_discharge,
+            cfg: As for `run_calc`.
+        backend: SOC loop backend ('python', 'numba' or 'auto').
+        outputs_only: Skip the hourly DataFrame (see `run_calc`).
+        **params: Strategy parameters (e.g. target_kw, reserve_soc_kwh).
+
+    Returns:
+        CalcResults from `run_calc`.
+    """
+    allow, strategy_cfg = prepare_dispatch(strategy, allow_discharge, period_flags, cfg, **params)
+    return run_calc(
+        datetime_series, solar_kw, load_kw, period_flags, allow, strategy_cfg,
+        backend=backend, outputs_only=outputs_only,
+    )
+
 
 def apply_dispatch(calc_df: pd.DataFrame, assumptions: Dict[str, float]) -> pd.DataFrame:
-    """Apply AllowDischarge, DischargeConditionFlag, and strategy mode rules."""
-    raise NotImplementedError("Implement dispatch rules.")
+    """Apply AllowDischarge, DischargeConditionFlag, and strategy mode rules.
+
+    Args:
+        calc_df: Calc inputs with DateTime, SolarGen_kW, Load_kW and
+            TimePeriodFlag columns, and optionally AllowDischarge (default 1).
+        assumptions: CalcConfig fields (e.g. bess_capacity_kwh), the strategy
+            under 'strategy' or 'strategy_mode' (default Excel clone) and any
+            strategy parameters.
+
+    Returns:
+        Hourly Calc DataFrame with AllowDischarge and DischargeConditionFlag
+        (1 when discharge is allowed and solar covers the load) columns added.
+    """
+    assumptions = dict(assumptions)
+    strategy = assumptions.pop("strategy", assumptions.pop("strategy_mode", "excel_clone"))
+    config_fields = {f.name for f in fields(CalcConfig)}
+    cfg = CalcConfig(**{k: v for k, v in assumptions.items() if k in config_fields})
+    params = {k: v for k, v in assumptions.items() if k not in config_fields}
+
+    solar_kw = calc_df["SolarGen_kW"].to_numpy(dtype=np.float64)
+    load_kw = calc_df["Load_kW"].to_numpy(dtype=np.float64)
+    period_flags = calc_df["TimePeriodFlag"].to_numpy()
+    if "AllowDischarge" in calc_df:
+        base_allow = calc_df["AllowDischarge"].to_numpy(dtype=bool)
+    else:
+        base_allow = np.ones(len(calc_df), dtype=bool)
+
+    allow, strategy_cfg = prepare_dispatch(strategy, base_allow, period_flags, cfg, **params)
+    results = run_calc(
+        calc_df["DateTime"], solar_kw, load_kw, period_flags, allow, strategy_cfg,
+    )
+
+    hourly = results.hourly
+    hourly["AllowDischarge"] = allow.astype(np.int8)
+    # Excel: IF(OR(AllowDischarge=0, NetLoadAfterSolar>0), 0, 1), NetLoadAfterSolar = Load - SolarGen
+    hourly["DischargeConditionFlag"] = (allow & (load_kw - solar_kw <= 0)).astype(np.int8)
+    return hourly
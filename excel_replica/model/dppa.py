@@ -10,11 +10,12 @@ Vietnam DPPA specifics:
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, Optional, Union
 
 import numpy as np
 import pandas as pd
-from excel_replica.utils.excel_reader import ExcelReader
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
 
 
 @dataclass
@@ -128,11 +129,12 @@ def calculate_dppa_hourly(
     return DPPAResults(hourly=hourly, totals=totals)
 
 
-def load_dppa_config_from_excel(reader: ExcelReader) -> DPPAConfig:
-    """Load DPPA configuration using named ranges."""
-    return DPPAConfig(
-        strike_price_vnd=reader.get_value("Strike_Price", 1800.0),
-        pcl_vnd=reader.get_value("PCL", 163.2),
-        cdppa_adv=reader.get_value("CDPPAdv", 360.14),
-        exchange_rate=reader.get_value("Exchange_rate", 25455.0),
-    )
+def load_dppa_config_from_excel(reader: Union[Path, ExcelReader]) -> DPPAConfig:
+    """Load DPPA configuration using named ranges (path or open ExcelReader)."""
+    with reader_session(reader) as session:
+        return DPPAConfig(
+            strike_price_vnd=session.get_value("Strike_Price", 1800.0),
+            pcl_vnd=session.get_value("PCL", 163.2),
+            cdppa_adv=session.get_value("CDPPAdv", 360.14),
+            exchange_rate=session.get_value("Exchange_rate", 25455.0),
+        )
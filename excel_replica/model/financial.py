@@ -6,61 +6,44 @@ Vietnam-specific:
 - MRA (Maintenance Reserve Account) for BESS augmentation
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import numpy_financial as npf
 
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
 
-def load_excel_ebitda(excel_path: Path) -> List[float]:
+
+# Financial sheet rows used for exact-match runs (25 years each)
+EBITDA_RANGE = "Financial!$L$117:$AJ$117"    # Row 117, Years 1-25
+NET_FCFE_RANGE = "Financial!$K$187:$AI$187"  # Row 187, Years 0-24
+DATES_RANGE = "Financial!$K$6:$AI$6"         # Row 6
+
+
+def load_excel_ebitda(excel_path: Union[Path, ExcelReader]) -> List[float]:
     """Load EBITDA values directly from Excel Financial sheet.
-    
+
     This ensures exact match with Excel's revenue and OPEX calculations.
+    Pass an ExcelReader to reuse an open workbook session.
     """
-    df = pd.read_excel(excel_path, sheet_name="Financial", engine="openpyxl", header=None)
-    ebitda_values = []
-    for col in range(11, 36):  # Columns L to AJ (Years 1-25)
-        val = df.iloc[116, col]  # Row 117 is EBITDA
-        if pd.notna(val) and isinstance(val, (int, float)):
-            ebitda_values.append(float(val))
-        else:
-            ebitda_values.append(0.0)
-    return ebitda_values
-
-
-def load_excel_net_fcfe(excel_path: Path) -> List[float]:
-    """Load Net FCFE values (row 187, K..AJ) from Excel Financial sheet."""
-    from openpyxl import load_workbook
-
-    wb = load_workbook(excel_path, data_only=True)
-    ws = wb["Financial"]
-    net_fcfe_values = []
-    for col in range(11, 36):  # Columns K to AJ
-        val = ws.cell(row=187, column=col).value
-        if isinstance(val, (int, float)):
-            net_fcfe_values.append(float(val))
-        else:
-            net_fcfe_values.append(0.0)
-    return net_fcfe_values
-
-
-def load_excel_dates(excel_path: Path) -> List[pd.Timestamp]:
-    """Load date series (row 6, K..AJ) from Excel Financial sheet."""
-    from openpyxl import load_workbook
-
-    wb = load_workbook(excel_path, data_only=True)
-    ws = wb["Financial"]
-    date_values = []
-    for col in range(11, 36):  # Columns K to AJ
-        val = ws.cell(row=6, column=col).value
-        if val is not None:
-            date_values.append(pd.to_datetime(val))
-        else:
-            date_values.append(None)
-    return date_values
+    with reader_session(excel_path) as reader:
+        return reader.get_range(EBITDA_RANGE).ravel().tolist()
+
+
+def load_excel_net_fcfe(excel_path: Union[Path, ExcelReader]) -> List[float]:
+    """Load Net FCFE values (row 187, K..AI) from Excel Financial sheet."""
+    with reader_session(excel_path) as reader:
+        return reader.get_range(NET_FCFE_RANGE).ravel().tolist()
+
+
+def load_excel_dates(excel_path: Union[Path, ExcelReader]) -> List[pd.Timestamp]:
+    """Load date series (row 6, K..AI) from Excel Financial sheet."""
+    with reader_session(excel_path) as reader:
+        values = reader.get_range(DATES_RANGE, dtype=None).ravel()
+    return [None if val is None else pd.to_datetime(val) for val in values]
 
 
 @dataclass
@@ -117,6 +100,17 @@ class TaxHoliday:
             return 0.10
         return self.standard_rate
 
+    def get_rates(self, n_years: int) -> np.ndarray:
+        """Tax rates for years 1..n_years (vectorized `get_rate`)."""
+        years = np.arange(1, n_years + 1)
+        reduced_5pct_end = self.exempt_years + self.reduced_years_5pct
+        reduced_10pct_end = reduced_5pct_end + self.reduced_years_10pct
+        return np.select(
+            [years <= self.exempt_years, years <= reduced_5pct_end, years <= reduced_10pct_end],
+            [0.0, 0.05, 0.10],
+            self.standard_rate,
+        )
+
 
 @dataclass
 class MRASchedule:
@@ -137,6 +131,14 @@ class MRASchedule:
         """Calculate MRA contribution for a given year."""
         return self.mra_by_year.get(year, 0.0)
 
+    def get_annual_contributions(self, n_years: int, augmentation_cost: float = 0.0) -> np.ndarray:
+        """MRA contributions for years 1..n_years (vectorized `get_annual_contribution`)."""
+        contributions = np.zeros(n_years)
+        for year, amount in self.mra_by_year.items():
+            if 1 <= year <= n_years:
+                contributions[year - 1] = amount
+        return contributions
+
 
 @dataclass
 class FinancialResults:
@@ -148,8 +150,320 @@ class FinancialResults:
     payback_years: float
 
 
+@dataclass
+class FinancialBatchResults:
+    """Results from a batched financial run (one row per scenario)."""
+    params: Dict[str, np.ndarray]  # FinancialConfig field -> (N,) values used
+    yearly: Dict[str, np.ndarray]  # run_financial_model's yearly columns as (N, years) arrays
+    project_cf: np.ndarray  # (N, years + 1) unlevered cash flows, Year 0 = -CAPEX
+    equity_cf: np.ndarray  # (N, years + 1) levered cash flows, Year 0 = -equity
+    project_irr: np.ndarray
+    equity_irr: np.ndarray
+    npv: np.ndarray
+    payback_years: np.ndarray
+    project_irr_multiple: np.ndarray  # (N,) True where the project cash flows have several IRRs
+    equity_irr_multiple: np.ndarray  # (N,) True where the equity cash flows have several IRRs
+    # Metric ("project_irr", "equity_irr", "npv") -> input -> (N,) derivative, with gradients=True
+    gradients: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.npv)
+
+
+# FinancialConfig fields that may vary per scenario in run_financial_batch
+# (project_years sets the shape of every schedule, so it is shared)
+BATCH_FIELDS = tuple(f.name for f in fields(FinancialConfig) if f.name != "project_years")
+
+# Inputs run_financial_batch differentiates with respect to
+GRADIENT_INPUTS = BATCH_FIELDS + ("revenue_per_mwh",)
+
+
+def _growth_factors(rate: float, n_years: int) -> np.ndarray:
+    """(1 + rate) ** (year - 1) for years 1..n_years.
+
+    Built from scalar powers: NumPy's SIMD `power` can differ from
+    Python's `**` in the last bit, and schedules must match the scalar
+    formulas exactly.
+    """
+    base = 1 + rate
+    return np.array([base ** k for k in range(n_years)], dtype=np.float64)
+
+
+def _growth_matrix(rates: np.ndarray, n_years: int) -> np.ndarray:
+    """`_growth_factors` for each of (N,) rates, computed once per distinct rate."""
+    unique, inverse = np.unique(rates, return_inverse=True)
+    table = np.array([_growth_factors(float(rate), n_years) for rate in unique]).reshape(len(unique), n_years)
+    return table[inverse.ravel()]
+
+
+@dataclass
+class IRRBatchResults:
+    """IRRs of an (N, T) cash-flow matrix, one per row."""
+    irr: np.ndarray  # (N,) rate closest to zero; NaN where no IRR exists
+    multiple_roots: np.ndarray  # (N,) True where the row has more than one IRR
+
+
+# Newton iterations before giving up on a row (bisection guarantees progress)
+IRR_MAX_ITER = 100
+
+# XIRR rows with several sign changes are searched for roots on this grid of
+# rates (x = 1 / (1 + r) geometric between the ends)
+XIRR_SEARCH_RATES = (-0.99, 100.0)
+XIRR_SEARCH_POINTS = 512
+
+# Days per year in Excel's XNPV/XIRR year fractions
+DAYS_PER_YEAR = 365.0
+
+
+def _discounted_sum(cash_flows: np.ndarray, x: np.ndarray, exponents: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise sum(cf[t] * x**e[t]) and its derivative in x."""
+    powers = x[:, None] ** exponents
+    f = np.einsum("ij,ij->i", cash_flows, powers)
+    df = np.einsum("ij,ij->i", cash_flows * exponents, powers) / x
+    return f, df
+
+
+def _sign_changes(cash_flows: np.ndarray) -> np.ndarray:
+    """Row-wise number of sign changes among the non-zero flows."""
+    signs = np.sign(cash_flows)
+    last_nonzero = np.maximum.accumulate(np.where(signs != 0, np.arange(cash_flows.shape[1]), 0), axis=1)
+    previous = np.take_along_axis(signs, last_nonzero[:, :-1], axis=1)
+    return np.count_nonzero(signs[:, 1:] * previous < 0, axis=1)
+
+
+def _unique_root_bracket(cash_flows: np.ndarray, exponents: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bracket (lo, hi) in x and the sign of f at lo for one-sign-change rows.
+
+    Exponents must be strictly increasing. Above hi the last non-zero flow
+    outweighs all the others: |a_n| x**e_n > sum|a_i| x**e_prev for x >= 1.
+    """
+    index = np.arange(len(cash_flows))
+    nonzero = cash_flows != 0
+    first = nonzero.argmax(axis=1)
+    last = cash_flows.shape[1] - 1 - nonzero[:, ::-1].argmax(axis=1)
+    nonzero[index, last] = False
+    previous = cash_flows.shape[1] - 1 - nonzero[:, ::-1].argmax(axis=1)
+
+    leading = np.abs(cash_flows[index, last])
+    rest = np.abs(cash_flows).sum(axis=1) - leading
+    gap = exponents[last] - exponents[previous]
+    hi = 2 * np.maximum(1.0, (rest / leading) ** (1 / gap))
+    return np.zeros(len(cash_flows)), hi, np.sign(cash_flows[index, first])
+
+
+def _solve_bracketed(
+    cash_flows: np.ndarray,
+    exponents: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    sign_lo: np.ndarray,
+    x: np.ndarray,
+) -> np.ndarray:
+    """Root x of each row's discounted sum inside (lo, hi), Newton with bisection fallback."""
+    result = np.empty(len(x))
+    rows = np.arange(len(x))
+    x = np.where((x > lo) & (x < hi), x, 0.5 * (lo + hi))
+
+    # Rows drop out of the working set as they converge
+    for _ in range(IRR_MAX_ITER):
+        f, df = _discounted_sum(cash_flows, x, exponents)
+        below = np.sign(f) == sign_lo
+        lo = np.where(below, x, lo)
+        hi = np.where(below, hi, x)
+
+        step = x - f / df
+        step = np.where((step >= lo) & (step <= hi) & (step > 0), step, 0.5 * (lo + hi))
+        tol = 4 * np.finfo(float).eps * x
+        done = (f == 0) | (np.abs(step - x) <= tol) | (hi - lo <= tol)
+        x = np.where(f == 0, x, step)
+        if done.any():
+            result[rows[done]] = x[done]
+            keep = ~done
+            rows, cash_flows, x, lo, hi, sign_lo = rows[keep], cash_flows[keep], x[keep], lo[keep], hi[keep], sign_lo[keep]
+            if len(rows) == 0:
+                break
+    result[rows] = x
+    return result
+
+
+def _initial_x(guess: Union[float, np.ndarray, None], n: int) -> np.ndarray:
+    """x = 1 / (1 + guess) for N rows; Excel's default guess is 0.1."""
+    if guess is None:
+        guess = 0.1
+    return 1 / (1 + np.broadcast_to(np.asarray(guess, dtype=np.float64), (n,)))
+
+
+def _irr_roots(cash_flows: np.ndarray) -> Tuple[float, int]:
+    """`npf.irr` for one row, plus the number of candidate IRRs it chose from."""
+    roots = np.roots(cash_flows[::-1])
+    roots = roots[(roots.imag == 0) & (roots.real > 0)].real
+    if len(roots) == 0:
+        return np.nan, 0
+    rates = 1 / roots - 1
+    return float(rates[np.argmin(np.abs(rates))]), len(rates)
+
+
+def calculate_irr_batch(
+    cash_flows: np.ndarray,
+    guess: Union[float, np.ndarray, None] = None,
+) -> IRRBatchResults:
+    """Solve the IRR of every row of an (N, T) cash-flow matrix at once.
+
+    Rows with exactly one sign change have a unique IRR (Descartes' rule of
+    signs). They are solved together by Newton's method on the NPV
+    polynomial in x = 1 / (1 + r), bracketed on (0, root bound) and
+    falling back to bisection whenever a step leaves the bracket, so every
+    row converges. The result matches `npf.irr` to ~1e-12.
+
+    Rows with more sign changes may have several IRRs; they go through
+    `npf.irr` (eigenvalues, rate closest to zero) and are flagged in
+    `multiple_roots` when more than one IRR exists.
+
+    Args:
+        cash_flows: (N, T) or (T,) cash flows, Year 0 first.
+        guess: Initial rate, scalar or (N,). Warm-starting from the IRRs of
+            neighbouring samples (e.g. the previous sweep point) cuts the
+            Newton iterations; default 0.1 like Excel's IRR.
+
+    Returns:
+        IRRBatchResults with (N,) IRRs and multiple-root flags.
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    n = cash_flows.shape[0]
+    irr = np.full(n, np.nan)
+    multiple_roots = np.zeros(n, dtype=bool)
+
+    finite = np.isfinite(cash_flows).all(axis=1)
+    changes = _sign_changes(cash_flows)
+    for i in np.flatnonzero(finite & (changes > 1)):
+        irr[i], n_roots = _irr_roots(cash_flows[i])
+        multiple_roots[i] = n_roots > 1
+
+    rows = np.flatnonzero(finite & (changes == 1))
+    if len(rows):
+        exponents = np.arange(cash_flows.shape[1], dtype=np.float64)
+        cf = cash_flows[rows]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x = _solve_bracketed(cf, exponents, *_unique_root_bracket(cf, exponents), _initial_x(guess, n)[rows])
+            irr[rows] = 1 / x - 1
+    return IRRBatchResults(irr=irr, multiple_roots=multiple_roots)
+
+
+def year_fractions(dates: Sequence[Optional[pd.Timestamp]]) -> np.ndarray:
+    """XNPV/XIRR year fractions (days since the first date / 365) of a date schedule.
+
+    Missing dates give NaN (their cash flows are skipped). Compute once per
+    schedule and reuse across scenarios.
+    """
+    base_date = next((d for d in dates if d is not None), None)
+    return np.array(
+        [np.nan if d is None else (d - base_date).days / DAYS_PER_YEAR for d in dates],
+        dtype=np.float64,
+    )
+
+
+def _dated_flows(cash_flows: np.ndarray, fractions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, T) flows merged onto sorted unique year fractions, missing dates dropped."""
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    fractions = np.asarray(fractions, dtype=np.float64)
+    if cash_flows.shape[1] != len(fractions):
+        raise ValueError(f"{cash_flows.shape[1]} cash flows per row but {len(fractions)} year fractions")
+    dated = np.flatnonzero(~np.isnan(fractions))
+    dated = dated[np.argsort(fractions[dated], kind="stable")]
+    exponents, start = np.unique(fractions[dated], return_index=True)
+    if len(exponents) == 0:
+        return np.zeros((len(cash_flows), 0)), exponents
+    return np.add.reduceat(cash_flows[:, dated], start, axis=1), exponents
+
+
+def calculate_xnpv_batch(
+    cash_flows: np.ndarray,
+    fractions: np.ndarray,
+    discount_rate: Union[float, np.ndarray],
+) -> np.ndarray:
+    """XNPV of every row of an (N, T) cash-flow matrix.
+
+    Args:
+        cash_flows: (N, T) or (T,) cash flows.
+        fractions: (T,) year fractions from `year_fractions`.
+        discount_rate: Scalar or (N,) rates.
+
+    Returns:
+        (N,) XNPVs.
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    fractions = np.asarray(fractions, dtype=np.float64)
+    rate = np.atleast_1d(np.asarray(discount_rate, dtype=np.float64))[:, None]
+    discount = (1 + rate) ** np.where(np.isnan(fractions), 0.0, fractions)
+    return np.sum(np.where(np.isnan(fractions), 0.0, cash_flows / discount), axis=1)
+
+
+def calculate_xirr_batch(
+    cash_flows: np.ndarray,
+    fractions: np.ndarray,
+    guess: Union[float, np.ndarray, None] = None,
+) -> IRRBatchResults:
+    """Solve the XIRR of every row of an (N, T) dated cash-flow matrix at once.
+
+    Same solver as `calculate_irr_batch` with the year fractions as
+    exponents (Descartes' rule holds for real exponents). Rows with several
+    sign changes are scanned for brackets over XIRR_SEARCH_RATES; the root
+    closest to zero is refined and `multiple_roots` marks rows where more
+    than one bracket was found.
+
+    Args:
+        cash_flows: (N, T) or (T,) cash flows.
+        fractions: (T,) year fractions from `year_fractions`.
+        guess: Initial rate, scalar or (N,); default 0.1 like Excel's XIRR.
+
+    Returns:
+        IRRBatchResults with (N,) XIRRs (NaN where none exists) and flags.
+    """
+    cf, exponents = _dated_flows(cash_flows, fractions)
+    n = len(cf)
+    xirr = np.full(n, np.nan)
+    multiple_roots = np.zeros(n, dtype=bool)
+    if cf.shape[1] < 2:
+        return IRRBatchResults(irr=xirr, multiple_roots=multiple_roots)
+
+    finite = np.isfinite(cf).all(axis=1)
+    changes = _sign_changes(cf)
+    x0 = _initial_x(guess, n)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rows = np.flatnonzero(finite & (changes == 1))
+        if len(rows):
+            lo, hi, sign_lo = _unique_root_bracket(cf[rows], exponents)
+            xirr[rows] = 1 / _solve_bracketed(cf[rows], exponents, lo, hi, sign_lo, x0[rows]) - 1
+
+        rows = np.flatnonzero(finite & (changes > 1))
+        if len(rows):
+            low_rate, high_rate = XIRR_SEARCH_RATES
+            grid = np.geomspace(1 / (1 + high_rate), 1 / (1 + low_rate), XIRR_SEARCH_POINTS)
+            values = cf[rows] @ (grid[:, None] ** exponents).T
+            crossings = np.sign(values[:, :-1]) * np.sign(values[:, 1:]) < 0
+            n_roots = crossings.sum(axis=1)
+            multiple_roots[rows] = n_roots > 1
+
+            found = n_roots > 0
+            rows, crossings, values = rows[found], crossings[found], values[found]
+            if len(rows):
+                # Bracket whose rates are closest to zero
+                distance = np.where(crossings, np.abs(1 / grid[:-1] - 1) + np.abs(1 / grid[1:] - 1), np.inf)
+                left = distance.argmin(axis=1)
+                sign_lo = np.sign(values[np.arange(len(rows)), left])
+                x = _solve_bracketed(
+                    cf[rows], exponents, grid[left], grid[left + 1], sign_lo, 0.5 * (grid[left] + grid[left + 1])
+                )
+                xirr[rows] = 1 / x - 1
+    return IRRBatchResults(irr=xirr, multiple_roots=multiple_roots)
+
+
 def calculate_irr(cash_flows: np.ndarray) -> float:
-    """Calculate Internal Rate of Return (IRR)."""
+    """Calculate Internal Rate of Return (IRR).
+
+    For a single vector `npf.irr` is cheaper than `calculate_irr_batch`
+    (numpy per-call overhead); use the batch solver for many vectors.
+    """
     if np.all(cash_flows >= 0) or np.all(cash_flows <= 0):
         return 0.0
 
@@ -172,17 +486,11 @@ def calculate_xnpv(cash_flows: np.ndarray, dates: List[pd.Timestamp], discount_r
     """Calculate XNPV using actual dates."""
     if len(cash_flows) == 0 or len(dates) == 0:
         return 0.0
-    base_date = next((d for d in dates if d is not None), None)
-    if base_date is None:
+    if all(d is None for d in dates):
         return calculate_npv(cash_flows, discount_rate)
 
-    npv = 0.0
-    for cf, dt in zip(cash_flows, dates):
-        if dt is None:
-            continue
-        days = (dt - base_date).days
-        npv += cf / (1 + discount_rate) ** (days / 365.0)
-    return float(npv)
+    n = min(len(cash_flows), len(dates))
+    return float(calculate_xnpv_batch(np.asarray(cash_flows)[:n], year_fractions(dates[:n]), discount_rate)[0])
 
 
 def calculate_payback(cumulative_cash_flows: np.ndarray) -> float:
@@ -224,7 +532,6 @@ def run_financial_model(
         mra = MRASchedule()
 
     years = cfg.project_years
-    yearly_data = []
 
     # Initial CAPEX (Year 0)
     total_capex = cfg.land_cost_usd + cfg.bop_cost_usd + cfg.pv_cost_usd + cfg.bess_cost_usd
@@ -237,105 +544,102 @@ def run_financial_model(
     # BESS augmentation cost (assume same as initial BESS cost)
     augmentation_cost = cfg.bess_cost_usd
 
-    # Initialize debt balance for tracking principal payments
+    year_index = np.arange(1, years + 1)
+    # Leading years whose EBITDA comes from Excel
+    n_excel = 0 if excel_ebitda is None else min(len(excel_ebitda), years)
+
+    # Revenue (from lifetime results; zero beyond the simulated years)
+    solar_mwh = np.zeros(years)
+    if n_excel < years:
+        simulated = lifetime_results["SolarGen_MWh"].to_numpy(dtype=np.float64)[:years]
+        solar_mwh[:len(simulated)] = simulated
+
+    # Apply price escalation
+    revenue = solar_mwh * revenue_per_mwh * _growth_factors(cfg.price_escalation, years)
+
+    # OPEX with escalation
+    total_opex = (
+        cfg.om_pv_usd + cfg.om_bess_usd +
+        cfg.insurance_pv_usd + cfg.insurance_bess_usd +
+        cfg.other_opex_usd + cfg.land_lease_usd
+    ) * _growth_factors(cfg.opex_escalation, years)
+
+    # MRA contribution (included in OPEX per Excel)
+    mra_contribution = mra.get_annual_contributions(years, augmentation_cost)
+
+    # EBITDA (after MRA, matching Excel)
+    ebitda = revenue - total_opex - mra_contribution
+
+    # Use Excel EBITDA where provided (revenue reported as EBITDA, no OPEX/MRA)
+    if n_excel:
+        ebitda[:n_excel] = np.asarray(excel_ebitda[:n_excel], dtype=np.float64)
+        revenue[:n_excel] = ebitda[:n_excel]
+        total_opex[:n_excel] = 0.0
+        mra_contribution[:n_excel] = 0.0
+
+    # Depreciation
+    depreciation = np.where(year_index <= cfg.depreciation_years, annual_depreciation, 0.0)
+
+    # EBIT
+    ebit = ebitda - depreciation
+
+    # Tax (never negative)
+    tax_rate = tax_holiday.get_rates(years)
+    tax = ebit * tax_rate
+    tax = np.where(tax < 0.0, 0.0, tax)
+
+    # Net income
+    net_income = ebit - tax
+
+    # CFADS (Cash Flow Available for Debt Service) = EBITDA
+    cfads = ebitda
+
+    # Debt service using DSCR sculpting: DS = CFADS / target_DSCR. The
+    # balance recursion is sequential, but only over the debt tenor
+    debt_service = np.zeros(years)
+    interest_payment = np.zeros(years)
+    principal_payment = np.zeros(years)
     debt_balance = debt_amount
-
-    for year in range(1, years + 1):
-        # Use Excel EBITDA if provided, otherwise calculate
-        if excel_ebitda is not None and year <= len(excel_ebitda):
-            ebitda = excel_ebitda[year - 1]
-            # Back-calculate revenue and opex for reporting
-            revenue = ebitda  # Placeholder
-            total_opex = 0.0
-            mra_contribution = 0.0
-        else:
-            # Revenue (from lifetime results)
-            if year <= len(lifetime_results):
-                solar_mwh = lifetime_results.iloc[year - 1]["SolarGen_MWh"]
-            else:
-                solar_mwh = 0.0
-
-            # Apply price escalation
-            escalation_factor = (1 + cfg.price_escalation) ** (year - 1)
-            revenue = solar_mwh * revenue_per_mwh * escalation_factor
-
-            # OPEX with escalation
-            opex_factor = (1 + cfg.opex_escalation) ** (year - 1)
-            total_opex = (
-                cfg.om_pv_usd + cfg.om_bess_usd +
-                cfg.insurance_pv_usd + cfg.insurance_bess_usd +
-                cfg.other_opex_usd + cfg.land_lease_usd
-            ) * opex_factor
-
-            # MRA contribution (included in OPEX per Excel)
-            mra_contribution = mra.get_annual_contribution(year, augmentation_cost)
-
-            # EBITDA (after MRA, matching Excel)
-            ebitda = revenue - total_opex - mra_contribution
-
-        # Depreciation
-        depreciation = annual_depreciation if year <= cfg.depreciation_years else 0.0
-
-        # EBIT
-        ebit = ebitda - depreciation
-
-        # Tax
-        tax_rate = tax_holiday.get_rate(year)
-        tax = max(ebit * tax_rate, 0.0)
-
-        # Net income
-        net_income = ebit - tax
-
-        # CFADS (Cash Flow Available for Debt Service) = EBITDA
-        cfads = ebitda
-
-        # Debt service using DSCR sculpting: DS = CFADS / target_DSCR
-        if year <= cfg.debt_tenor_years and cfads > 0:
-            debt_service = cfads / cfg.target_dscr
+    for i in range(min(cfg.debt_tenor_years, years)):
+        if cfads[i] > 0:
+            debt_service[i] = cfads[i] / cfg.target_dscr
             # Split into interest and principal
-            interest_payment = debt_balance * cfg.interest_rate
-            principal_payment = debt_service - interest_payment
+            interest_payment[i] = debt_balance * cfg.interest_rate
             # Ensure principal doesn't exceed remaining balance
-            principal_payment = min(principal_payment, debt_balance)
-            debt_balance -= principal_payment
-        else:
-            debt_service = 0.0
-            interest_payment = 0.0
-            principal_payment = 0.0
-
-        # Excel dividend formula: Dividend = CFADS + Principal - Interest
-        # This gives equity holders the benefit of principal repayment
-        dividends = cfads + principal_payment - interest_payment
-
-        # Free cash flow to equity
-        fcfe = dividends
-
-        yearly_data.append({
-            "Year": year,
-            "Revenue_USD": revenue,
-            "OPEX_USD": total_opex,
-            "MRA_USD": mra_contribution,
-            "EBITDA_USD": ebitda,
-            "Depreciation_USD": depreciation,
-            "EBIT_USD": ebit,
-            "Tax_Rate": tax_rate,
-            "Tax_USD": tax,
-            "Net_Income_USD": net_income,
-            "Debt_Service_USD": debt_service,
-            "FCFE_USD": fcfe,
-        })
-
-    yearly_df = pd.DataFrame(yearly_data)
+            principal_payment[i] = min(debt_service[i] - interest_payment[i], debt_balance)
+            debt_balance -= principal_payment[i]
+
+    # Excel dividend formula: Dividend = CFADS + Principal - Interest
+    # This gives equity holders the benefit of principal repayment
+    dividends = cfads + principal_payment - interest_payment
+
+    # Free cash flow to equity
+    fcfe = dividends
+
+    yearly_df = pd.DataFrame({
+        "Year": year_index,
+        "Revenue_USD": revenue,
+        "OPEX_USD": total_opex,
+        "MRA_USD": mra_contribution,
+        "EBITDA_USD": ebitda,
+        "Depreciation_USD": depreciation,
+        "EBIT_USD": ebit,
+        "Tax_Rate": tax_rate,
+        "Tax_USD": tax,
+        "Net_Income_USD": net_income,
+        "Debt_Service_USD": debt_service,
+        "FCFE_USD": fcfe,
+    })
 
     # Project cash flows (unlevered)
     project_cf = np.zeros(years + 1)
     project_cf[0] = -total_capex
-    project_cf[1:] = yearly_df["EBITDA_USD"].values - yearly_df["Tax_USD"].values
+    project_cf[1:] = ebitda - tax
 
     # Equity cash flows (levered)
     equity_cf = np.zeros(years + 1)
     equity_cf[0] = -equity_amount
-    equity_cf[1:] = yearly_df["FCFE_USD"].values
+    equity_cf[1:] = fcfe
 
     # Calculate metrics
     project_irr = calculate_irr(project_cf)
@@ -361,28 +665,315 @@ def run_financial_model(
     )
 
 
-def load_excel_equity_cashflows(file_path: Path) -> Tuple[np.ndarray, float]:
+def run_financial_batch(
+    solar_mwh: Union[pd.DataFrame, np.ndarray],
+    revenue_per_mwh: Union[float, np.ndarray],
+    cfg: FinancialConfig,
+    params: Optional[Mapping[str, Any]] = None,
+    tax_holiday: Optional[TaxHoliday] = None,
+    mra: Optional[MRASchedule] = None,
+    dates: Optional[Sequence[Optional[pd.Timestamp]]] = None,
+    gradients: bool = False,
+) -> FinancialBatchResults:
+    """Run N financial scenarios at once on struct-of-arrays configs.
+
+    Every schedule of `run_financial_model` is computed as an (N, years)
+    array, and the DSCR debt sculpting advances all scenarios together
+    (one vector step per tenor year). Cash flows and payback are identical
+    to calling `run_financial_model` per scenario (without Excel EBITDA/Net
+    FCFE overrides); IRRs (`calculate_irr_batch`) and NPVs agree to
+    floating-point rounding.
+
+    With `gradients=True` the derivatives of project IRR, equity IRR and
+    NPV with respect to every GRADIENT_INPUTS entry are carried along in
+    forward mode (one tangent per input, all in the same pass) and IRRs
+    are differentiated through the implicit function theorem. Kinks (tax
+    floor, principal cap, debt tenor and depreciation year masks) stay on
+    their current branch, so integer-valued fields such as
+    debt_tenor_years get 0 and payback is not differentiated.
+
+    Args:
+        solar_mwh: Yearly SolarGen_MWh, shape (years,) or (N, years), or a
+            lifetime DataFrame with a SolarGen_MWh column (shared).
+        revenue_per_mwh: Revenue rate (USD/MWh), scalar or (N,); fold
+            revenue multipliers in here.
+        cfg: Base FinancialConfig; supplies project_years and every field
+            not given in `params`.
+        params: Per-scenario overrides, FinancialConfig field -> (N,)
+            values (e.g. {"pv_cost_usd": capex * mult, "interest_rate": rates}).
+        tax_holiday: Optional TaxHoliday schedule (shared).
+        mra: Optional MRASchedule (shared).
+        dates: Optional cash-flow dates (e.g. `load_excel_dates`); NPV is
+            then the XNPV of Net FCFE as in Excel, with the year fractions
+            computed once for all scenarios.
+        gradients: Also fill FinancialBatchResults.gradients.
+
+    Returns:
+        FinancialBatchResults with (N,) metrics.
+
+    Raises:
+        ValueError: For unknown fields or a per-scenario project_years.
+    """
+    if tax_holiday is None:
+        tax_holiday = TaxHoliday()
+    if mra is None:
+        mra = MRASchedule()
+
+    params = dict(params or {})
+    if "project_years" in params:
+        raise ValueError("project_years cannot vary per scenario; set it on cfg")
+    unknown = sorted(set(params) - set(BATCH_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown FinancialConfig fields: {unknown}")
+
+    if isinstance(solar_mwh, pd.DataFrame):
+        solar_mwh = solar_mwh["SolarGen_MWh"].to_numpy(dtype=np.float64)
+    solar = np.atleast_2d(np.asarray(solar_mwh, dtype=np.float64))
+    price = np.atleast_1d(np.asarray(revenue_per_mwh, dtype=np.float64))
+    values = {
+        name: np.atleast_1d(np.asarray(params.get(name, getattr(cfg, name)), dtype=np.float64))
+        for name in BATCH_FIELDS
+    }
+    n = max([solar.shape[0], price.shape[0]] + [v.shape[0] for v in values.values()])
+    values = {name: np.broadcast_to(v, (n,)) for name, v in values.items()}
+    price = np.broadcast_to(price, (n,))
+
+    years = cfg.project_years
+    year_index = np.arange(1, years + 1)
+
+    # Initial CAPEX (Year 0)
+    total_capex = values["land_cost_usd"] + values["bop_cost_usd"] + values["pv_cost_usd"] + values["bess_cost_usd"]
+    debt_amount = total_capex * values["leverage_ratio"]
+    equity_amount = total_capex - debt_amount
+    annual_depreciation = total_capex / values["depreciation_years"]
+
+    # Revenue (zero beyond the simulated years) with price escalation
+    solar_matrix = np.zeros((n, years))
+    simulated = min(solar.shape[1], years)
+    solar_matrix[:, :simulated] = solar[:, :simulated]
+    price_growth = _growth_matrix(values["price_escalation"], years)
+    revenue = solar_matrix * price[:, None] * price_growth
+
+    # OPEX with escalation
+    opex_year1 = (
+        values["om_pv_usd"] + values["om_bess_usd"] +
+        values["insurance_pv_usd"] + values["insurance_bess_usd"] +
+        values["other_opex_usd"] + values["land_lease_usd"]
+    )
+    opex_growth = _growth_matrix(values["opex_escalation"], years)
+    total_opex = opex_year1[:, None] * opex_growth
+
+    # MRA contribution (included in OPEX per Excel); EBITDA after MRA
+    mra_contribution = mra.get_annual_contributions(years)
+    ebitda = revenue - total_opex - mra_contribution
+
+    depreciation = np.where(
+        year_index <= values["depreciation_years"][:, None], annual_depreciation[:, None], 0.0
+    )
+    ebit = ebitda - depreciation
+    tax_rate = tax_holiday.get_rates(years)
+    tax = ebit * tax_rate
+    tax = np.where(tax < 0.0, 0.0, tax)
+    net_income = ebit - tax
+    cfads = ebitda
+
+    if gradients:
+        # Tangents carry a leading axis over GRADIENT_INPUTS; unit[name] seeds one input
+        unit = dict(zip(GRADIENT_INPUTS, np.eye(len(GRADIENT_INPUTS))[:, :, None]))
+        d_capex = unit["land_cost_usd"] + unit["bop_cost_usd"] + unit["pv_cost_usd"] + unit["bess_cost_usd"]
+        d_debt = d_capex * values["leverage_ratio"] + total_capex * unit["leverage_ratio"]
+        d_equity = d_capex - d_debt
+        d_annual_depreciation = (
+            d_capex / values["depreciation_years"]
+            - total_capex / values["depreciation_years"] ** 2 * unit["depreciation_years"]
+        )
+
+        # d/dr (1 + r) ** (year - 1) = (year - 1) * growth / (1 + r)
+        d_revenue = (
+            (solar_matrix * price_growth)[None] * unit["revenue_per_mwh"][..., None]
+            + (revenue * (year_index - 1) / (1 + values["price_escalation"])[:, None])[None]
+            * unit["price_escalation"][..., None]
+        )
+        d_opex_year1 = (
+            unit["om_pv_usd"] + unit["om_bess_usd"] +
+            unit["insurance_pv_usd"] + unit["insurance_bess_usd"] +
+            unit["other_opex_usd"] + unit["land_lease_usd"]
+        )
+        d_opex = (
+            d_opex_year1[..., None] * opex_growth
+            + (total_opex * (year_index - 1) / (1 + values["opex_escalation"])[:, None])[None]
+            * unit["opex_escalation"][..., None]
+        )
+        d_ebitda = d_revenue - d_opex
+        d_ebit = d_ebitda - np.where(
+            year_index <= values["depreciation_years"][:, None], d_annual_depreciation[..., None], 0.0
+        )
+        d_tax = np.where(tax > 0.0, d_ebit * tax_rate, 0.0)
+
+        d_balance = d_debt
+        d_interest_payment = np.zeros((len(GRADIENT_INPUTS), n, years))
+        d_principal_payment = np.zeros((len(GRADIENT_INPUTS), n, years))
+
+    # DSCR sculpting: one vector step per tenor year across all scenarios
+    debt_service = np.zeros((n, years))
+    interest_payment = np.zeros((n, years))
+    principal_payment = np.zeros((n, years))
+    tenor = values["debt_tenor_years"]
+    debt_balance = debt_amount.copy()
+    for i in range(int(min(tenor.max(initial=0.0), years))):
+        active = (i < tenor) & (cfads[:, i] > 0)
+        service = cfads[:, i] / values["target_dscr"]
+        interest = debt_balance * values["interest_rate"]
+        principal = np.minimum(service - interest, debt_balance)
+        debt_service[:, i] = np.where(active, service, 0.0)
+        interest_payment[:, i] = np.where(active, interest, 0.0)
+        principal_payment[:, i] = np.where(active, principal, 0.0)
+        if gradients:
+            d_service = d_ebitda[:, :, i] / values["target_dscr"] - service / values["target_dscr"] * unit["target_dscr"]
+            d_interest = d_balance * values["interest_rate"] + debt_balance * unit["interest_rate"]
+            d_principal = np.where(service - interest > debt_balance, d_balance, d_service - d_interest)
+            d_interest_payment[:, :, i] = np.where(active, d_interest, 0.0)
+            d_principal_payment[:, :, i] = np.where(active, d_principal, 0.0)
+            d_balance = np.where(active, d_balance - d_principal, d_balance)
+        debt_balance = np.where(active, debt_balance - principal, debt_balance)
+
+    # Dividend = CFADS + Principal - Interest (Excel)
+    fcfe = cfads + principal_payment - interest_payment
+
+    project_cf = np.empty((n, years + 1))
+    project_cf[:, 0] = -total_capex
+    project_cf[:, 1:] = ebitda - tax
+    equity_cf = np.empty((n, years + 1))
+    equity_cf[:, 0] = -equity_amount
+    equity_cf[:, 1:] = fcfe
+
+    # No IRR -> 0.0 as in calculate_irr
+    project = calculate_irr_batch(project_cf)
+    equity = calculate_irr_batch(equity_cf)
+    project_irr = np.nan_to_num(project.irr, nan=0.0)
+    equity_irr = np.nan_to_num(equity.irr, nan=0.0)
+
+    net_fcfe_for_npv = equity_cf[:, 1:].copy()
+    if years > 0:
+        net_fcfe_for_npv[:, 0] -= equity_amount
+    fractions = np.arange(years, dtype=np.float64)
+    if dates is not None:
+        fractions = np.full(years, np.nan)
+        fractions[:min(len(dates), years)] = year_fractions(list(dates)[:years])
+        npv = calculate_xnpv_batch(net_fcfe_for_npv, fractions, values["discount_rate"])
+    else:
+        discount = (1 + values["discount_rate"])[:, None] ** np.arange(years)
+        npv = np.sum(net_fcfe_for_npv / discount, axis=1)
+
+    reached = np.cumsum(equity_cf, axis=1) >= 0
+    payback = np.where(reached.any(axis=1), reached.argmax(axis=1), years + 1).astype(np.float64)
+
+    jacobian = {}
+    if gradients:
+        d_fcfe = d_ebitda + d_principal_payment - d_interest_payment
+        d_project_cf = np.concatenate([-np.broadcast_to(d_capex, d_equity.shape)[..., None], d_ebitda - d_tax], axis=2)
+        d_equity_cf = np.concatenate([-d_equity[..., None], d_fcfe], axis=2)
+        d_net_fcfe = d_fcfe.copy()
+        if years > 0:
+            d_net_fcfe[:, :, 0] -= d_equity
+
+        # d XNPV = XNPV(d net) - d rate * XNPV(fractions * net) / (1 + rate)
+        rates = np.broadcast_to(values["discount_rate"], d_net_fcfe.shape[:2]).ravel()
+        d_npv = calculate_xnpv_batch(d_net_fcfe.reshape(-1, years), fractions, rates).reshape(d_net_fcfe.shape[:2])
+        weighted = net_fcfe_for_npv * np.nan_to_num(fractions)
+        d_npv -= unit["discount_rate"] * calculate_xnpv_batch(weighted, fractions, values["discount_rate"]) / (
+            1 + values["discount_rate"]
+        )
+        jacobian = {
+            "project_irr": dict(zip(GRADIENT_INPUTS, _irr_tangent(project_cf, d_project_cf, project.irr))),
+            "equity_irr": dict(zip(GRADIENT_INPUTS, _irr_tangent(equity_cf, d_equity_cf, equity.irr))),
+            "npv": dict(zip(GRADIENT_INPUTS, d_npv)),
+        }
+
+    yearly = {
+        "Revenue_USD": revenue,
+        "OPEX_USD": total_opex,
+        "MRA_USD": np.broadcast_to(mra_contribution, (n, years)),
+        "EBITDA_USD": ebitda,
+        "Depreciation_USD": depreciation,
+        "EBIT_USD": ebit,
+        "Tax_Rate": np.broadcast_to(tax_rate, (n, years)),
+        "Tax_USD": tax,
+        "Net_Income_USD": net_income,
+        "Debt_Service_USD": debt_service,
+        "FCFE_USD": fcfe,
+    }
+    return FinancialBatchResults(
+        params={**values, "revenue_per_mwh": price},
+        yearly=yearly,
+        project_cf=project_cf,
+        equity_cf=equity_cf,
+        project_irr=project_irr,
+        equity_irr=equity_irr,
+        npv=npv,
+        payback_years=payback,
+        project_irr_multiple=project.multiple_roots,
+        equity_irr_multiple=equity.multiple_roots,
+        gradients=jacobian,
+    )
+
+
+def _irr_tangent(cash_flows: np.ndarray, d_cash_flows: np.ndarray, irr: np.ndarray) -> np.ndarray:
+    """(K, N) IRR derivatives from (K, N, T) cash-flow tangents (implicit function theorem).
+
+    NPV(irr, cf) = 0, so d irr = -sum(d cf[t] / (1 + irr)**t) / (d NPV / d irr).
+    NaN where no IRR exists.
+    """
+    t = np.arange(cash_flows.shape[1])
+    discount = (1 / (1 + irr))[:, None] ** t
+    slope = -np.sum(t * cash_flows * discount, axis=1) / (1 + irr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return -np.sum(d_cash_flows * discount, axis=2) / slope
+
+
+def calculate_financial_jacobian(
+    solar_mwh: Union[pd.DataFrame, np.ndarray],
+    revenue_per_mwh: float,
+    cfg: FinancialConfig,
+    tax_holiday: Optional[TaxHoliday] = None,
+    mra: Optional[MRASchedule] = None,
+    dates: Optional[Sequence[Optional[pd.Timestamp]]] = None,
+) -> pd.DataFrame:
+    """Marginal sensitivities of one deal in a single forward pass.
+
+    Returns:
+        DataFrame indexed by input (GRADIENT_INPUTS) with the derivatives
+        of Project_IRR, Equity_IRR and NPV_USD (per unit of the input,
+        e.g. NPV_USD per USD of pv_cost_usd).
+    """
+    batch = run_financial_batch(
+        solar_mwh, revenue_per_mwh, cfg, tax_holiday=tax_holiday, mra=mra, dates=dates, gradients=True
+    )
+    jacobian = pd.DataFrame({
+        column: [float(batch.gradients[metric][name][0]) for name in GRADIENT_INPUTS]
+        for column, metric in (("Project_IRR", "project_irr"), ("Equity_IRR", "equity_irr"), ("NPV_USD", "npv"))
+    }, index=GRADIENT_INPUTS)
+    jacobian.index.name = "Input"
+    return jacobian
+
+
+def load_excel_equity_cashflows(file_path: Union[Path, ExcelReader]) -> Tuple[np.ndarray, float]:
     """Load actual equity cash flows from Excel Financial sheet.
     
     This extracts the Net FCFE row (row 186) which contains the actual
     dividend cash flows used in Excel's Equity IRR calculation.
     
     Args:
-        file_path: Path to Excel workbook.
+        file_path: Path to Excel workbook (or an open ExcelReader).
         
     Returns:
         Tuple of (equity_cf array, calculated IRR).
     """
-    df = pd.read_excel(file_path, sheet_name="Financial", engine="openpyxl", header=None)
-    
-    # Extract Net FCFE for all years (columns 10-34 = Years 0-24)
-    net_fcfe = []
-    for col in range(10, 35):
-        fcfe = df.iloc[186, col]
-        if pd.notna(fcfe):
-            net_fcfe.append(float(fcfe))
-    
-    equity_cf = np.array(net_fcfe)
+    with reader_session(file_path) as reader:
+        # Net FCFE for all years (columns K-AI = Years 0-24); blank cells dropped
+        net_fcfe = reader.get_range(NET_FCFE_RANGE, fill=np.nan).ravel()
+
+    equity_cf = net_fcfe[~np.isnan(net_fcfe)]
     equity_irr = calculate_irr(equity_cf)
     
     return equity_cf, equity_irr
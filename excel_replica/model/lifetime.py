@@ -2,15 +2,26 @@
 
 Applies PV and BESS degradation over 25-year project life.
 Battery augmentation occurs in Year 11 and Year 22.
+
+Two modes:
+- `simulate_lifetime`: scales Year 1 totals by the degradation factors
+  (the Excel Lifetime sheet approach).
+- `simulate_lifetime_hourly`: re-dispatches every project year hour by hour
+  with degraded PV output and BESS capacity, capturing clipping and SOC
+  saturation effects that plain scaling misses.
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from excel_replica.model.calc_engine import CalcConfig, run_calc_batch
+from excel_replica.inputs.loss_factors import load_loss_factors
+from excel_replica.utils.excel_reader import ExcelReader
+
 
 @dataclass
 class DegradationSchedule:
@@ -26,31 +37,9 @@ class LifetimeResults:
     totals: Dict[str, float] = field(default_factory=dict)
 
 
-def load_degradation_from_excel(file_path: Path) -> DegradationSchedule:
-    """Load degradation schedule from Loss sheet."""
-    df = pd.read_excel(file_path, sheet_name="Loss", engine="openpyxl", header=None)
-
-    # Find the data rows (Year 1-25)
-    # Column structure: Year, Battery Loss, Battery, PV Loss, PV, Battery wt Replacement
-    years = 25
-    pv_factor = np.ones(years)
-    bess_factor = np.ones(years)
-
-    # Parse the Loss sheet - data starts at row 1 (0-indexed after header)
-    for i in range(years):
-        row_idx = i + 2  # Skip header rows
-        if row_idx < len(df):
-            # PV factor is in column 5 (index 4)
-            pv_val = df.iloc[row_idx, 4]
-            if pd.notna(pv_val) and isinstance(pv_val, (int, float)):
-                pv_factor[i] = float(pv_val)
-
-            # BESS factor with replacement is in column 6 (index 5)
-            bess_val = df.iloc[row_idx, 5]
-            if pd.notna(bess_val) and isinstance(bess_val, (int, float)):
-                bess_factor[i] = float(bess_val)
-
-    return DegradationSchedule(pv_factor=pv_factor, bess_factor=bess_factor)
+def load_degradation_from_excel(file_path: Union[Path, ExcelReader]) -> DegradationSchedule:
+    """Load degradation schedule from Loss sheet (path or open ExcelReader)."""
+    return DegradationSchedule(**load_loss_factors(file_path))
 
 
 def simulate_lifetime(
@@ -104,3 +93,75 @@ def simulate_lifetime(
     }
 
     return LifetimeResults(yearly=yearly, totals=totals)
+
+
+def simulate_lifetime_hourly(
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    degradation: DegradationSchedule,
+    project_years: int = 25,
+    backend: str = "auto",
+) -> LifetimeResults:
+    """Re-dispatch every project year hour by hour with in-loop degradation.
+
+    Year y uses solar_kw * pv_factor[y] and a usable BESS capacity of
+    cfg.bess_capacity_kwh * bess_factor[y] (power rating unchanged). Like the
+    Excel Calc sheet, each year starts with an empty battery, so the years are
+    independent and are advanced in lockstep by `run_calc_batch`.
+
+    Args:
+        solar_kw: Year 1 solar generation per step (kW).
+        load_kw: Load demand per step (kW), repeated every year.
+        period_flags: TOU period flags or int8 period codes.
+        allow_discharge: Boolean array for discharge permission.
+        cfg: Year 1 CalcConfig.
+        degradation: DegradationSchedule with PV and BESS factors.
+        project_years: Number of years (default 25).
+        backend: Dispatch backend ('python', 'numba' or 'auto').
+
+    Returns:
+        LifetimeResults with yearly DataFrame and totals.
+    """
+    years = list(range(1, project_years + 1))
+    pv_factor = np.asarray(degradation.pv_factor[:project_years], dtype=np.float64)
+    bess_factor = np.asarray(degradation.bess_factor[:project_years], dtype=np.float64)
+
+    solar_stack = pv_factor[:, None] * np.asarray(solar_kw, dtype=np.float64)[None, :]
+    batch = run_calc_batch(
+        solar_stack,
+        load_kw,
+        period_flags,
+        allow_discharge,
+        cfg,
+        bess_capacity_kwh=cfg.bess_capacity_kwh * bess_factor,
+        backend=backend,
+    )
+    outputs = batch.outputs
+
+    yearly = pd.DataFrame({
+        "Year": years,
+        "PV_Factor": pv_factor,
+        "BESS_Factor": bess_factor,
+        "SolarGen_MWh": outputs["solar_gen_mwh"],
+        "DirectPV_MWh": outputs["direct_pv_mwh"],
+        "Charge_MWh": outputs["charge_mwh"],
+        "Discharge_MWh": outputs["discharge_mwh"],
+        "Surplus_MWh": outputs["power_surplus_mwh"],
+        "GridLoad_MWh": outputs["grid_load_mwh"],
+        "TOUCost": outputs["total_tou_cost"],
+    })
+
+    totals = {
+        "total_solar_gen_mwh": float(np.sum(outputs["solar_gen_mwh"])),
+        "total_discharge_mwh": float(np.sum(outputs["discharge_mwh"])),
+        "total_surplus_mwh": float(np.sum(outputs["power_surplus_mwh"])),
+        "total_direct_pv_mwh": float(np.sum(outputs["direct_pv_mwh"])),
+        "total_charge_mwh": float(np.sum(outputs["charge_mwh"])),
+        "total_grid_load_mwh": float(np.sum(outputs["grid_load_mwh"])),
+        "total_tou_cost": float(np.sum(outputs["total_tou_cost"])),
+    }
+
+    return LifetimeResults(yearly=yearly, totals=totals)
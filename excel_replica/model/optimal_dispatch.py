@@ -0,0 +1,231 @@
+"""Optimal BESS dispatch by linear programming.
+
+Upper-bound benchmark for the rule-based Calc dispatch: for the same solar,
+load, BESS limits and TOU tariffs, choose charge/discharge per step to
+minimise the TOU grid cost. The battery still charges only from excess solar
+and discharges only into net load, exactly as in the Calc sheet, so the
+saving over `run_calc` is what a perfect-foresight controller could add.
+
+The year is solved as rolling windows (default: commit 24 h, look ahead
+48 h) with scipy's HiGHS solver. Each window is a small sparse LP:
+
+    variables  c_t (charge, kWh in), e_t (discharge, kWh out), x_t (SOC)
+    minimise   sum(-tariff_t * e_t + eps * c_t)
+    subject to x_t = x_{t-1} + eff * c_t - e_t / eff
+               0 <= c_t <= min(excess solar, power) * step
+               0 <= e_t <= min(net load - target, power) * step  (0 if not allowed)
+               floor_t <= x_t <= capacity
+where floor_t is the reserve, or while a battery starting below the reserve
+has not yet reached it, the SOC reachable by charging every available step
+(so energy at or below the reserve is never discharged and never free).
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.optimize import linprog
+
+from excel_replica.model.calc_engine import (
+    CalcConfig,
+    CalcResults,
+    encode_tou_periods,
+    replay_schedule,
+    run_calc,
+    tou_tariff_table,
+)
+
+
+# Tiny cost on charging so equal-value schedules do not charge energy that is
+# never discharged (keeps charge/surplus totals meaningful)
+CHARGE_PENALTY = 1e-9
+
+
+@dataclass
+class OptimalDispatchResults:
+    """LP dispatch results and solver statistics."""
+    calc: CalcResults
+    windows: int = 0
+    solve_seconds: float = 0.0
+    objective_saving: float = 0.0  # TOU cost avoided by discharge (sum of tariff x discharge)
+
+
+@dataclass
+class DispatchBenchmark:
+    """TOU cost of no BESS, the Excel-replica rule and the LP optimum."""
+    no_bess_tou_cost: float
+    rule_tou_cost: float
+    optimal_tou_cost: float
+    outputs: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def rule_savings(self) -> float:
+        return self.no_bess_tou_cost - self.rule_tou_cost
+
+    @property
+    def optimal_savings(self) -> float:
+        return self.no_bess_tou_cost - self.optimal_tou_cost
+
+    @property
+    def capture_ratio(self) -> float:
+        """Share of the optimal TOU savings achieved by the rule-based dispatch."""
+        if self.optimal_savings <= 0:
+            return 1.0
+        return self.rule_savings / self.optimal_savings
+
+
+def _soc_balance_matrix(n: int, efficiency: float) -> sparse.csr_matrix:
+    """Equality rows x_t - x_{t-1} - eff*c_t + e_t/eff = 0 for one window.
+
+    Columns are [c_0..c_{n-1}, e_0..e_{n-1}, x_0..x_{n-1}]; the initial SOC
+    enters through the right-hand side of row 0.
+    """
+    eye = sparse.identity(n, format="csr")
+    shift = sparse.eye(n, k=-1, format="csr")
+    return sparse.hstack([-efficiency * eye, eye / efficiency, eye - shift], format="csr")
+
+
+def run_optimal_dispatch(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    window_steps: Optional[int] = None,
+    horizon_steps: Optional[int] = None,
+    initial_soc_kwh: float = 0.0,
+) -> OptimalDispatchResults:
+    """Solve TOU-optimal dispatch over rolling windows.
+
+    Args:
+        datetime_series, solar_kw, load_kw, period_flags, allow_discharge,
+            cfg: As for `run_calc` (reserve_soc_kwh and discharge_target_kw
+            are honoured; min_soc_kwh, a threshold in Excel, is not binding).
+        window_steps: Steps committed per solve (default: one day).
+        horizon_steps: Steps optimised per solve, >= window_steps (default:
+            two days, so evening discharge sees the next day's solar).
+        initial_soc_kwh: SOC before the first step.
+
+    Returns:
+        OptimalDispatchResults whose `calc` is comparable with `run_calc`.
+    """
+    step_hours = float(cfg.step_hours)
+    steps_per_day = max(int(round(24 / step_hours)), 1)
+    window_steps = window_steps or steps_per_day
+    horizon_steps = max(horizon_steps or 2 * steps_per_day, window_steps)
+
+    solar = np.asarray(solar_kw, dtype=np.float64)
+    load = np.asarray(load_kw, dtype=np.float64)
+    allow = np.asarray(allow_discharge, dtype=bool)
+    tariff = tou_tariff_table(cfg)[encode_tou_periods(period_flags)]
+    efficiency = float(cfg.bess_efficiency)
+
+    # Per-step bounds for the whole year; windows slice them
+    max_step = cfg.bess_power_kw * step_hours
+    charge_ub = np.minimum(np.maximum(solar - load, 0.0) * step_hours, max_step)
+    discharge_ub = np.where(
+        allow, np.minimum(np.maximum(load - solar - cfg.discharge_target_kw, 0.0) * step_hours, max_step), 0.0
+    )
+    soc_ub = cfg.bess_capacity_kwh
+    # Starting below the reserve, the SOC must climb to it by charging (as
+    # fast as excess solar allows) rather than start there for free
+    reserve = min(cfg.reserve_soc_kwh, cfg.bess_capacity_kwh)
+    reachable = float(initial_soc_kwh) + np.cumsum(efficiency * charge_ub)
+    soc_lb = np.minimum(reserve, np.maximum(reachable, float(initial_soc_kwh)))
+
+    hours = len(load)
+    charge = np.zeros(hours)
+    discharge = np.zeros(hours)
+    soc = np.zeros(hours)
+
+    # The SOC balance matrix depends only on the window length: build once
+    # per length and reuse it for every window (only bounds and rhs change)
+    matrices: Dict[int, sparse.csr_matrix] = {}
+    current_soc = float(initial_soc_kwh)
+    windows = 0
+    objective_saving = 0.0
+    start_time = time.perf_counter()
+
+    for start in range(0, hours, window_steps):
+        stop = min(start + horizon_steps, hours)
+        n = stop - start
+        if n not in matrices:
+            matrices[n] = _soc_balance_matrix(n, efficiency)
+
+        b_eq = np.zeros(n)
+        b_eq[0] = current_soc
+        bounds = np.concatenate([
+            np.column_stack([np.zeros(n), charge_ub[start:stop]]),
+            np.column_stack([np.zeros(n), discharge_ub[start:stop]]),
+            np.column_stack([soc_lb[start:stop], np.full(n, soc_ub)]),
+        ])
+        objective = np.concatenate([np.full(n, CHARGE_PENALTY), -tariff[start:stop], np.zeros(n)])
+
+        solution = linprog(objective, A_eq=matrices[n], b_eq=b_eq, bounds=bounds, method="highs")
+        if solution.status != 0:
+            raise RuntimeError(f"LP dispatch failed for steps {start}-{stop}: {solution.message}")
+
+        commit = min(window_steps, n)
+        # Clip solver round-off so the schedule stays within the physical limits
+        charge[start:start + commit] = np.clip(solution.x[:commit], 0.0, charge_ub[start:start + commit])
+        discharge[start:start + commit] = np.clip(solution.x[n:n + commit], 0.0, discharge_ub[start:start + commit])
+        soc[start:start + commit] = np.clip(solution.x[2 * n:2 * n + commit], soc_lb[start:start + commit], soc_ub)
+        objective_saving += float(tariff[start:start + commit] @ discharge[start:start + commit])
+        current_soc = soc[start + commit - 1]
+        windows += 1
+
+    calc = replay_schedule(
+        datetime_series, solar, load, period_flags, charge, discharge, soc, cfg,
+    )
+    return OptimalDispatchResults(
+        calc=calc,
+        windows=windows,
+        solve_seconds=time.perf_counter() - start_time,
+        objective_saving=objective_saving,
+    )
+
+
+def benchmark_dispatch(
+    datetime_series: pd.Series,
+    solar_kw: np.ndarray,
+    load_kw: np.ndarray,
+    period_flags: np.ndarray,
+    allow_discharge: np.ndarray,
+    cfg: CalcConfig,
+    rule_results: Optional[CalcResults] = None,
+    **lp_options,
+) -> Tuple[DispatchBenchmark, OptimalDispatchResults]:
+    """Compare the Excel-replica dispatch with the LP upper bound.
+
+    Args:
+        rule_results: Existing `run_calc` results to reuse (computed otherwise).
+        **lp_options: Passed to `run_optimal_dispatch`.
+
+    Returns:
+        (DispatchBenchmark, OptimalDispatchResults)
+    """
+    args = (datetime_series, solar_kw, load_kw, period_flags, allow_discharge)
+    if rule_results is None:
+        rule_results = run_calc(*args, cfg, outputs_only=True)
+    optimal = run_optimal_dispatch(*args, cfg, **lp_options)
+
+    no_bess = np.maximum(np.asarray(load_kw, dtype=np.float64) - np.asarray(solar_kw, dtype=np.float64), 0.0)
+    tariff = tou_tariff_table(cfg)[encode_tou_periods(period_flags)]
+    no_bess_cost = float(np.sum(no_bess * cfg.step_hours * tariff))
+
+    benchmark = DispatchBenchmark(
+        no_bess_tou_cost=no_bess_cost,
+        rule_tou_cost=float(rule_results.outputs["total_tou_cost"]),
+        optimal_tou_cost=float(optimal.calc.outputs["total_tou_cost"]),
+        outputs={
+            "rule_discharge_mwh": float(rule_results.outputs["discharge_mwh"]),
+            "optimal_discharge_mwh": float(optimal.calc.outputs["discharge_mwh"]),
+            "lp_windows": optimal.windows,
+            "lp_solve_seconds": optimal.solve_seconds,
+        },
+    )
+    return benchmark, optimal
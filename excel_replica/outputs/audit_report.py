@@ -2,12 +2,14 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 import pandas as pd
 import numpy as np
 
+from excel_replica.utils.excel_reader import ExcelReader, reader_session
+
 
 @dataclass
 class ComparisonResult:
@@ -20,19 +22,29 @@ class ComparisonResult:
     passed: bool
 
 
-def load_excel_truth(file_path: Path) -> Dict[str, float]:
-    """Load truth values from Excel sheets."""
+def load_excel_truth(file_path: Union[Path, ExcelReader]) -> Dict[str, float]:
+    """Load truth values from Excel sheets (path or open ExcelReader).
+
+    Reading through a reader with overrides (e.g. recalculated scenario
+    values from `excel_replica.utils.formula_engine`) gives the scenario's
+    truth without a recalculated workbook on disk.
+    """
+    with reader_session(file_path) as reader:
+        return _load_excel_truth(reader)
+
+
+def _load_excel_truth(reader: ExcelReader) -> Dict[str, float]:
     truth = {}
 
     # Calc sheet truth
-    calc_df = pd.read_excel(file_path, sheet_name="Calc", engine="openpyxl")
+    calc_df = reader.get_df("Calc")
     truth["solar_gen_mwh"] = calc_df["SolarGen_kW"].sum() / 1000
     truth["discharge_mwh"] = calc_df["DischargeEnergy_kWh"].sum() / 1000
     truth["power_surplus_mwh"] = calc_df["PowerSurplus_kW"].sum() / 1000
     truth["charge_mwh"] = calc_df["PVCharged_kWh"].sum() / 1000
 
     # Financial sheet truth
-    fin_df = pd.read_excel(file_path, sheet_name="Financial", engine="openpyxl", header=None)
+    fin_df = reader.get_sheet("Financial")
     truth["project_irr"] = fin_df.iloc[122, 6] if pd.notna(fin_df.iloc[122, 6]) else 0.0
     truth["equity_irr"] = fin_df.iloc[188, 6] if pd.notna(fin_df.iloc[188, 6]) else 0.0
     truth["npv_usd"] = fin_df.iloc[192, 6] if pd.notna(fin_df.iloc[192, 6]) else 0.0
@@ -40,7 +52,7 @@ def load_excel_truth(file_path: Path) -> Dict[str, float]:
     
     # Extract actual equity cash flows for IRR validation
     from excel_replica.model.financial import load_excel_equity_cashflows
-    _, excel_equity_irr = load_excel_equity_cashflows(file_path)
+    _, excel_equity_irr = load_excel_equity_cashflows(reader)
     truth["excel_equity_irr_calc"] = excel_equity_irr
 
     return truth
@@ -184,16 +196,35 @@ def generate_markdown_report(
     return report
 
 
-def run_audit(excel_path: Path, output_path: Path = None) -> Tuple[List[ComparisonResult], str]:
-    """Run full audit and generate report."""
+def run_audit(
+    excel_path: Path,
+    output_path: Path = None,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[ComparisonResult], str]:
+    """Run full audit and generate report.
+
+    Args:
+        excel_path: Workbook to audit.
+        output_path: Markdown report path.
+        overrides: Cell overrides ({"Assumption!K18": 30.0, ...}) applied
+            to both the model inputs and the Excel truth. Pass the
+            recalculated values of a scenario (`RecalcResult.overrides()`)
+            to audit it without an Excel recalculation.
+    """
+    from excel_replica.inputs.project import load_project_inputs
     from excel_replica.run_pipeline import PipelineConfig, run_pipeline
 
     if output_path is None:
         output_path = Path(__file__).parent / "audit_report.md"
 
+    # Inputs and truth come from one workbook session
+    with ExcelReader(Path(excel_path), overrides=overrides) as reader:
+        inputs = load_project_inputs(reader, include_dppa=False)
+        excel_truth = load_excel_truth(reader)
+
     # Run Python model
-    config = PipelineConfig(excel_path=excel_path, run_dppa=False)
-    results = run_pipeline(config)
+    config = PipelineConfig(excel_path=excel_path, run_dppa=False, keep_hourly=False)
+    results = run_pipeline(config, inputs=inputs)
 
     # Build Python results dict
     python_results = {
@@ -208,9 +239,6 @@ def run_audit(excel_path: Path, output_path: Path = None) -> Tuple[List[Comparis
         "excel_equity_irr_calc": results.financial.equity_irr,
     }
 
-    # Load Excel truth
-    excel_truth = load_excel_truth(excel_path)
-
     # Compare
     comparisons = compare_metrics(python_results, excel_truth)
 
@@ -9,34 +9,27 @@ Combines all modules:
 6. Generate summary report
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Dict, Optional
 
-import numpy as np
-import pandas as pd
-
-from excel_replica.model.calc_engine import CalcConfig, CalcResults, run_calc
+from excel_replica.inputs.assumptions import load_calc_config, load_financial_config
+from excel_replica.inputs.project import ProjectInputs, load_project_inputs
+from excel_replica.model.calc_engine import CalcResults, run_calc
 from excel_replica.model.lifetime import (
-    DegradationSchedule,
     LifetimeResults,
-    load_degradation_from_excel,
     simulate_lifetime,
+    simulate_lifetime_hourly,
 )
 from excel_replica.model.financial import (
-    FinancialConfig,
     FinancialResults,
-    TaxHoliday,
-    MRASchedule,
     run_financial_model,
 )
+from excel_replica.model.dispatch import prepare_dispatch
 from excel_replica.model.dppa import (
-    DPPAConfig,
     DPPAResults,
     calculate_dppa_hourly,
-    load_dppa_config_from_excel,
 )
-from excel_replica.utils.excel_reader import ExcelReader
 
 
 @dataclass
@@ -46,6 +39,12 @@ class PipelineConfig:
     revenue_per_mwh: float = 49.59  # USD/MWh
     run_dppa: bool = True
     voltage_level_kv: int = 22
+    keep_hourly: bool = True  # False skips the hourly Calc DataFrame (totals only)
+    lifetime_mode: str = "hourly"  # "hourly" re-dispatches each year, "scaled" scales Year 1
+    dispatch_strategy: str = "excel_clone"  # See excel_replica.model.dispatch.STRATEGIES
+    dispatch_params: Optional[Dict[str, float]] = None  # e.g. {"target_kw": 15000.0} for peak_shaving
+    profiles_path: Optional[Path] = None  # .npy bundle from excel_replica.inputs.profiles (skips the Calc sheet)
+    load_workers: Optional[int] = None  # Processes parsing sheets at startup (None = one per sheet, 1 = sequential)
 
 
 @dataclass
@@ -58,130 +57,75 @@ class PipelineResults:
     summary: Dict[str, float] = None
 
 
-def load_calc_config(reader: ExcelReader) -> CalcConfig:
-    """Load BESS and tariff configuration using named ranges."""
-    total_capacity_kwh = reader.get_value("Total_BESS_Storage_Capacity", 66000.0)
-    power_kw = reader.get_value("Total_BESS_Power_Output", 20000.0)
-    dod = reader.get_value("DoD", 0.85)
-    efficiency = reader.get_value("Charge_discharge_efficiency", 0.95)
-    min_soc = reader.get_value("Min_Reserve_SOC", 0.0)
-
-    usable_capacity_kwh = total_capacity_kwh * dod
-
-    exchange_rate = reader.get_value("Exchange_rate", 25455.0)
-    ca_normal_vnd = reader.get_value("Ca_normal", 1253.0)
-    ca_peak_vnd = reader.get_value("Ca_peak", 2162.0)
-    ca_offpeak_vnd = reader.get_value("Ca_offpeak", 843.0)
-
-    ca_normal = float(ca_normal_vnd) / float(exchange_rate)
-    ca_peak = float(ca_peak_vnd) / float(exchange_rate)
-    ca_offpeak = float(ca_offpeak_vnd) / float(exchange_rate)
-
-    return CalcConfig(
-        step_hours=1.0,
-        bess_capacity_kwh=usable_capacity_kwh,
-        bess_power_kw=power_kw,
-        bess_efficiency=efficiency,
-        min_soc_kwh=min_soc,
-        ca_peak=ca_peak,
-        ca_normal=ca_normal,
-        ca_offpeak=ca_offpeak,
-    )
-
-
-def load_financial_config(reader: ExcelReader) -> FinancialConfig:
-    """Load financial configuration using named ranges."""
-    solar_kwp = reader.get_value("Actual_installation_capacity", 40360.0)
-    solar_mwp = solar_kwp / 1000.0
-    bess_mwh = reader.get_value("Total_BESS_Storage_Capacity", 66000.0) / 1000.0
-
-    # Get debt parameters
-    base_rate = reader.get_value("Debt_Base_Rate", 0.02)
-    margin = reader.get_value("Debt_Margin", 0.065)
-    interest_rate = base_rate + margin
-
-    debt_size = reader.get_value("Final_Debt_Size", 24_584_997)
-    total_capex = reader.get_value("Total_CAPEX", 49_513_200)
-    leverage_ratio = debt_size / total_capex
-
-    return FinancialConfig(
-        land_cost_usd=reader.get_value("Land_acquisition", 1_200_000),
-        bop_cost_usd=4_843_200, # Handled as fixed in Excel
-        pv_cost_usd=solar_mwp * 750_000,
-        bess_cost_usd=bess_mwh * 200_000,
-        om_pv_usd=242_160,
-        om_bess_usd=132_000,
-        insurance_pv_usd=75_675,
-        insurance_bess_usd=33_000,
-        other_opex_usd=161_440,
-        land_lease_usd=0,
-        leverage_ratio=leverage_ratio,
-        debt_tenor_years=10,  # Excel uses 10-year debt tenor
-        interest_rate=interest_rate,
-        discount_rate=0.10,
-    )
-
-
-def run_pipeline(config: PipelineConfig) -> PipelineResults:
+def run_pipeline(config: PipelineConfig, inputs: Optional[ProjectInputs] = None) -> PipelineResults:
     """Run the full model pipeline.
 
     Args:
         config: PipelineConfig with Excel path and options.
+        inputs: Preloaded ProjectInputs (e.g. shared by parallel runs);
+            loaded from `config.excel_path` when omitted.
 
     Returns:
         PipelineResults with all module outputs.
     """
-    print(f"Loading Excel: {config.excel_path}")
-
-    # Initialize Excel reader
-    reader = ExcelReader(config.excel_path)
-
-    # Load Calc sheet data
-    calc_df = reader.get_df("Calc")
-
-    datetime_series = pd.to_datetime(calc_df["DateTime"])
-    solar_kw = calc_df["SolarGen_kW"].astype(float).to_numpy()
-    load_kw = calc_df["Load_kW"].astype(float).to_numpy()
-    period_flags = calc_df["TimePeriodFlag"].astype(str).str.upper().to_numpy()
-
-    # Discharge permission
-    if "DischargeConditionFlag" in calc_df.columns:
-        allow_discharge = calc_df["DischargeConditionFlag"].astype(bool).to_numpy()
-    else:
-        allow_discharge = np.isin(period_flags, ["P", "N"])
+    if inputs is None:
+        print(f"Loading Excel: {config.excel_path}")
+        inputs = load_project_inputs(
+            config.excel_path,
+            profiles_path=config.profiles_path,
+            include_dppa=config.run_dppa,
+            max_workers=config.load_workers,
+        )
 
-    # Load configurations
-    calc_cfg = load_calc_config(reader)
-    fin_cfg = load_financial_config(reader)
+    calc_cfg = replace(inputs.calc)
+    fin_cfg = inputs.financial
+    degradation = inputs.degradation
+    dppa_cfg = inputs.dppa
+    excel_ebitda = inputs.excel_ebitda
+    excel_net_fcfe = inputs.excel_net_fcfe
+    excel_dates = inputs.excel_dates
+
+    profiles = inputs.profiles
+    datetime_series = profiles.datetime_series
+    solar_kw = profiles.solar_kw
+    load_kw = profiles.load_kw
+    period_flags = profiles.period_flags
+    allow_discharge = profiles.allow_discharge
+
+    allow_discharge, calc_cfg = prepare_dispatch(
+        config.dispatch_strategy, allow_discharge, period_flags, calc_cfg, **(config.dispatch_params or {})
+    )
 
     print(f"BESS: {calc_cfg.bess_capacity_kwh:.0f} kWh, {calc_cfg.bess_power_kw:.0f} kW")
     print(f"CAPEX: ${fin_cfg.land_cost_usd + fin_cfg.bop_cost_usd + fin_cfg.pv_cost_usd + fin_cfg.bess_cost_usd:,.0f}")
 
     # Step 1: Run Calc engine
     print("\n[1/4] Running Calc engine...")
-    calc_results = run_calc(datetime_series, solar_kw, load_kw, period_flags, allow_discharge, calc_cfg)
+    calc_results = run_calc(
+        datetime_series, solar_kw, load_kw, period_flags, allow_discharge, calc_cfg,
+        outputs_only=not config.keep_hourly,
+    )
 
     # Step 2: Run Lifetime simulation
     print("[2/4] Running Lifetime simulation...")
-    degradation = load_degradation_from_excel(config.excel_path)
-
-    year1_outputs = {
-        "solar_gen_mwh": calc_results.outputs["solar_gen_mwh"],
-        "discharge_mwh": calc_results.outputs["discharge_mwh"],
-        "power_surplus_mwh": calc_results.outputs["power_surplus_mwh"],
-        "direct_pv_mwh": calc_results.outputs["direct_pv_mwh"],
-        "charge_mwh": calc_results.outputs["charge_mwh"],
-    }
-    lifetime_results = simulate_lifetime(year1_outputs, degradation)
+    if config.lifetime_mode == "hourly":
+        lifetime_results = simulate_lifetime_hourly(
+            solar_kw, load_kw, period_flags, allow_discharge, calc_cfg, degradation
+        )
+    elif config.lifetime_mode == "scaled":
+        year1_outputs = {
+            "solar_gen_mwh": calc_results.outputs["solar_gen_mwh"],
+            "discharge_mwh": calc_results.outputs["discharge_mwh"],
+            "power_surplus_mwh": calc_results.outputs["power_surplus_mwh"],
+            "direct_pv_mwh": calc_results.outputs["direct_pv_mwh"],
+            "charge_mwh": calc_results.outputs["charge_mwh"],
+        }
+        lifetime_results = simulate_lifetime(year1_outputs, degradation)
+    else:
+        raise ValueError(f"Unknown lifetime_mode '{config.lifetime_mode}'. Expected 'hourly' or 'scaled'.")
 
     # Step 3: Run Financial model
     print("[3/4] Running Financial model...")
-    # Load Excel EBITDA/Net FCFE/dates for exact match
-    from excel_replica.model.financial import load_excel_ebitda, load_excel_net_fcfe, load_excel_dates
-    excel_ebitda = load_excel_ebitda(config.excel_path)
-    excel_net_fcfe = load_excel_net_fcfe(config.excel_path)
-    excel_dates = load_excel_dates(config.excel_path)
-    
     financial_results = run_financial_model(
         lifetime_results.yearly,
         revenue_per_mwh=config.revenue_per_mwh,
@@ -195,7 +139,6 @@ def run_pipeline(config: PipelineConfig) -> PipelineResults:
     dppa_results = None
     if config.run_dppa:
         print("[4/4] Running DPPA pricing...")
-        dppa_cfg = load_dppa_config_from_excel(reader)
         dppa_results = calculate_dppa_hourly(
             datetime_series, solar_kw, load_kw, period_flags, dppa_cfg, config.voltage_level_kv
         )
@@ -0,0 +1,170 @@
+"""Persistent on-disk cache of parsed workbook data.
+
+Parsing the 8,760-row Calc sheet and the Financial/Loss/Assumption sheets
+with openpyxl takes seconds; every pipeline, sensitivity and Monte Carlo run
+used to pay it again. `WorkbookCache` stores parsed sheets (pickled
+DataFrames, which keep mixed-type sheet cells exact) and named-range scalars
+(JSON) under a directory keyed by the SHA-256 of the workbook contents, so a
+changed workbook never hits stale data.
+
+Hashing a large workbook costs a full read, so the hash is memoised in an
+index keyed by path, size and mtime; it is recomputed only when the file's
+size or mtime changes.
+
+The cache directory defaults to `$EXCEL_REPLICA_CACHE_DIR`, else
+`~/.cache/excel_replica`.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+CACHE_VERSION = 1
+CACHE_DIR_ENV = "EXCEL_REPLICA_CACHE_DIR"
+
+_MISSING = object()
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from the environment, else ~/.cache/excel_replica."""
+    return Path(os.environ.get(CACHE_DIR_ENV, Path.home() / ".cache" / "excel_replica"))
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write(path: Path, write) -> None:
+    """Write via a temporary file and rename, so readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _safe_name(name: str) -> str:
+    """File-system-safe, collision-free name for a sheet or frame key."""
+    slug = re.sub(r"[^A-Za-z0-9_.-]", "_", name)[:40]
+    return f"{slug}-{hashlib.sha1(name.encode()).hexdigest()[:8]}"
+
+
+def _to_json_scalar(value: Any) -> Any:
+    """Return a JSON-safe version of a cell value, or _MISSING if not cacheable."""
+    if value is None:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return _MISSING
+
+
+class WorkbookCache:
+    """On-disk cache for one workbook, keyed by its content hash."""
+
+    def __init__(self, excel_path: Path, cache_dir: Optional[Path] = None):
+        self.excel_path = Path(excel_path)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.content_hash = self._content_hash()
+        self.entry_dir = self.cache_dir / f"v{CACHE_VERSION}" / self.content_hash[:32]
+        self._values: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def _content_hash(self) -> str:
+        """Hash of the workbook, reusing the memoised value while size/mtime match."""
+        stat = self.excel_path.stat()
+        index_path = self.cache_dir / "index.json"
+        key = str(self.excel_path.resolve())
+        signature = [stat.st_size, stat.st_mtime_ns]
+
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = {}
+
+        entry = index.get(key)
+        if entry is not None and entry.get("signature") == signature:
+            return entry["sha256"]
+
+        content_hash = file_sha256(self.excel_path)
+        index[key] = {"signature": signature, "sha256": content_hash}
+        atomic_write(index_path, lambda tmp: Path(tmp).write_text(json.dumps(index, indent=1)))
+        return content_hash
+
+    # DataFrames (raw sheets and get_df results)
+
+    def _frame_path(self, kind: str, name: str) -> Path:
+        return self.entry_dir / f"{kind}__{_safe_name(name)}.pkl"
+
+    def load_frame(self, kind: str, name: str) -> Optional[pd.DataFrame]:
+        """Return a cached DataFrame, or None on a miss."""
+        path = self._frame_path(kind, name)
+        if not path.exists():
+            return None
+        try:
+            return pd.read_pickle(path)
+        except Exception:
+            # Corrupt or incompatible entry: treat as a miss and overwrite later
+            return None
+
+    def store_frame(self, kind: str, name: str, df: pd.DataFrame) -> None:
+        """Persist a DataFrame."""
+        atomic_write(self._frame_path(kind, name), df.to_pickle)
+
+    # Named-range scalars
+
+    def _values_path(self) -> Path:
+        return self.entry_dir / "values.json"
+
+    def _load_values(self) -> Dict[str, Any]:
+        if self._values is None:
+            try:
+                self._values = json.loads(self._values_path().read_text())
+            except (OSError, ValueError):
+                self._values = {}
+        return self._values
+
+    def get_value(self, address: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cell address such as 'Assumption!$E$25'."""
+        values = self._load_values()
+        if address in values:
+            return True, values[address]
+        return False, None
+
+    def set_value(self, address: str, value: Any) -> None:
+        """Record a cell value (skipped for non-JSON types such as dates).
+
+        Values are buffered and written by `flush`.
+        """
+        value = _to_json_scalar(value)
+        if value is _MISSING:
+            return
+        self._load_values()[address] = value
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write buffered named-range values to disk."""
+        if not self._dirty:
+            return
+        values = self._values
+        atomic_write(self._values_path(), lambda tmp: Path(tmp).write_text(json.dumps(values, indent=1)))
+        self._dirty = False
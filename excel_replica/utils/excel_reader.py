@@ -1,71 +1,596 @@
 """Excel file IO helpers using named ranges."""
 
+import copy
 import json
+import os
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
 
+from excel_replica.utils.excel_cache import WorkbookCache
+
+
+# Strings pandas.read_excel treats as missing (its default na_values)
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def _column_index(col_str: str) -> int:
+    """Convert an Excel column (A, B, ..., AA) to a 0-indexed integer."""
+    col_idx = 0
+    for char in col_str:
+        col_idx = col_idx * 26 + (ord(char) - ord('A') + 1)
+    return col_idx - 1
+
+
+def parse_cell_address(address: str) -> Optional[Tuple[str, int, int]]:
+    """Parse "Assumption!$E$25", "Assumption!E25" or "'Other Input'!$D$21" to (sheet, row, col), 0-indexed.
+
+    For a range address the first cell is returned.
+    """
+    match = re.match(r"['\"]?([^!]+)['\"]?!\$?([A-Z]+)\$?(\d+)", address)
+    if not match:
+        return None
+
+    sheet_name, col_str, row_str = match.groups()
+    sheet_name = sheet_name.strip("'\"")
+
+    # Excel rows are 1-indexed
+    return sheet_name, int(row_str) - 1, _column_index(col_str)
+
+
+def parse_range_address(address: str) -> Optional[Tuple[str, int, int, int, int]]:
+    """Parse "Measures!$G$56:$G$57" to (sheet, first_row, first_col, last_row, last_col).
+
+    Indices are 0-indexed and inclusive; a single-cell address gives a 1x1 range.
+    """
+    match = re.match(
+        r"['\"]?([^!]+)['\"]?!\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$", address
+    )
+    if not match:
+        return None
+
+    sheet_name, col_str, row_str, last_col_str, last_row_str = match.groups()
+    sheet_name = sheet_name.strip("'\"")
+    first_row, first_col = int(row_str) - 1, _column_index(col_str)
+    if last_col_str is None:
+        return sheet_name, first_row, first_col, first_row, first_col
+    last_row, last_col = int(last_row_str) - 1, _column_index(last_col_str)
+    return (
+        sheet_name,
+        min(first_row, last_row), min(first_col, last_col),
+        max(first_row, last_row), max(first_col, last_col),
+    )
+
+
+CellOverrides = Dict[Tuple[str, int, int], Any]
+
+
+def parse_overrides(overrides: Optional[Dict[str, Any]]) -> CellOverrides:
+    """Map {"Assumption!K18": 30.0, ...} to {(sheet, row, col): value}, 0-indexed.
+
+    Raises:
+        ValueError: If an address is not a single cell reference.
+    """
+    parsed = {}
+    for address, value in (overrides or {}).items():
+        cell = parse_cell_address(address)
+        if cell is None or ":" in address:
+            raise ValueError(f"Override address must be a single cell such as 'Assumption!K18': {address}")
+        parsed[cell] = value
+    return parsed
+
+
+def _fits(dtype: Any, column_dtype: Any) -> bool:
+    """True if values of `dtype` can be stored in a column of `column_dtype` unchanged."""
+    try:
+        return np.can_cast(dtype, column_dtype, casting="same_kind")
+    except TypeError:  # pandas extension dtypes (e.g. string)
+        return False
+
+
+def _set_cell(df: pd.DataFrame, row: Any, col: Any, value: Any) -> None:
+    """Set one cell in place, widening the column to object if the value does not fit its dtype."""
+    if col in df.columns:
+        dtype = df[col].dtype
+        if not _fits(np.asarray(value).dtype, dtype):
+            df[col] = df[col].astype(object)
+    df.loc[row, col] = value
+
+
+def _patch_frame(df: pd.DataFrame, cells: Dict[Tuple[Any, Any], Any]) -> None:
+    """Set many cells in place, one vectorized assignment per column.
+
+    Recalculated scenarios override whole columns of formula cells, so
+    patching goes column by column rather than cell by cell. Cells outside
+    the frame extend it, as `_set_cell` does.
+    """
+    by_column: Dict[Any, Dict[Any, Any]] = {}
+    for (row, col), value in cells.items():
+        by_column.setdefault(col, {})[row] = value
+    for col, values in by_column.items():
+        rows = list(values)
+        if col not in df.columns or not pd.Index(rows).isin(df.index).all():
+            for row, value in values.items():
+                _set_cell(df, row, col, value)
+            continue
+        patch = pd.Series(list(values.values()), index=rows)
+        column = df[col].copy()
+        if patch.dtype == object or not _fits(patch.dtype, column.dtype):
+            column = column.astype(object)
+        column.loc[rows] = patch.to_numpy(dtype=column.dtype)
+        df[col] = column
+
+
+def _block_to_array(block: pd.DataFrame, dtype: Any, fill: Any) -> np.ndarray:
+    """Convert a block of sheet cells to an array in one vectorized pass.
+
+    With a numeric dtype, non-numeric cells (text, dates, blanks) become
+    `fill`; with dtype=None the raw cell objects are returned (blanks
+    as None).
+    """
+    if dtype is None:
+        values = block.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = None
+        return values
+    numeric = block.map(lambda v: isinstance(v, (int, float, np.number))).to_numpy(dtype=bool)
+    values = block.where(numeric).to_numpy(dtype=np.float64, na_value=np.nan)
+    values[np.isnan(values)] = fill
+    return values.astype(dtype, copy=False)
+
+
+def _is_missing(val: Any) -> bool:
+    """True for empty cells, NaN and the strings read_excel treats as NA."""
+    if val is None:
+        return True
+    if isinstance(val, str):
+        return val in _NA_STRINGS
+    try:
+        return bool(pd.isna(val))
+    except (TypeError, ValueError):
+        return False
+
 
 class ExcelReader:
-    """Helper class to read values from Excel using named ranges."""
+    """Helper class to read values from Excel using named ranges.
+
+    The reader is a workbook session: the file is opened once (lazily, on
+    the first read) and every parsed sheet is cached, so all loaders that
+    share a reader pay for one workbook open and one parse per sheet. Use it
+    as a context manager, or call `close()`, to release the file handle.
 
-    def __init__(self, excel_path: Path, named_ranges_path: Optional[Path] = None):
+    Parsed sheets and named-range values are also persisted in an on-disk
+    WorkbookCache keyed by the workbook's content hash, so later runs on an
+    unchanged workbook skip openpyxl entirely. Pass `use_cache=False` to
+    disable it, or `cache_dir` to relocate it.
+
+    `overrides` ({"Assumption!K18": 30.0, ...}) replace cell values in
+    everything the reader returns, without touching the file: scenarios
+    run on in-memory overrides instead of edited workbook copies. Only the
+    cells themselves change; formulas that depend on them keep their saved
+    values (recalculate them with `excel_replica.utils.formula_engine` and
+    pass the result as overrides). The caches always hold the unmodified workbook data, so
+    `with_overrides` can derive scenario readers that share them.
+    """
+
+    def __init__(
+        self,
+        excel_path: Path,
+        named_ranges_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        overrides: Optional[Dict[str, Any]] = None,
+    ):
         self.excel_path = excel_path
         if named_ranges_path is None:
             named_ranges_path = Path(__file__).parent.parent / "config" / "named_ranges.json"
+        self.named_ranges_path = named_ranges_path
 
         with open(named_ranges_path, "r") as f:
             self.named_ranges = json.load(f)
 
+        self.use_cache = use_cache
+        self._cache_dir = cache_dir
+        self._cache: Optional[WorkbookCache] = None
+        self._excel_file: Optional[pd.ExcelFile] = None
         self._sheets: Dict[str, pd.DataFrame] = {}
+        self._frames: Dict[Tuple, pd.DataFrame] = {}
+        self._values: Dict[str, Any] = {}
+        self._ranges: Dict[str, pd.DataFrame] = {}
+        self.overrides: CellOverrides = parse_overrides(overrides)
+        self._overrides_by_sheet: Optional[Dict[str, Dict[Tuple[int, int], Any]]] = None
+        self._patched_sheets: Dict[str, pd.DataFrame] = {}
+
+    def with_overrides(self, overrides: Dict[str, Any]) -> "ExcelReader":
+        """A reader for the same workbook with extra cell overrides.
+
+        The new reader shares this session's parsed data (and disk cache),
+        so each scenario costs no re-read; it opens its own file handle
+        only if it must read something not yet parsed.
+        """
+        clone = copy.copy(self)
+        clone.overrides = {**self.overrides, **parse_overrides(overrides)}
+        clone._overrides_by_sheet = None
+        clone._patched_sheets = {}
+        clone._excel_file = None
+        return clone
 
-    def _get_sheet(self, sheet_name: str) -> pd.DataFrame:
-        """Cache and return a sheet as a DataFrame."""
+    def _sheet_overrides(self, sheet_name: str) -> Dict[Tuple[int, int], Any]:
+        if self._overrides_by_sheet is None:
+            grouped: Dict[str, Dict[Tuple[int, int], Any]] = {}
+            for (sheet, row, col), value in self.overrides.items():
+                grouped.setdefault(sheet, {})[(row, col)] = value
+            self._overrides_by_sheet = grouped
+        return self._overrides_by_sheet.get(sheet_name, {})
+
+    def __enter__(self) -> "ExcelReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def excel_file(self) -> pd.ExcelFile:
+        """The open workbook (opened on first use)."""
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self.excel_path, engine="openpyxl")
+        return self._excel_file
+
+    @property
+    def cache(self) -> Optional[WorkbookCache]:
+        """The on-disk cache for this workbook (None when disabled)."""
+        if self.use_cache and self._cache is None:
+            self._cache = WorkbookCache(Path(self.excel_path), self._cache_dir)
+        return self._cache
+
+    def close(self) -> None:
+        """Close the workbook and flush the cache; cached sheets stay available."""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+        if self._cache is not None:
+            self._cache.flush()
+
+    def _parse(self, kind: str, key: str, sheet_name: str, **kwargs) -> pd.DataFrame:
+        """Parse a sheet, going through the on-disk cache when enabled."""
+        cache = self.cache
+        if cache is not None:
+            df = cache.load_frame(kind, key)
+            if df is not None:
+                return df
+        df = self.excel_file.parse(sheet_name, **kwargs)
+        if cache is not None:
+            cache.store_frame(kind, key, df)
+        return df
+
+    def get_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """Return a whole sheet without header, indexed like the Excel grid.
+
+        Row i / column j of the DataFrame is Excel row i+1 / column j+1.
+        The DataFrame is cached and shared: do not modify it in place.
+        """
         if sheet_name not in self._sheets:
             # We read without header to use absolute indexing from named ranges
-            self._sheets[sheet_name] = pd.read_excel(
-                self.excel_path, sheet_name=sheet_name, header=None, engine="openpyxl"
-            )
-        return self._sheets[sheet_name]
+            self._sheets[sheet_name] = self._parse("sheet", sheet_name, sheet_name, header=None)
+        cells = self._sheet_overrides(sheet_name)
+        if not cells:
+            return self._sheets[sheet_name]
+        if sheet_name not in self._patched_sheets:
+            df = self._sheets[sheet_name].copy()
+            _patch_frame(df, cells)
+            self._patched_sheets[sheet_name] = df.sort_index().sort_index(axis=1)
+        return self._patched_sheets[sheet_name]
 
     def get_value(self, name: str, default: Any = None) -> Any:
-        """Get a single value by named range."""
+        """Get a single value by named range.
+
+        Named cells are read without parsing whole sheets: the first lookup
+        on a sheet streams just the rows spanned by that sheet's named cells
+        (see `prefetch_values`), unless the sheet is already parsed.
+        """
         if name not in self.named_ranges:
             return default
 
         address = self.named_ranges[name]
-        # Parse address like "Assumption!$E$25" or "'Other Input'!$D$21"
-        match = re.match(r"['\"]?([^!]+)['\"]?!\$([A-Z]+)\$(\d+)", address)
-        if not match:
-            # Try range match like "Measures!$G$56:$G$57"
+        cell = parse_cell_address(address)
+        if cell is None:
             return default
+        sheet_name, row_idx, col_idx = cell
 
-        sheet_name, col_str, row_str = match.groups()
-        sheet_name = sheet_name.strip("'\"")
+        if cell in self.overrides:
+            val = self.overrides[cell]
+            return default if _is_missing(val) else val
 
-        # Convert Excel column (A, B, C...) to 0-indexed integer
-        col_idx = 0
-        for char in col_str:
-            col_idx = col_idx * 26 + (ord(char) - ord('A') + 1)
-        col_idx -= 1
+        if address not in self._values:
+            cache = self.cache
+            hit, val = cache.get_value(address) if cache is not None else (False, None)
+            if hit:
+                self._values[address] = val
+            elif sheet_name in self._sheets:
+                df = self._sheets[sheet_name]
+                try:
+                    self._store_value(address, df.iloc[row_idx, col_idx])
+                except IndexError:
+                    return default
+            else:
+                try:
+                    self.prefetch_values(sheet_name)
+                except KeyError:
+                    # Unknown sheet
+                    return default
 
-        # print(f"DEBUG: {name} -> {sheet_name} {col_str}({col_idx}) {row_str}")
+        val = self._values.get(address)
+        if _is_missing(val):
+            return default
+        return val
 
-        # Convert Excel row (1-indexed) to 0-indexed
-        row_idx = int(row_str) - 1
+    def prefetch_values(self, sheet_name: Optional[str] = None) -> None:
+        """Read every named single cell (on one sheet, or all) in one pass per sheet.
 
-        try:
-            df = self._get_sheet(sheet_name)
-            val = df.iloc[row_idx, col_idx]
-            if pd.isna(val):
-                return default
-            return val
-        except Exception:
-            return default
+        Uses openpyxl's read-only row streaming bounded to the rows and
+        columns spanned by the named cells, so no full sheet is parsed.
+        """
+        by_sheet: Dict[str, Dict[Tuple[int, int], str]] = {}
+        for address in self.named_ranges.values():
+            cell = parse_cell_address(address)
+            if cell is None or address in self._values:
+                continue
+            if sheet_name is not None and cell[0] != sheet_name:
+                continue
+            by_sheet.setdefault(cell[0], {})[cell[1:]] = address
+
+        for name, cells in by_sheet.items():
+            if name not in self.excel_file.sheet_names:
+                if sheet_name is not None:
+                    raise KeyError(name)
+                continue
+            rows = [row for row, _ in cells]
+            cols = [col for _, col in cells]
+            min_row, min_col = min(rows), min(cols)
+            worksheet = self.excel_file.book[name]
+            found = {}
+            for row_idx, values in enumerate(
+                worksheet.iter_rows(
+                    min_row=min_row + 1,
+                    max_row=max(rows) + 1,
+                    min_col=min_col + 1,
+                    max_col=max(cols) + 1,
+                    values_only=True,
+                ),
+                start=min_row,
+            ):
+                for col_idx, val in enumerate(values, start=min_col):
+                    if (row_idx, col_idx) in cells:
+                        found[cells[(row_idx, col_idx)]] = val
+            for address in cells.values():
+                self._store_value(address, found.get(address))
+
+    def _store_value(self, address: str, val: Any) -> None:
+        """Remember a named cell value in memory and in the disk cache."""
+        if _is_missing(val):
+            val = None
+        self._values[address] = val
+        if self.cache is not None:
+            self.cache.set_value(address, val)
+
+    def get_range(self, name: str, dtype: Any = np.float64, fill: Any = 0.0) -> np.ndarray:
+        """Read a rectangular range as a 2-D array in one block read.
+
+        Args:
+            name: A named range (e.g. "List_YesNo") or an address such as
+                "Financial!$L$117:$AJ$117".
+            dtype: Output dtype; non-numeric cells become `fill`. Pass None
+                for the raw cell objects (dates, text).
+            fill: Value for blank or non-numeric cells with a numeric dtype.
+
+        Returns:
+            Array of shape (rows, columns). Cells beyond the sheet's used
+            area read as blank.
+
+        Raises:
+            KeyError: If the name is unknown or the address is not a range.
+        """
+        address = self.named_ranges.get(name, name)
+        bounds = parse_range_address(address)
+        if bounds is None:
+            raise KeyError(f"Not a named range or cell range: {name}")
+        sheet_name, first_row, first_col, last_row, last_col = bounds
+        shape = (last_row - first_row + 1, last_col - first_col + 1)
+
+        if sheet_name in self._sheets:
+            block = self._sheets[sheet_name].iloc[first_row:last_row + 1, first_col:last_col + 1]
+        else:
+            block = self._read_block(address, sheet_name, first_row, first_col, last_row, last_col)
+        # Relabel to 0..n-1 and pad ranges that run past the sheet's used area
+        block = (
+            block.set_axis(range(block.shape[0]), axis=0)
+            .set_axis(range(block.shape[1]), axis=1)
+            .reindex(index=range(shape[0]), columns=range(shape[1]))
+        )
+        cells = {
+            (row - first_row, col - first_col): value
+            for (row, col), value in self._sheet_overrides(sheet_name).items()
+            if first_row <= row <= last_row and first_col <= col <= last_col
+        }
+        if cells:
+            block = block.astype(object)
+            for (row, col), value in cells.items():
+                block.iat[row, col] = value
+        return _block_to_array(block, dtype, fill)
+
+    def _read_block(
+        self, address: str, sheet_name: str, first_row: int, first_col: int, last_row: int, last_col: int,
+    ) -> pd.DataFrame:
+        """Stream just the cells of a range (through the disk cache when enabled)."""
+        if address in self._ranges:
+            return self._ranges[address]
+        cache = self.cache
+        if cache is not None:
+            block = cache.load_frame("range", address)
+            if block is not None:
+                self._ranges[address] = block
+                return block
+        worksheet = self.excel_file.book[sheet_name]
+        rows = worksheet.iter_rows(
+            min_row=first_row + 1,
+            max_row=last_row + 1,
+            min_col=first_col + 1,
+            max_col=last_col + 1,
+            values_only=True,
+        )
+        block = pd.DataFrame(list(rows), dtype=object)
+        self._ranges[address] = block
+        if cache is not None:
+            cache.store_frame("range", address, block)
+        return block
+
+    def preload(
+        self,
+        frames: Iterable[str] = (),
+        ranges: Iterable[str] = (),
+        values: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Read inputs from several sheets concurrently, one worker process per sheet.
+
+        Each worker opens the workbook itself and returns its sheet's parsed
+        DataFrame, range blocks and named cells, which are merged into this
+        session (and the disk cache), so later `get_df` / `get_range` /
+        `get_value` calls are memory hits. Cold start then costs about as
+        much as the slowest sheet instead of the sum of all of them.
+
+        Args:
+            frames: Sheets to parse as `get_df(sheet)` would.
+            ranges: Named ranges or range addresses for `get_range`.
+            values: Also read every named single cell.
+            max_workers: Pool size (default: one per sheet, up to the CPU
+                count); 1 reads in this process.
+        """
+        tasks: Dict[str, Dict[str, Any]] = {}
+
+        def task(sheet_name: str) -> Dict[str, Any]:
+            return tasks.setdefault(sheet_name, {"frame": False, "ranges": [], "values": False})
+
+        cache = self.cache
+        for sheet_name in frames:
+            key = (sheet_name, ())
+            if key in self._frames:
+                continue
+            df = cache.load_frame("df", repr(key)) if cache is not None else None
+            if df is not None:
+                self._frames[key] = df
+            else:
+                task(sheet_name)["frame"] = True
+
+        for name in ranges:
+            address = self.named_ranges.get(name, name)
+            bounds = parse_range_address(address)
+            if bounds is None or bounds[0] in self._sheets or address in self._ranges:
+                continue
+            block = cache.load_frame("range", address) if cache is not None else None
+            if block is not None:
+                self._ranges[address] = block
+            else:
+                task(bounds[0])["ranges"].append(address)
+
+        if values:
+            for address in self.named_ranges.values():
+                cell = parse_cell_address(address)
+                if cell is None or address in self._values:
+                    continue
+                hit, val = cache.get_value(address) if cache is not None else (False, None)
+                if hit:
+                    self._values[address] = val
+                else:
+                    task(cell[0])["values"] = True
+
+        if not tasks:
+            return
+
+        args = [(self.excel_path, self.named_ranges_path, name, spec) for name, spec in tasks.items()]
+        workers = min(len(args), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            results = [_read_sheet_inputs(*arg) for arg in args]
+        else:
+            # Imported here: multiprocessing is not needed on cache hits
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_sheet_inputs, *zip(*args)))
+
+        for (_, _, sheet_name, _), (frame, blocks, cell_values) in zip(args, results):
+            if frame is not None:
+                key = (sheet_name, ())
+                self._frames[key] = frame
+                if cache is not None:
+                    cache.store_frame("df", repr(key), frame)
+            for address, block in blocks.items():
+                self._ranges[address] = block
+                if cache is not None:
+                    cache.store_frame("range", address, block)
+            for address, val in cell_values.items():
+                self._store_value(address, val)
 
     def get_df(self, sheet_name: str, **kwargs) -> pd.DataFrame:
-        """Read a whole sheet as a DataFrame."""
-        return pd.read_excel(self.excel_path, sheet_name=sheet_name, engine="openpyxl", **kwargs)
+        """Read a whole sheet as a DataFrame (`pd.read_excel` options).
+
+        Parsed once per sheet and options; later calls return a copy of the
+        cached DataFrame.
+        """
+        key = (sheet_name, tuple(sorted(kwargs.items())))
+        if key not in self._frames:
+            self._frames[key] = self._parse("df", repr(key), sheet_name, **kwargs)
+        df = self._frames[key].copy()
+
+        cells = self._sheet_overrides(sheet_name)
+        if cells:
+            header = kwargs.get("header", 0)
+            if set(kwargs) - {"header"} or header not in (0, None):
+                raise ValueError("Cell overrides apply to get_df only with header=0 or header=None")
+            if header is None:
+                _patch_frame(df, cells)
+                return df
+            body = {}
+            for (row, col), value in cells.items():
+                if row == 0:
+                    df = df.rename(columns={df.columns[col]: value})
+                elif col < len(df.columns):
+                    body[(row - 1, col)] = value
+            # Resolve labels after any header renames
+            _patch_frame(df, {(row, df.columns[col]): value for (row, col), value in body.items()})
+        return df
+
+
+def _read_sheet_inputs(
+    excel_path: Path, named_ranges_path: Path, sheet_name: str, spec: Dict[str, Any],
+) -> Tuple[Optional[pd.DataFrame], Dict[str, pd.DataFrame], Dict[str, Any]]:
+    """Worker for `ExcelReader.preload`: read one sheet's frame, ranges and named cells."""
+    with ExcelReader(excel_path, named_ranges_path, use_cache=False) as reader:
+        if sheet_name not in reader.excel_file.sheet_names:
+            # External reference: left to the getters, which return defaults or raise
+            return None, {}, {}
+        frame = reader.get_df(sheet_name) if spec["frame"] else None
+        blocks = {}
+        for address in spec["ranges"]:
+            bounds = parse_range_address(address)
+            blocks[address] = reader._read_block(address, *bounds)
+        if spec["values"]:
+            reader.prefetch_values(sheet_name)
+        return frame, blocks, dict(reader._values)
+
+
+@contextmanager
+def reader_session(source: Union[Path, str, ExcelReader]) -> Iterator[ExcelReader]:
+    """Yield `source` if it is already an ExcelReader (left open for the
+    caller), else a reader for the path that is closed on exit.
+    """
+    if isinstance(source, ExcelReader):
+        yield source
+        return
+    with ExcelReader(Path(source)) as reader:
+        yield reader
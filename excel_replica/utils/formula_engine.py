@@ -0,0 +1,1309 @@
+"""Headless re-evaluation of workbook formulas.
+
+Scenario validation needs Excel's own answer for overridden inputs, and
+Excel recalculation (COM automation) only exists on Windows. `FormulaWorkbook`
+reads a workbook's formulas and saved values once, compiles the formulas
+into Python closures and builds the cell dependency graph. `recalculate`
+then applies input overrides and re-evaluates only the cells that depend
+on them, in topological order; every other cell keeps its saved value.
+
+Supported: numbers, text, booleans and errors; cell, range, whole-column,
+cross-sheet and named references; arithmetic, comparison, `&` and `%`;
+and the functions in `FUNCTIONS` plus IF, IFS, IFERROR, IFNA, SWITCH and
+CHOOSE. Formulas outside this subset (structured table references, LET,
+array constants, dynamic arrays) are left at their saved values. If one of
+them depends on an override it is reported in `RecalcResult.stale`, so a
+comparison built on it can be flagged rather than silently trusted.
+
+Usage:
+    engine = FormulaWorkbook(excel_path)
+    result = engine.recalculate({"Assumption!K18": 30.0})
+    reader = ExcelReader(excel_path, overrides=result.overrides())
+"""
+
+import datetime as dt
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import numpy_financial as npf
+
+from excel_replica.utils.excel_reader import _column_index, parse_overrides
+
+
+CellKey = Tuple[str, int, int]  # (sheet, row, col), 0-indexed as in ExcelReader overrides
+
+EXCEL_EPOCH = dt.datetime(1899, 12, 30)
+ERROR_CODES = frozenset({"#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A", "#SPILL!", "#CALC!"})
+
+
+class ExcelError(Exception):
+    """An Excel error value (#DIV/0!, #N/A, ...).
+
+    Raised while evaluating and stored as the value of the failing cell, so
+    errors propagate to dependents exactly as in Excel.
+    """
+
+    def __init__(self, code: str):
+        super().__init__(code)
+        self.code = code
+
+    def __eq__(self, other):
+        return isinstance(other, ExcelError) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+    def __repr__(self):
+        return self.code
+
+
+class UnsupportedFormula(Exception):
+    """A formula (or function argument form) outside the supported subset."""
+
+
+class _Missing:
+    """An omitted function argument, e.g. the 4th in XLOOKUP(a, b, c, , 0)."""
+
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+@dataclass(frozen=True)
+class RangeRef:
+    """A rectangular reference; `last_row` None means to the end of the sheet (A:A)."""
+    sheet: str
+    first_row: int
+    first_col: int
+    last_row: Optional[int]
+    last_col: int
+
+    def contains_row(self, row: int) -> bool:
+        return self.first_row <= row and (self.last_row is None or row <= self.last_row)
+
+
+class Grid:
+    """The value of a range: rows of cell values."""
+
+    def __init__(self, rows: List[List[Any]]):
+        self.rows = rows
+        self._index: Dict[bool, Dict[Any, int]] = {}
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.rows), (len(self.rows[0]) if self.rows else 0)
+
+    def flat(self) -> Iterator[Any]:
+        for row in self.rows:
+            yield from row
+
+    def vector(self) -> List[Any]:
+        """Values of a single row or column range."""
+        n_rows, n_cols = self.shape
+        if n_rows == 1:
+            return self.rows[0]
+        if n_cols == 1:
+            return [row[0] for row in self.rows]
+        raise ExcelError("#VALUE!")
+
+    def position(self, value: Any, last: bool = False) -> Optional[int]:
+        """Index of the first (or last) exact match in a vector, via a cached hash index."""
+        if last not in self._index:
+            index: Dict[Any, int] = {}
+            values = self.vector()
+            positions = range(len(values) - 1, -1, -1) if last else range(len(values))
+            for i in positions:
+                index.setdefault(_match_key(values[i]), i)
+            self._index[last] = index
+        return self._index[last].get(_match_key(value))
+
+
+# Value coercion
+
+def _to_serial(value: Any) -> float:
+    if isinstance(value, dt.datetime):
+        return (value - EXCEL_EPOCH).total_seconds() / 86400.0
+    return float((value - EXCEL_EPOCH.date()).days)
+
+
+def _from_serial(serial: float) -> dt.datetime:
+    return EXCEL_EPOCH + dt.timedelta(days=float(serial))
+
+
+def _scalar(value: Any) -> Any:
+    """Reduce a 1x1 range to its value and raise stored errors."""
+    if isinstance(value, Grid):
+        if value.shape != (1, 1):
+            raise ExcelError("#VALUE!")
+        value = value.rows[0][0]
+    if isinstance(value, ExcelError):
+        raise value
+    if value is MISSING:
+        return None
+    return value
+
+
+def _num(value: Any) -> float:
+    value = _scalar(value)
+    if value is None:
+        return 0.0
+    if isinstance(value, (bool, int, float, np.number)):
+        return float(value)
+    if isinstance(value, (dt.datetime, dt.date)):
+        return _to_serial(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            raise ExcelError("#VALUE!") from None
+    raise ExcelError("#VALUE!")
+
+
+def _int(value: Any) -> int:
+    return int(math.floor(_num(value)))
+
+
+def _bool(value: Any) -> bool:
+    value = _scalar(value)
+    if value is None:
+        return False
+    if isinstance(value, str):
+        if value.upper() in ("TRUE", "FALSE"):
+            return value.upper() == "TRUE"
+        raise ExcelError("#VALUE!")
+    return _num(value) != 0
+
+
+def _text(value: Any) -> str:
+    value = _scalar(value)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, np.number)):
+        number = float(value)
+        return str(int(number)) if number.is_integer() else f"{number:.15g}"
+    return str(value)
+
+
+def _compare_key(value: Any) -> Optional[Tuple[int, Any]]:
+    """Excel ordering: numbers < text < booleans; text is case-insensitive."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 2, value
+    if isinstance(value, str):
+        return 1, value.lower()
+    return 0, _num(value)
+
+
+_BLANK_AS = {0: (0, 0.0), 1: (1, ""), 2: (2, False)}
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    a, b = _compare_key(_scalar(left)), _compare_key(_scalar(right))
+    if a is None and b is None:
+        a = b = (0, 0.0)
+    elif a is None:
+        a = _BLANK_AS[b[0]]
+    elif b is None:
+        b = _BLANK_AS[a[0]]
+    if op == "=":
+        return a == b
+    if op == "<>":
+        return a != b
+    if op == "<":
+        return a < b
+    if op == ">":
+        return a > b
+    if op == "<=":
+        return a <= b
+    return a >= b
+
+
+def _match_key(value: Any) -> Any:
+    """Hashable key under Excel's exact-match equality."""
+    if isinstance(value, ExcelError) or value is None:
+        return value
+    return _compare_key(value)
+
+
+def _numbers(args: Iterable[Any]) -> Iterator[float]:
+    """Numbers of aggregate arguments: ranges skip text, booleans and blanks."""
+    for arg in args:
+        if isinstance(arg, Grid):
+            for value in arg.flat():
+                if isinstance(value, ExcelError):
+                    raise value
+                if isinstance(value, bool) or value is None or isinstance(value, str):
+                    continue
+                yield _num(value)
+        elif arg is not MISSING:
+            yield _num(arg)
+
+
+def _values(args: Iterable[Any]) -> Iterator[Any]:
+    for arg in args:
+        if isinstance(arg, Grid):
+            yield from arg.flat()
+        elif arg is not MISSING:
+            yield _scalar(arg)
+
+
+def _decimal_round(number: float, digits: float, rounding: str) -> float:
+    exponent = Decimal(1).scaleb(-int(digits))
+    return float(Decimal(repr(float(number))).quantize(exponent, rounding=rounding))
+
+
+def _criterion(criteria: Any) -> Callable[[Any], bool]:
+    """Predicate for SUMIF/COUNTIF-style criteria ("<>0", ">=5", "P", 3)."""
+    criteria = _scalar(criteria)
+    op, operand = "=", criteria
+    if isinstance(criteria, str):
+        match = re.match(r"^(<=|>=|<>|<|>|=)?(.*)$", criteria, re.S)
+        op, operand = match.group(1) or "=", match.group(2)
+        if "*" in operand or "?" in operand:
+            raise UnsupportedFormula("wildcard criteria")
+        try:
+            operand = float(operand)
+        except ValueError:
+            pass
+    numeric = isinstance(operand, (int, float)) and not isinstance(operand, bool)
+
+    def test(value: Any) -> bool:
+        if isinstance(value, ExcelError):
+            return False
+        if numeric and (value is None or isinstance(value, str)):
+            return op == "<>"
+        if value is None:
+            value = ""
+        try:
+            return _compare(op, value, operand)
+        except ExcelError:
+            return False
+    return test
+
+
+def _criteria_mask(pairs: List[Any]) -> List[bool]:
+    mask = None
+    for i in range(0, len(pairs), 2):
+        values = list(pairs[i].flat())
+        test = _criterion(pairs[i + 1])
+        hits = [test(value) for value in values]
+        mask = hits if mask is None else [a and b for a, b in zip(mask, hits)]
+    return mask
+
+
+# Functions (arguments evaluated; ranges arrive as Grid)
+
+def _fn_index(grid: Grid, row: Any, col: Any = MISSING) -> Any:
+    if not isinstance(grid, Grid):
+        grid = Grid([[grid]])
+    n_rows, n_cols = grid.shape
+    row = _int(row)
+    col = 0 if col is MISSING else _int(col)
+    if n_rows == 1 and col == 0:
+        row, col = 1, row
+    if row == 0 or col == 0:
+        if row == 0 and col == 0:
+            return grid
+        if row == 0:
+            return Grid([[r[col - 1]] for r in grid.rows])
+        return Grid([grid.rows[row - 1]])
+    if not (1 <= row <= n_rows and 1 <= col <= max(n_cols, 1)):
+        raise ExcelError("#REF!")
+    return grid.rows[row - 1][col - 1]
+
+
+def _approx_position(values: List[Any], value: Any, descending: bool = False) -> Optional[int]:
+    """MATCH type 1 (largest <= value, ascending) or -1 (smallest >= value, descending)."""
+    found = None
+    for i, candidate in enumerate(values):
+        if candidate is None:
+            continue
+        if descending:
+            if _compare(">=", candidate, value):
+                found = i
+            else:
+                break
+        elif _compare("<=", candidate, value):
+            found = i
+        else:
+            break
+    return found
+
+
+def _fn_match(value: Any, grid: Grid, match_type: Any = MISSING) -> float:
+    match_type = 1 if match_type is MISSING else _int(match_type)
+    value = _scalar(value)
+    if match_type == 0:
+        if isinstance(value, str) and ("*" in value or "?" in value):
+            raise UnsupportedFormula("wildcard MATCH")
+        position = grid.position(value)
+    else:
+        position = _approx_position(grid.vector(), value, descending=match_type < 0)
+    if position is None:
+        raise ExcelError("#N/A")
+    return float(position + 1)
+
+
+def _fn_xlookup(
+    value: Any, lookup: Grid, result: Grid, if_not_found: Any = MISSING,
+    match_mode: Any = MISSING, search_mode: Any = MISSING,
+) -> Any:
+    if match_mode is not MISSING and _int(match_mode) != 0:
+        raise UnsupportedFormula("XLOOKUP match_mode other than exact")
+    search = 1 if search_mode is MISSING else _int(search_mode)
+    position = lookup.position(_scalar(value), last=search == -1)
+    if position is None:
+        if if_not_found is MISSING:
+            raise ExcelError("#N/A")
+        return if_not_found
+    if not isinstance(result, Grid):
+        raise ExcelError("#VALUE!")
+    n_rows, n_cols = result.shape
+    if lookup.shape[1] == 1:  # Vertical lookup: return the matching row
+        row = result.rows[position]
+        return row[0] if n_cols == 1 else Grid([row])
+    if n_rows == 1:
+        return result.rows[0][position]
+    return Grid([[r[position]] for r in result.rows])
+
+
+def _fn_vlookup(value: Any, table: Grid, col: Any, approximate: Any = MISSING) -> Any:
+    col = _int(col)
+    if not 1 <= col <= table.shape[1]:
+        raise ExcelError("#REF!")
+    keys = Grid([[row[0]] for row in table.rows])
+    value = _scalar(value)
+    if approximate is not MISSING and not _bool(approximate):
+        position = keys.position(value)
+    else:
+        position = _approx_position(keys.vector(), value)
+    if position is None:
+        raise ExcelError("#N/A")
+    return table.rows[position][col - 1]
+
+
+def _fn_sumproduct(*grids: Any) -> float:
+    arrays = []
+    for grid in grids:
+        values = list(grid.flat()) if isinstance(grid, Grid) else [_scalar(grid)]
+        for value in values:
+            if isinstance(value, ExcelError):
+                raise value
+        arrays.append([
+            float(v) if isinstance(v, (int, float, np.number)) and not isinstance(v, bool) else 0.0
+            for v in values
+        ])
+    if len({len(a) for a in arrays}) != 1:
+        raise ExcelError("#VALUE!")
+    return float(np.sum(np.prod(np.array(arrays), axis=0)))
+
+
+def _fn_sumif(grid: Grid, criteria: Any, sum_grid: Any = MISSING) -> float:
+    target = grid if sum_grid is MISSING else sum_grid
+    mask = _criteria_mask([grid, criteria])
+    return sum(_num(v) for v, hit in zip(target.flat(), mask) if hit and isinstance(v, (int, float)))
+
+
+def _fn_sumifs(sum_grid: Grid, *pairs: Any) -> float:
+    mask = _criteria_mask(list(pairs))
+    return sum(_num(v) for v, hit in zip(sum_grid.flat(), mask) if hit and isinstance(v, (int, float)))
+
+
+def _fn_countifs(*pairs: Any) -> float:
+    return float(sum(_criteria_mask(list(pairs))))
+
+
+def _fn_average(*args: Any) -> float:
+    values = list(_numbers(args))
+    if not values:
+        raise ExcelError("#DIV/0!")
+    return sum(values) / len(values)
+
+
+def _fn_count(*args: Any) -> float:
+    count = 0
+    for value in _values(args):
+        if isinstance(value, (int, float, dt.date)) and not isinstance(value, bool):
+            count += 1
+    return float(count)
+
+
+def _fn_mod(number: Any, divisor: Any) -> float:
+    number, divisor = _num(number), _num(divisor)
+    if divisor == 0:
+        raise ExcelError("#DIV/0!")
+    return number - divisor * math.floor(number / divisor)
+
+
+def _fn_sqrt(number: Any) -> float:
+    number = _num(number)
+    if number < 0:
+        raise ExcelError("#NUM!")
+    return math.sqrt(number)
+
+
+def _fn_ln(number: Any) -> float:
+    number = _num(number)
+    if number <= 0:
+        raise ExcelError("#NUM!")
+    return math.log(number)
+
+
+def _fn_date(year: Any, month: Any, day: Any) -> float:
+    year, month, day = _int(year), _int(month), _int(day)
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return _to_serial(dt.date(year, month, 1)) + day - 1
+
+
+def _add_months(serial: Any, months: Any) -> Tuple[int, int, int]:
+    start = _from_serial(math.floor(_num(serial))).date()
+    total = start.month - 1 + _int(months)
+    year, month = start.year + total // 12, total % 12 + 1
+    return year, month, start.day
+
+
+def _fn_edate(start: Any, months: Any) -> float:
+    year, month, day = _add_months(start, months)
+    last_day = (dt.date(year + month // 12, month % 12 + 1, 1) - dt.timedelta(days=1)).day
+    return _to_serial(dt.date(year, month, min(day, last_day)))
+
+
+def _fn_eomonth(start: Any, months: Any) -> float:
+    year, month, _ = _add_months(start, months)
+    return _to_serial(dt.date(year + month // 12, month % 12 + 1, 1) - dt.timedelta(days=1))
+
+
+def _fn_npv(rate: Any, *values: Any) -> float:
+    rate = _num(rate)
+    return sum(value / (1 + rate) ** (i + 1) for i, value in enumerate(_numbers(values)))
+
+
+def _fn_irr(values: Any, guess: Any = MISSING) -> float:
+    result = npf.irr(np.array(list(_numbers([values]))))
+    if not np.isfinite(result):
+        raise ExcelError("#NUM!")
+    return float(result)
+
+
+def _fn_xnpv(rate: Any, values: Any, dates: Any) -> float:
+    rate = _num(rate)
+    amounts = [_num(v) for v in _values([values])]
+    serials = [_num(d) for d in _values([dates])]
+    if len(amounts) != len(serials):
+        raise ExcelError("#NUM!")
+    return sum(a / (1 + rate) ** ((d - serials[0]) / 365.0) for a, d in zip(amounts, serials))
+
+
+def _optional_num(value: Any, default: float = 0.0) -> float:
+    return default if value is MISSING else _num(value)
+
+
+def _fn_pmt(rate, nper, pv, fv=MISSING, when=MISSING) -> float:
+    return float(npf.pmt(_num(rate), _num(nper), _num(pv), _optional_num(fv), _optional_num(when)))
+
+
+def _fn_ipmt(rate, per, nper, pv, fv=MISSING, when=MISSING) -> float:
+    return float(npf.ipmt(_num(rate), _num(per), _num(nper), _num(pv), _optional_num(fv), _optional_num(when)))
+
+
+def _fn_ppmt(rate, per, nper, pv, fv=MISSING, when=MISSING) -> float:
+    return float(npf.ppmt(_num(rate), _num(per), _num(nper), _num(pv), _optional_num(fv), _optional_num(when)))
+
+
+def _is_error(value: Any, codes: Optional[FrozenSet[str]] = None) -> bool:
+    try:
+        _scalar(value)
+    except ExcelError as error:
+        return codes is None or error.code in codes
+    return False
+
+
+def _minmax(reduce: Callable) -> Callable:
+    def fn(*args):
+        values = list(_numbers(args))
+        return reduce(values) if values else 0.0
+    return fn
+
+
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "SUM": lambda *args: math.fsum(_numbers(args)),
+    "PRODUCT": lambda *args: math.prod(_numbers(args)),
+    "MIN": _minmax(min),
+    "MAX": _minmax(max),
+    "AVERAGE": _fn_average,
+    "COUNT": _fn_count,
+    "COUNTA": lambda *args: float(sum(1 for v in _values(args) if v is not None)),
+    "SUMPRODUCT": _fn_sumproduct,
+    "SUMIF": _fn_sumif,
+    "SUMIFS": _fn_sumifs,
+    "COUNTIF": lambda grid, criteria: _fn_countifs(grid, criteria),
+    "COUNTIFS": _fn_countifs,
+    "ABS": lambda x: abs(_num(x)),
+    "SIGN": lambda x: float(np.sign(_num(x))),
+    "INT": lambda x: float(math.floor(_num(x))),
+    "ROUND": lambda x, digits=0: _decimal_round(_num(x), _optional_num(digits), ROUND_HALF_UP),
+    "ROUNDUP": lambda x, digits=0: _decimal_round(_num(x), _optional_num(digits), ROUND_UP),
+    "ROUNDDOWN": lambda x, digits=0: _decimal_round(_num(x), _optional_num(digits), ROUND_DOWN),
+    "MOD": _fn_mod,
+    "POWER": lambda x, y: _num(x) ** _num(y),
+    "SQRT": _fn_sqrt,
+    "EXP": lambda x: math.exp(_num(x)),
+    "LN": _fn_ln,
+    "AND": lambda *args: all(_bool(v) for v in _values(args) if v is not None and not isinstance(v, str)),
+    "OR": lambda *args: any(_bool(v) for v in _values(args) if v is not None and not isinstance(v, str)),
+    "NOT": lambda x: not _bool(x),
+    "TRUE": lambda: True,
+    "FALSE": lambda: False,
+    "NA": lambda: ExcelError("#N/A"),
+    "ISBLANK": lambda x: _scalar(x) is None,
+    "ISNUMBER": lambda x: not _is_error(x) and isinstance(_scalar(x), (int, float)) and not isinstance(_scalar(x), bool),
+    "ISTEXT": lambda x: not _is_error(x) and isinstance(_scalar(x), str),
+    "ISERROR": lambda x: _is_error(x),
+    "ISNA": lambda x: _is_error(x, frozenset({"#N/A"})),
+    "CONCATENATE": lambda *args: "".join(_text(a) for a in args),
+    "CONCAT": lambda *args: "".join(_text(v) for v in _values(args)),
+    "LEN": lambda x: float(len(_text(x))),
+    "LEFT": lambda x, n=MISSING: _text(x)[:int(_optional_num(n, 1))],
+    "RIGHT": lambda x, n=MISSING: _text(x)[-int(_optional_num(n, 1)):] if int(_optional_num(n, 1)) else "",
+    "UPPER": lambda x: _text(x).upper(),
+    "LOWER": lambda x: _text(x).lower(),
+    "INDEX": _fn_index,
+    "MATCH": _fn_match,
+    "XLOOKUP": _fn_xlookup,
+    "VLOOKUP": _fn_vlookup,
+    "DATE": _fn_date,
+    "YEAR": lambda x: float(_from_serial(_num(x)).year),
+    "MONTH": lambda x: float(_from_serial(_num(x)).month),
+    "DAY": lambda x: float(_from_serial(_num(x)).day),
+    "EDATE": _fn_edate,
+    "EOMONTH": _fn_eomonth,
+    "NPV": _fn_npv,
+    "IRR": _fn_irr,
+    "XNPV": _fn_xnpv,
+    "PMT": _fn_pmt,
+    "IPMT": _fn_ipmt,
+    "PPMT": _fn_ppmt,
+}
+
+# Functions whose arguments are evaluated lazily (compiled as special forms)
+SPECIAL_FORMS = ("IF", "IFS", "IFERROR", "IFNA", "SWITCH", "CHOOSE")
+
+
+# Parsing and compilation
+
+_REF_RE = re.compile(
+    r"^(?:(?P<sheet>'(?:[^']|'')+'|[^'!:]+)!)?"
+    r"(?P<first>\$?[A-Z]{1,3}(?:\$?\d+)?)(?::(?P<last>\$?[A-Z]{1,3}(?:\$?\d+)?))?$"
+)
+_CELL_RE = re.compile(r"^(\$?)([A-Z]{1,3})(?:(\$?)(\d+))?$")
+
+# String literals and quoted sheet names (kept verbatim), or an A1 cell reference
+_A1_TOKEN_RE = re.compile(
+    r"\"(?:[^\"]|\"\")*\"|'(?:[^']|'')*'"
+    r"|(?<![A-Za-z0-9_.])(\$?)([A-Z]{1,3})(\$?)(\d+)(?![A-Za-z0-9_(!])"
+)
+
+_INFIX_PRECEDENCE = {
+    "=": 1, "<>": 1, "<": 1, ">": 1, "<=": 1, ">=": 1,
+    "&": 2,
+    "+": 3, "-": 3,
+    "*": 4, "/": 4,
+    "^": 5,
+}
+_PREFIX_PRECEDENCE = 6  # Excel: -2^2 = 4
+
+
+def _divide(a: Any, b: Any) -> float:
+    divisor = _num(b)
+    if divisor == 0:
+        raise ExcelError("#DIV/0!")
+    return _num(a) / divisor
+
+
+def _power(a: Any, b: Any) -> float:
+    base, exponent = _num(a), _num(b)
+    if base == 0 and exponent < 0:
+        raise ExcelError("#DIV/0!")
+    result = base ** exponent
+    if isinstance(result, complex):
+        raise ExcelError("#NUM!")
+    return result
+
+
+_INFIX_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": lambda a, b: _num(a) + _num(b),
+    "-": lambda a, b: _num(a) - _num(b),
+    "*": lambda a, b: _num(a) * _num(b),
+    "/": _divide,
+    "^": _power,
+    "&": lambda a, b: _text(a) + _text(b),
+}
+
+Node = Callable[["_Evaluation"], Any]
+
+
+def _template_key(text: str, row: int, col: int) -> str:
+    """The formula in relative (R1C1-style) form as seen from cell (row, col).
+
+    Formulas filled down or across a sheet share one key, so each distinct
+    formula is tokenized and compiled once.
+    """
+    def relative(match):
+        if match.group(2) is None:
+            return match.group(0)
+        col_abs, letters, row_abs, digits = match.groups()
+        col_part = f"${letters}" if col_abs else f"C[{_column_index(letters) - col}]"
+        row_part = f"${digits}" if row_abs else f"R[{int(digits) - 1 - row}]"
+        return col_part + row_part
+    return _A1_TOKEN_RE.sub(relative, text)
+
+
+@dataclass(frozen=True)
+class _RefSpec:
+    """A reference as compiled: relative rows/columns are offsets from the formula's cell."""
+    sheet: str
+    first_row: Optional[int]  # None for whole columns
+    first_col: int
+    last_row: Optional[int]
+    last_col: int
+    relative: Tuple[bool, bool, bool, bool]  # first_row, first_col, last_row, last_col
+    is_range: bool
+
+    @property
+    def is_static(self) -> bool:
+        return not any(self.relative)
+
+    def resolve(self, row: int, col: int):
+        """The CellKey or RangeRef this reference reads from cell (row, col)."""
+        r0, c0, r1, c1 = self.first_row, self.first_col, self.last_row, self.last_col
+        rel_r0, rel_c0, rel_r1, rel_c1 = self.relative
+        r0 = r0 + row if rel_r0 else r0
+        c0 = c0 + col if rel_c0 else c0
+        if not self.is_range:
+            return self.sheet, r0, c0
+        r1 = r1 + row if rel_r1 else r1
+        c1 = c1 + col if rel_c1 else c1
+        if r0 is None:
+            return RangeRef(self.sheet, 0, min(c0, c1), None, max(c0, c1))
+        return RangeRef(self.sheet, min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1))
+
+
+@dataclass
+class _Template:
+    """A compiled formula shared by every cell with the same relative form."""
+    evaluate: Optional[Node]
+    refs: Tuple[_RefSpec, ...]
+    error: str = ""
+
+    def bind(self, text: str, row: int, col: int) -> "CompiledFormula":
+        cells, ranges = set(), set()
+        for spec in self.refs:
+            target = spec.resolve(row, col)
+            if isinstance(target, RangeRef):
+                ranges.add(target)
+            else:
+                cells.add(target)
+        return CompiledFormula(text, self.evaluate, frozenset(cells), tuple(ranges), self.error)
+
+
+@dataclass
+class CompiledFormula:
+    """A formula compiled to a closure, with the references it reads."""
+    text: str
+    evaluate: Optional[Node]  # None when unsupported
+    cells: FrozenSet[CellKey]
+    ranges: Tuple[RangeRef, ...]
+    error: str = ""  # Why it is unsupported
+
+
+class _Compiler:
+    """Pratt parser over openpyxl's formula tokens, emitting closures."""
+
+    def __init__(self, sheet: str, names: Dict[str, str], row: int = 0, col: int = 0):
+        self.sheet = sheet
+        self.names = names
+        self.row = row
+        self.col = col
+        self.refs: set = set()
+
+    def compile(self, text: str) -> _Template:
+        from openpyxl.formula.tokenizer import Token, Tokenizer
+
+        try:
+            tokens = [t for t in Tokenizer(text).items if t.type != Token.WSPACE]
+        except Exception as exc:
+            return _Template(None, (), f"tokenize: {exc}")
+
+        # Collect references first so even unsupported formulas join the
+        # dependency graph and can be reported as stale
+        for token in tokens:
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                try:
+                    self._reference(token.value)
+                except UnsupportedFormula:
+                    pass
+
+        self.tokens = tokens
+        self.pos = 0
+        try:
+            node = self._expression(0)
+            if self.pos != len(tokens):
+                raise UnsupportedFormula(f"unexpected token {tokens[self.pos].value!r}")
+        except UnsupportedFormula as exc:
+            return _Template(None, tuple(self.refs), str(exc))
+        return _Template(node, tuple(self.refs))
+
+    # Token helpers
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self):
+        token = self._peek()
+        if token is None:
+            raise UnsupportedFormula("unexpected end of formula")
+        self.pos += 1
+        return token
+
+    # Grammar
+
+    def _expression(self, min_precedence: int) -> Node:
+        from openpyxl.formula.tokenizer import Token
+
+        left = self._prefix()
+        while True:
+            token = self._peek()
+            if token is None:
+                return left
+            if token.type == Token.OP_POST and token.value == "%":
+                self.pos += 1
+                left = self._unary(left, lambda v: _num(v) / 100.0)
+                continue
+            if token.type != Token.OP_IN:
+                return left
+            precedence = _INFIX_PRECEDENCE.get(token.value)
+            if precedence is None:
+                raise UnsupportedFormula(f"operator {token.value!r}")
+            if precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self._expression(precedence + 1)
+            left = self._binary(token.value, left, right)
+
+    @staticmethod
+    def _unary(operand: Node, fn: Callable[[Any], Any]) -> Node:
+        return lambda ev: fn(operand(ev))
+
+    @staticmethod
+    def _binary(op: str, left: Node, right: Node) -> Node:
+        if op in _INFIX_OPS:
+            fn = _INFIX_OPS[op]
+            return lambda ev: fn(left(ev), right(ev))
+        return lambda ev: _compare(op, left(ev), right(ev))
+
+    def _prefix(self) -> Node:
+        from openpyxl.formula.tokenizer import Token
+
+        token = self._next()
+        if token.type == Token.OP_PRE:
+            operand = self._expression(_PREFIX_PRECEDENCE)
+            if token.value == "-":
+                return self._unary(operand, lambda v: -_num(v))
+            return operand
+        if token.type == Token.PAREN and token.subtype == Token.OPEN:
+            node = self._expression(0)
+            closing = self._next()
+            if closing.type != Token.PAREN:
+                raise UnsupportedFormula("unbalanced parentheses")
+            return node
+        if token.type == Token.FUNC and token.subtype == Token.OPEN:
+            return self._function(token.value[:-1])
+        if token.type == Token.OPERAND:
+            return self._operand(token)
+        if token.type == Token.SEP or (token.type == Token.FUNC and token.subtype == Token.CLOSE):
+            # Omitted argument: leave the separator for the argument list
+            self.pos -= 1
+            return lambda ev: MISSING
+        raise UnsupportedFormula(f"token {token.value!r}")
+
+    def _operand(self, token) -> Node:
+        from openpyxl.formula.tokenizer import Token
+
+        value = token.value
+        if token.subtype == Token.NUMBER:
+            number = float(value)
+            return lambda ev: number
+        if token.subtype == Token.TEXT:
+            text = value[1:-1].replace('""', '"')
+            return lambda ev: text
+        if token.subtype == Token.LOGICAL:
+            flag = value.upper() == "TRUE"
+            return lambda ev: flag
+        if token.subtype == Token.ERROR:
+            error = ExcelError(value)
+            return lambda ev: error
+        spec = self._reference(value)
+        if spec.is_static:
+            target = spec.resolve(0, 0)
+            if spec.is_range:
+                return lambda ev: ev.grid(target)
+            return lambda ev: ev.cell(target)
+        if spec.is_range:
+            return lambda ev: ev.grid(spec.resolve(ev.row, ev.col))
+        return lambda ev: ev.cell(spec.resolve(ev.row, ev.col))
+
+    def _reference(self, text: str, depth: int = 0) -> _RefSpec:
+        """Parse a cell, range or defined name reference.
+
+        Relative rows and columns of cell references are stored as offsets
+        from the formula's cell (matching `_template_key`). Defined names
+        and whole-column references are taken as absolute.
+        """
+        name = self.names.get(text.upper())
+        if name is not None:
+            if depth > 5:
+                raise UnsupportedFormula(f"name {text!r}")
+            return self._reference(name, depth + 1)
+
+        match = _REF_RE.match(text)
+        if match is None:
+            raise UnsupportedFormula(f"reference {text!r}")
+        sheet = match.group("sheet")
+        if sheet is None:
+            sheet = self.sheet
+        elif sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+        if sheet.startswith("["):
+            raise UnsupportedFormula(f"external reference {text!r}")
+
+        first = _CELL_RE.match(match.group("first"))
+        last = _CELL_RE.match(match.group("last")) if match.group("last") else None
+        if last is None:
+            if first.group(4) is None:
+                # A bare word that is not a defined name (or an unknown one)
+                raise UnsupportedFormula(f"name {text!r}")
+            last = first
+        if (first.group(4) is None) != (last.group(4) is None):
+            raise UnsupportedFormula(f"reference {text!r}")
+
+        corners = []
+        for part in (first, last):
+            col_abs, letters, row_abs, digits = part.groups()
+            col_rel = depth == 0 and digits is not None and not col_abs
+            row_rel = depth == 0 and digits is not None and not row_abs
+            row = None if digits is None else int(digits) - 1 - (self.row if row_rel else 0)
+            col = _column_index(letters) - (self.col if col_rel else 0)
+            corners.append((row, col, row_rel, col_rel))
+        (r0, c0, rel_r0, rel_c0), (r1, c1, rel_r1, rel_c1) = corners
+        spec = _RefSpec(
+            sheet, r0, c0, r1, c1, (rel_r0, rel_c0, rel_r1, rel_c1), is_range=match.group("last") is not None,
+        )
+        self.refs.add(spec)
+        return spec
+
+    def _arguments(self) -> List[Node]:
+        from openpyxl.formula.tokenizer import Token
+
+        args: List[Node] = []
+        token = self._peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.pos += 1
+            return args
+        while True:
+            args.append(self._expression(0))
+            token = self._next()
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            if not (token.type == Token.SEP and token.subtype == Token.ARG):
+                raise UnsupportedFormula(f"token {token.value!r} in argument list")
+
+    def _function(self, name: str) -> Node:
+        name = name.upper()
+        for prefix in ("_XLFN._XLWS.", "_XLFN.", "_XLWS."):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+        if name not in FUNCTIONS and name not in SPECIAL_FORMS:
+            raise UnsupportedFormula(f"function {name}")
+        args = self._arguments()
+
+        if name == "IF":
+            return self._if(args)
+        if name == "IFS":
+            return self._ifs(args)
+        if name in ("IFERROR", "IFNA"):
+            return self._iferror(args, frozenset({"#N/A"}) if name == "IFNA" else None)
+        if name == "SWITCH":
+            return self._switch(args)
+        if name == "CHOOSE":
+            return self._choose(args)
+
+        fn = FUNCTIONS[name]
+        if len(args) == 1:
+            only = args[0]
+            return lambda ev: fn(only(ev))
+        return lambda ev: fn(*[arg(ev) for arg in args])
+
+    @staticmethod
+    def _if(args: List[Node]) -> Node:
+        if not 2 <= len(args) <= 3:
+            raise UnsupportedFormula("IF arity")
+        condition, then = args[0], args[1]
+        otherwise = args[2] if len(args) == 3 else (lambda ev: False)
+
+        def evaluate(ev):
+            branch = then if _bool(condition(ev)) else otherwise
+            value = branch(ev)
+            return 0.0 if value is MISSING else value
+        return evaluate
+
+    @staticmethod
+    def _ifs(args: List[Node]) -> Node:
+        if len(args) % 2:
+            raise UnsupportedFormula("IFS arity")
+
+        def evaluate(ev):
+            for i in range(0, len(args), 2):
+                if _bool(args[i](ev)):
+                    return args[i + 1](ev)
+            raise ExcelError("#N/A")
+        return evaluate
+
+    @staticmethod
+    def _iferror(args: List[Node], codes: Optional[FrozenSet[str]]) -> Node:
+        if len(args) != 2:
+            raise UnsupportedFormula("IFERROR arity")
+        value, fallback = args
+
+        def evaluate(ev):
+            try:
+                result = value(ev)
+                _scalar(result) if not isinstance(result, Grid) else None
+                return result
+            except ExcelError as error:
+                if codes is not None and error.code not in codes:
+                    raise
+                return fallback(ev)
+        return evaluate
+
+    @staticmethod
+    def _switch(args: List[Node]) -> Node:
+        if len(args) < 3:
+            raise UnsupportedFormula("SWITCH arity")
+        expression, rest = args[0], args[1:]
+        default = rest[-1] if len(rest) % 2 else None
+        pairs = [(rest[i], rest[i + 1]) for i in range(0, len(rest) - (len(rest) % 2), 2)]
+
+        def evaluate(ev):
+            value = _scalar(expression(ev))
+            for case, result in pairs:
+                if _compare("=", value, case(ev)):
+                    return result(ev)
+            if default is None:
+                raise ExcelError("#N/A")
+            return default(ev)
+        return evaluate
+
+    @staticmethod
+    def _choose(args: List[Node]) -> Node:
+        if len(args) < 2:
+            raise UnsupportedFormula("CHOOSE arity")
+
+        def evaluate(ev):
+            index = _int(args[0](ev))
+            if not 1 <= index < len(args):
+                raise ExcelError("#VALUE!")
+            return args[index](ev)
+        return evaluate
+
+
+def compile_formula(
+    text: str, sheet: str, names: Optional[Dict[str, str]] = None, row: int = 0, col: int = 0,
+) -> CompiledFormula:
+    """Compile one formula ("=A1+1") found in cell (row, col) of `sheet`.
+
+    Args:
+        names: Defined names (upper-case) -> reference text.
+    """
+    return _Compiler(sheet, names or {}, row, col).compile(text).bind(text, row, col)
+
+
+# Evaluation
+
+class _Evaluation:
+    """Cell values for one recalculation: changed cells over the saved values."""
+
+    def __init__(self, workbook: "FormulaWorkbook"):
+        self.workbook = workbook
+        self.base = workbook.values
+        self.changes: Dict[CellKey, Any] = {}
+        self._grids: Dict[RangeRef, Grid] = {}
+        self.row = self.col = 0  # The cell being evaluated (relative references)
+
+    def cell(self, key: CellKey) -> Any:
+        if key in self.changes:
+            return self.changes[key]
+        return self.base.get(key)
+
+    def grid(self, ref: RangeRef) -> Grid:
+        grid = self._grids.get(ref)
+        if grid is None:
+            last_row = ref.last_row
+            if last_row is None:
+                last_row = self.workbook.max_row.get(ref.sheet, -1)
+            cols = range(ref.first_col, ref.last_col + 1)
+            grid = Grid([
+                [self.cell((ref.sheet, row, col)) for col in cols]
+                for row in range(ref.first_row, last_row + 1)
+            ])
+            self._grids[ref] = grid
+        return grid
+
+    def set(self, key: CellKey, value: Any) -> None:
+        self.changes[key] = value
+        # Drop cached grids that contain the cell
+        sheet, row, col = key
+        for ref in self.workbook._ranges_by_column.get((sheet, col), ()):
+            if ref in self._grids and ref.contains_row(row):
+                del self._grids[ref]
+
+
+def _same(old: Any, new: Any) -> bool:
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) and not isinstance(old, bool):
+        return math.isclose(old, new, rel_tol=1e-12, abs_tol=1e-12) or (math.isnan(old) and math.isnan(new))
+    return old == new and type(old) is type(new) or (old is None and new is None)
+
+
+def _finalize(value: Any, saved: Any) -> Any:
+    """Normalise a result for storage: 1x1 ranges, numpy scalars, dates."""
+    if isinstance(value, Grid):
+        if value.shape != (1, 1):
+            raise UnsupportedFormula("formula returns an array")
+        value = value.rows[0][0]
+    if value is MISSING:
+        value = 0.0
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        value = ExcelError("#NUM!")
+    if isinstance(saved, dt.datetime) and isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = _from_serial(value)
+    return value
+
+
+@dataclass
+class RecalcResult:
+    """Outcome of `FormulaWorkbook.recalculate`."""
+    values: Dict[CellKey, Any]  # Overridden cells and every re-evaluated cell whose value changed
+    evaluated: int = 0  # Formula cells re-evaluated
+    stale: Dict[CellKey, str] = field(default_factory=dict)  # Dependent cells left at saved values -> reason
+
+    def overrides(self) -> Dict[str, Any]:
+        """Values as ExcelReader overrides ({"'Sheet'!A1": value}); errors as their codes."""
+        from openpyxl.utils.cell import get_column_letter
+
+        return {
+            f"'{sheet}'!{get_column_letter(col + 1)}{row + 1}": (
+                value.code if isinstance(value, ExcelError) else value
+            )
+            for (sheet, row, col), value in self.values.items()
+        }
+
+
+class FormulaWorkbook:
+    """A workbook's formulas and saved values, ready for partial recalculation.
+
+    Args:
+        excel_path: Workbook to load.
+        named_ranges: Extra defined names (name -> reference text), e.g. the
+            repo's named_ranges.json; the workbook's own names take priority.
+        sheets: Sheets to load (default: all).
+    """
+
+    def __init__(
+        self,
+        excel_path: Path,
+        named_ranges: Optional[Dict[str, str]] = None,
+        sheets: Optional[Iterable[str]] = None,
+    ):
+        from openpyxl import load_workbook
+
+        self.excel_path = Path(excel_path)
+        self.values: Dict[CellKey, Any] = {}
+        self.formulas: Dict[CellKey, CompiledFormula] = {}
+        self.max_row: Dict[str, int] = {}
+
+        formula_book = load_workbook(self.excel_path, read_only=True, data_only=False)
+        value_book = load_workbook(self.excel_path, read_only=True, data_only=True)
+        try:
+            names = {name.upper(): ref for name, ref in (named_ranges or {}).items()}
+            names.update(self._defined_names(formula_book))
+            texts: Dict[CellKey, str] = {}
+            for sheet in (sheets or formula_book.sheetnames):
+                self._load_sheet(formula_book[sheet], value_book[sheet], sheet, texts)
+        finally:
+            formula_book.close()
+            value_book.close()
+
+        templates: Dict[Tuple[str, str], _Template] = {}
+        for (sheet, row, col), text in texts.items():
+            template_key = (sheet, _template_key(text, row, col))
+            template = templates.get(template_key)
+            if template is None:
+                template = templates[template_key] = _Compiler(sheet, names, row, col).compile(text)
+            self.formulas[(sheet, row, col)] = template.bind(text, row, col)
+        self._build_graph()
+
+    @staticmethod
+    def _defined_names(book) -> Dict[str, str]:
+        names = {}
+        try:
+            items = book.defined_names.items()
+        except AttributeError:  # openpyxl < 3.1
+            items = ((d.name, d) for d in book.defined_names.definedName)
+        for name, definition in items:
+            text = getattr(definition, "attr_text", None)
+            if text and "!" in text and "," not in text:
+                names[name.upper()] = text.lstrip("=")
+        return names
+
+    def _load_sheet(self, formula_sheet, value_sheet, sheet: str, texts: Dict[CellKey, str]) -> None:
+        max_row = -1
+        rows = zip(formula_sheet.iter_rows(values_only=True), value_sheet.iter_rows(values_only=True))
+        for row, (formula_row, value_row) in enumerate(rows):
+            for col, (formula, value) in enumerate(zip(formula_row, value_row)):
+                if formula is None and value is None:
+                    continue
+                key = (sheet, row, col)
+                max_row = row
+                if isinstance(value, str) and value in ERROR_CODES:
+                    value = ExcelError(value)
+                if value is not None:
+                    self.values[key] = value
+                if isinstance(formula, str) and formula.startswith("="):
+                    texts[key] = formula
+                elif formula is not None and not isinstance(formula, (str, int, float, bool, dt.datetime, dt.date)):
+                    # Array / data-table formulas: keep the saved value, flag as unsupported
+                    texts[key] = "=" + str(getattr(formula, "text", formula)).lstrip("=") + "\u0000"
+        self.max_row[sheet] = max_row
+
+    def _build_graph(self) -> None:
+        self._dependents: Dict[CellKey, List[CellKey]] = defaultdict(list)
+        self._range_dependents: Dict[RangeRef, List[CellKey]] = defaultdict(list)
+        self._ranges_by_column: Dict[Tuple[str, int], List[RangeRef]] = defaultdict(list)
+        for key, formula in self.formulas.items():
+            for cell in formula.cells:
+                self._dependents[cell].append(key)
+            for ref in formula.ranges:
+                if ref not in self._range_dependents:
+                    for col in range(ref.first_col, ref.last_col + 1):
+                        self._ranges_by_column[(ref.sheet, col)].append(ref)
+                self._range_dependents[ref].append(key)
+
+    @property
+    def unsupported(self) -> Dict[CellKey, str]:
+        """Formula cells that cannot be evaluated -> reason."""
+        return {key: f.error for key, f in self.formulas.items() if f.evaluate is None}
+
+    def _dependents_of(self, node) -> List[Any]:
+        """Direct dependents of a cell or range node.
+
+        A cell's dependents include the ranges that contain it; a range's are
+        the formulas that read it. Routing through range nodes visits a range
+        (and its readers) once, however many of its cells change.
+        """
+        if isinstance(node, RangeRef):
+            return self._range_dependents[node]
+        sheet, row, col = node
+        dependents: List[Any] = list(self._dependents.get(node, ()))
+        for ref in self._ranges_by_column.get((sheet, col), ()):
+            if ref.contains_row(row):
+                dependents.append(ref)
+        return dependents
+
+    def _evaluation_order(self, seeds: List[CellKey]) -> Tuple[List[CellKey], set]:
+        """Dependents of the seeds in topological order (iterative DFS), plus cells on cycles."""
+        state: Dict[Any, int] = {}  # 1 = on the DFS stack, 2 = done
+        postorder: List[Any] = []
+        cyclic = set()
+        for seed in seeds:
+            if seed in state:
+                continue
+            state[seed] = 1
+            stack = [(seed, iter(self._dependents_of(seed)))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    child_state = state.get(child)
+                    if child_state is None:
+                        state[child] = 1
+                        stack.append((child, iter(self._dependents_of(child))))
+                        break
+                    if child_state == 1:
+                        # Back edge: everything on the stack from `child` up is on a cycle
+                        on_stack = [n for n, _ in stack]
+                        cyclic.update(on_stack[on_stack.index(child):])
+                else:
+                    stack.pop()
+                    state[node] = 2
+                    postorder.append(node)
+        postorder.reverse()
+        return [node for node in postorder if not isinstance(node, RangeRef)], cyclic
+
+    def recalculate(self, overrides: Dict[str, Any]) -> RecalcResult:
+        """Apply cell overrides and re-evaluate every formula that depends on them.
+
+        Args:
+            overrides: {"Assumption!K18": 30.0, ...}; an overridden formula
+                cell becomes a constant.
+
+        Returns:
+            RecalcResult. The workbook's saved values are not modified, so
+            scenarios can be recalculated independently.
+        """
+        cells = parse_overrides(overrides)
+        evaluation = _Evaluation(self)
+        for key, value in cells.items():
+            evaluation.set(key, value)
+
+        order, cyclic = self._evaluation_order(list(cells))
+        result = RecalcResult(values=dict(cells))
+        for key in order:
+            formula = self.formulas.get(key)
+            if key in cells or formula is None:
+                continue
+            if formula.evaluate is None:
+                result.stale[key] = formula.error
+                continue
+            if key in cyclic:
+                result.stale[key] = "circular reference"
+                continue
+            saved = self.values.get(key)
+            evaluation.row, evaluation.col = key[1], key[2]
+            try:
+                value = _finalize(formula.evaluate(evaluation), saved)
+            except ExcelError as error:
+                value = error
+            except ZeroDivisionError:
+                value = ExcelError("#DIV/0!")
+            except (OverflowError, ValueError):
+                value = ExcelError("#NUM!")
+            except UnsupportedFormula as exc:
+                result.stale[key] = str(exc)
+                continue
+            result.evaluated += 1
+            evaluation.set(key, value)
+            if not _same(saved, value):
+                result.values[key] = value
+        return result
@@ -1,8 +1,99 @@
 """Datetime helpers for hourly timelines."""
 
+import numpy as np
 import pandas as pd
 
 
 def to_datetime(series: pd.Series) -> pd.Series:
     """Convert a series to pandas datetime."""
-    raise NotImplementedError("Implement datetime conversion.")
+    return pd.to_datetime(series)
+
+
+def infer_step_hours(datetime_series: pd.Series, default: float = 1.0) -> float:
+    """Infer the simulation step (hours) from the median timestamp spacing.
+
+    Returns `default` when fewer than two valid timestamps are available.
+    """
+    timestamps = pd.to_datetime(pd.Series(datetime_series)).dropna()
+    if len(timestamps) < 2:
+        return default
+
+    step = timestamps.diff().dropna().median() / pd.Timedelta(hours=1)
+    if not np.isfinite(step) or step <= 0:
+        return default
+    return float(step)
+
+
+def _resample_factor(step_hours: float, target_step_hours: float) -> int:
+    """Return the integer ratio between two step sizes (coarse / fine)."""
+    ratio = max(step_hours, target_step_hours) / min(step_hours, target_step_hours)
+    factor = int(round(ratio))
+    if not np.isclose(ratio, factor):
+        raise ValueError(
+            f"Cannot resample {step_hours}h steps to {target_step_hours}h: ratio {ratio:.4f} is not an integer"
+        )
+    return factor
+
+
+def resample_profile(
+    values: np.ndarray,
+    step_hours: float,
+    target_step_hours: float,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Resample a power profile (kW) to another step size.
+
+    Refining (e.g. hourly -> 15-min) holds each value for the sub-steps;
+    coarsening (e.g. 5-min -> hourly) averages the sub-steps, so energy
+    (kW x step) is conserved either way.
+
+    Args:
+        values: Power per step (kW).
+        step_hours: Current step size in hours.
+        target_step_hours: Target step size in hours.
+        dtype: Output dtype (np.float32 halves memory for long profiles).
+
+    Returns:
+        Resampled power profile.
+    """
+    values = np.asarray(values)
+    factor = _resample_factor(step_hours, target_step_hours)
+
+    if target_step_hours < step_hours:
+        return np.repeat(values.astype(dtype, copy=False), factor)
+
+    if len(values) % factor:
+        raise ValueError(f"Profile length {len(values)} is not a multiple of {factor} steps")
+    return values.reshape(-1, factor).mean(axis=1, dtype=np.float64).astype(dtype, copy=False)
+
+
+def resample_flags(values: np.ndarray, step_hours: float, target_step_hours: float) -> np.ndarray:
+    """Resample per-step flags (TOU periods, discharge permission).
+
+    Refining repeats each flag; coarsening keeps the flag of the first
+    sub-step in each block.
+    """
+    values = np.asarray(values)
+    factor = _resample_factor(step_hours, target_step_hours)
+
+    if target_step_hours < step_hours:
+        return np.repeat(values, factor)
+
+    if len(values) % factor:
+        raise ValueError(f"Flag length {len(values)} is not a multiple of {factor} steps")
+    return values[::factor].copy()
+
+
+def resample_datetimes(datetime_series: pd.Series, step_hours: float, target_step_hours: float) -> pd.Series:
+    """Build the timestamp series matching a resampled profile."""
+    timestamps = pd.to_datetime(pd.Series(datetime_series)).reset_index(drop=True)
+    factor = _resample_factor(step_hours, target_step_hours)
+
+    if target_step_hours > step_hours:
+        return timestamps.iloc[::factor].reset_index(drop=True)
+
+    offsets = pd.to_timedelta(np.arange(factor) * target_step_hours, unit="h")
+    return pd.Series(
+        (timestamps.to_numpy()[:, None] + offsets.to_numpy()[None, :]).ravel(),
+        name=timestamps.name,
+    )
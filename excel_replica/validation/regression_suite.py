@@ -3,12 +3,14 @@
 End-to-end validation: load Excel truth, run Python Calc engine, compare outputs.
 """
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
 
+from excel_replica.inputs.assumptions import load_assumptions
 from excel_replica.model.calc_engine import CalcConfig, CalcResults, run_calc
 
 
@@ -37,55 +39,13 @@ def _find_column(columns: list, candidates: list) -> str | None:
 
 def _load_bess_config(file_path: Path) -> CalcConfig:
     """Load BESS parameters from Assumption sheet."""
-    df = pd.read_excel(file_path, sheet_name="Assumption", engine="openpyxl", header=None)
-
-    def get_value(row_idx: int, col_idx: int = 4) -> float:
-        val = df.iloc[row_idx, col_idx]
-        if pd.notna(val) and isinstance(val, (int, float)):
-            return float(val)
-        # Try adjacent columns
-        for c in [5, 3]:
-            val = df.iloc[row_idx, c]
-            if pd.notna(val) and isinstance(val, (int, float)):
-                return float(val)
-        return 0.0
-
-    # Row indices from Assumption sheet scan
-    total_capacity_kwh = get_value(24)  # Total BESS Storage Capacity
-    power_kw = get_value(25)            # Total BESS Power Output
-    dod = get_value(26)                 # Depth of Discharge (0.85 = 85%)
-    efficiency = get_value(27)          # HalfCycle Efficiency
-    min_soc = get_value(38)             # Min Reserve SOC
-
-    # Usable capacity = total * DoD
-    usable_capacity_kwh = total_capacity_kwh * dod
-
-    # Efficiency is stored as decimal (0.95), use as-is for charge/discharge
-    rt_efficiency = efficiency
-
-    # Tariff rates (VND/kWh) - convert to USD/kWh
-    exchange_rate = df.iloc[8, 10] if pd.notna(df.iloc[8, 10]) else 26000.0
-    ca_normal_vnd = df.iloc[13, 16] if pd.notna(df.iloc[13, 16]) else 1253.0
-    ca_peak_vnd = df.iloc[14, 16] if pd.notna(df.iloc[14, 16]) else 2162.0
-    ca_offpeak_vnd = df.iloc[15, 16] if pd.notna(df.iloc[15, 16]) else 843.0
-
-    ca_normal = float(ca_normal_vnd) / float(exchange_rate)
-    ca_peak = float(ca_peak_vnd) / float(exchange_rate)
-    ca_offpeak = float(ca_offpeak_vnd) / float(exchange_rate)
-
-    print(f"BESS Config: usable_capacity={usable_capacity_kwh} kWh (total={total_capacity_kwh}, DoD={dod}), power={power_kw} kW, eff={rt_efficiency}, min_soc={min_soc} kWh")
-    print(f"Tariffs (USD/kWh): peak={ca_peak:.4f}, normal={ca_normal:.4f}, offpeak={ca_offpeak:.4f}")
-
-    return CalcConfig(
-        step_hours=1.0,
-        bess_capacity_kwh=usable_capacity_kwh,
-        bess_power_kw=power_kw,
-        bess_efficiency=rt_efficiency,
-        min_soc_kwh=min_soc,
-        ca_peak=ca_peak,
-        ca_normal=ca_normal,
-        ca_offpeak=ca_offpeak,
-    )
+    assumptions = load_assumptions(file_path)
+    cfg = replace(assumptions.to_calc_config(), step_hours=1.0)
+
+    print(f"BESS Config: usable_capacity={cfg.bess_capacity_kwh} kWh (total={assumptions.bess_capacity_kwh}, DoD={assumptions.depth_of_discharge}), power={cfg.bess_power_kw} kW, eff={cfg.bess_efficiency}, min_soc={cfg.min_soc_kwh} kWh")
+    print(f"Tariffs (USD/kWh): peak={cfg.ca_peak:.4f}, normal={cfg.ca_normal:.4f}, offpeak={cfg.ca_offpeak:.4f}")
+
+    return cfg
 
 
 def _extract_calc_truth(calc_df: pd.DataFrame) -> Dict[str, float]:
@@ -167,7 +127,7 @@ def run_regression_suite(excel_path: Path | None = None) -> Dict[str, float]:
     cfg = _load_bess_config(file_path)
 
     print("Running Calc engine...")
-    results = run_calc(datetime_series, solar_kw, load_kw, period_flags, allow_discharge, cfg)
+    results = run_calc(datetime_series, solar_kw, load_kw, period_flags, allow_discharge, cfg, outputs_only=True)
 
     print("\n=== Regression Results ===")
     errors = {}
@@ -1,7 +1,17 @@
 """Scenario runner for synthetic Excel/Python validation.
 
-Creates scenario-specific Excel copies, applies input overrides, recalculates Excel
-(if available), then runs the audit comparison against the Python model.
+Three modes:
+- memory (default): re-evaluates the formulas that depend on each
+  scenario's overrides with the headless formula engine, applies the
+  overrides and recalculated values in memory on one shared ExcelReader
+  session and runs the Python pipeline, with no file copies or workbook
+  saves.
+- recalc: re-evaluates the workbook's formulas for each scenario with the
+  headless formula engine (no Excel needed, runs on Linux), then runs the
+  audit comparison against the Python model on the recalculated values.
+- excel: creates scenario-specific Excel copies, applies input overrides,
+  recalculates Excel (if available), then runs the audit comparison
+  against the Python model.
 """
 
 from __future__ import annotations
@@ -13,7 +23,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
 
+from excel_replica.inputs.project import load_project_inputs
 from excel_replica.outputs.audit_report import run_audit
+from excel_replica.run_pipeline import PipelineConfig, run_pipeline
+from excel_replica.utils.excel_reader import ExcelReader
+from excel_replica.utils.formula_engine import FormulaWorkbook
 
 
 @dataclass
@@ -29,6 +43,10 @@ class Scenario:
     description: str
     overrides: List[ScenarioOverride]
 
+    def cell_overrides(self) -> Dict[str, Any]:
+        """Overrides as {"Sheet!Cell": value} for ExcelReader."""
+        return {f"'{item.sheet}'!{item.cell}": item.value for item in self.overrides}
+
 
 def _load_scenario(file_path: Path) -> Scenario:
     data = json.loads(file_path.read_text(encoding="utf-8"))
@@ -92,12 +110,94 @@ def _run_scenario(base_excel: Path, scenario: Scenario, output_dir: Path) -> Dic
     }
 
 
+def _run_scenario_in_memory(
+    base_reader: ExcelReader, engine: FormulaWorkbook, scenario: Scenario,
+) -> Dict[str, Any]:
+    """Run the Python pipeline on in-memory overrides of the shared base session.
+
+    The loaders mostly read formula cells (e.g. Total_CAPEX) rather than the
+    inputs scenarios change, so the overrides are recalculated first and
+    every changed dependent is overridden too.
+    """
+    recalc = engine.recalculate(scenario.cell_overrides())
+    with base_reader.with_overrides(recalc.overrides()) as reader:
+        inputs = load_project_inputs(reader, include_dppa=False)
+    config = PipelineConfig(excel_path=base_reader.excel_path, run_dppa=False, keep_hourly=False)
+    results = run_pipeline(config, inputs=inputs)
+    return {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "recalculated": not recalc.stale,
+        "stale_cells": len(recalc.stale),
+        "summary": results.summary,
+    }
+
+
+def run_scenarios_in_memory(base_excel: Path, scenarios: List[Scenario]) -> List[Dict[str, Any]]:
+    """Run every scenario against one parsed copy of the base workbook.
+
+    The workbook's formulas are compiled once and each scenario re-evaluates
+    only the cells that depend on its overrides before the pipeline runs.
+    """
+    with ExcelReader(base_excel) as base_reader:
+        engine = FormulaWorkbook(base_excel, named_ranges=base_reader.named_ranges)
+        return [_run_scenario_in_memory(base_reader, engine, scenario) for scenario in scenarios]
+
+
+def _run_scenario_recalculated(
+    engine: FormulaWorkbook, scenario: Scenario, output_dir: Path,
+) -> Dict[str, Any]:
+    """Recalculate the scenario's formulas headlessly and audit the result."""
+    recalc = engine.recalculate(scenario.cell_overrides())
+    comparisons, _ = run_audit(
+        engine.excel_path,
+        output_path=output_dir / f"{scenario.name}_audit.md",
+        overrides=recalc.overrides(),
+    )
+    return {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "recalculated": not recalc.stale,
+        "stale_cells": len(recalc.stale),
+        "comparisons": comparisons,
+    }
+
+
+def run_scenarios_recalculated(
+    base_excel: Path, scenarios: List[Scenario], output_dir: Path,
+) -> List[Dict[str, Any]]:
+    """Audit every scenario against headlessly recalculated Excel values.
+
+    The base workbook's formulas are compiled once; each scenario then
+    re-evaluates only the cells that depend on its overrides.
+    """
+    with ExcelReader(base_excel) as reader:
+        named_ranges = reader.named_ranges
+    engine = FormulaWorkbook(base_excel, named_ranges=named_ranges)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return [_run_scenario_recalculated(engine, scenario, output_dir) for scenario in scenarios]
+
+
+def _summarize_in_memory(results: List[Dict[str, Any]]) -> None:
+    print("\n=== Scenario Summary (Python model) ===")
+    for result in results:
+        summary = result["summary"]
+        status = "recalc" if result["recalculated"] else f"partial ({result['stale_cells']} unsupported)"
+        print(
+            f"- {result['scenario']}: project IRR {summary['project_irr'] * 100:.2f}%, "
+            f"equity IRR {summary['equity_irr'] * 100:.2f}%, NPV ${summary['npv_usd']:,.0f} ({status})"
+        )
+
+
 def _summarize(results: List[Dict[str, Any]]) -> None:
     print("\n=== Scenario Summary ===")
     for result in results:
         scenario = result["scenario"]
         recalculated = result["recalculated"]
-        status = "recalc" if recalculated else "manual"
+        if "stale_cells" in result:
+            status = "recalc" if recalculated else f"partial ({result['stale_cells']} unsupported)"
+        else:
+            status = "recalc" if recalculated else "manual"
         max_err = max(comp.percent_error for comp in result["comparisons"]) * 100
         print(f"- {scenario}: max error {max_err:.2f}% ({status})")
 
@@ -106,16 +206,40 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Run synthetic scenario validation")
     parser.add_argument("--base-excel", type=Path, required=True)
     parser.add_argument("--scenarios-dir", type=Path, required=True)
-    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument(
+        "--output-dir", type=Path,
+        help="Scenario workbook copies (excel mode) or audit reports (recalc mode)",
+    )
+    parser.add_argument(
+        "--mode", choices=("memory", "recalc", "excel"), default="memory",
+        help=(
+            "memory: headless formula recalculation, in-memory overrides, Python model only; "
+            "recalc: headless formula recalculation + audit; "
+            "excel: edited copies + Excel recalc + audit"
+        ),
+    )
     args = parser.parse_args()
 
     scenario_files = sorted(args.scenarios_dir.glob("*.json"))
     if not scenario_files:
         raise SystemExit("No scenario JSON files found.")
+    scenarios = [_load_scenario(scenario_file) for scenario_file in scenario_files]
+
+    if args.mode == "memory":
+        _summarize_in_memory(run_scenarios_in_memory(args.base_excel, scenarios))
+        print("\nNote: 'partial' scenarios depend on formulas the engine cannot evaluate; those cells keep their saved values.")
+        return
+
+    if args.mode == "recalc":
+        output_dir = args.output_dir or Path(__file__).parent / "outputs"
+        _summarize(run_scenarios_recalculated(args.base_excel, scenarios, output_dir))
+        print("\nNote: 'partial' scenarios depend on formulas the engine cannot evaluate; those cells keep their saved values.")
+        return
 
+    if args.output_dir is None:
+        parser.error("--output-dir is required in excel mode")
     results = []
-    for scenario_file in scenario_files:
-        scenario = _load_scenario(scenario_file)
+    for scenario in scenarios:
         result = _run_scenario(args.base_excel, scenario, args.output_dir)
         results.append(result)
 
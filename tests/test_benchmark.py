@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+from excel_replica.analysis.benchmark import (
+    BenchmarkResult,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.baseline = {"case": BenchmarkResult(name="case", seconds=0.100, peak_mib=50.0, size=8760)}
+
+    def test_no_regression_within_threshold(self):
+        results = {"case": BenchmarkResult(name="case", seconds=0.120, peak_mib=54.0, size=8760)}
+        self.assertEqual(compare_to_baseline(results, self.baseline), [])
+
+    def test_time_and_memory_regressions(self):
+        results = {"case": BenchmarkResult(name="case", seconds=0.200, peak_mib=80.0, size=8760)}
+        regressions = compare_to_baseline(results, self.baseline)
+        self.assertEqual(len(regressions), 2)
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            save_baseline(self.baseline, path)
+            self.assertEqual(load_baseline(path), self.baseline)
+
+    def test_run_benchmark(self):
+        result = run_benchmark("simulate_lifetime", repeats=1)
+        self.assertEqual(result.size, 25)
+        self.assertGreater(result.seconds, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
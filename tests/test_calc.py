@@ -1,7 +1,18 @@
 import unittest
 import numpy as np
 import pandas as pd
-from excel_replica.model.calc_engine import CalcConfig, run_calc
+from excel_replica.model.calc_engine import (
+    HAS_NUMBA,
+    TOU_NORMAL,
+    TOU_OFFPEAK,
+    TOU_PEAK,
+    CalcConfig,
+    encode_tou_periods,
+    rerun_calc_from,
+    run_calc,
+    run_calc_batch,
+    run_calc_chunked,
+)
 
 class TestCalcEngine(unittest.TestCase):
     def setUp(self):
@@ -73,5 +84,194 @@ class TestCalcEngine(unittest.TestCase):
         self.assertEqual(results.hourly.iloc[1]["DischargeEnergy_kWh"], 40.5)
         self.assertEqual(results.hourly.iloc[1]["GridLoad_kW"], 50.0 - 40.5)
 
+    def test_tou_period_splits(self):
+        # 10kW grid import in each period
+        self.load_kw[:3] = 10.0
+        self.period_flags[:3] = ["P", "N", "O"]
+
+        codes = encode_tou_periods(self.period_flags[:3])
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(codes.tolist(), [TOU_PEAK, TOU_NORMAL, TOU_OFFPEAK])
+
+        self.cfg.bess_capacity_kwh = 0.0
+        for outputs_only in (False, True):
+            results = run_calc(
+                self.datetime_series, self.solar_kw, self.load_kw,
+                self.period_flags, self.allow_discharge, self.cfg, outputs_only=outputs_only
+            )
+            self.assertAlmostEqual(results.outputs["tou_cost_peak"], 10.0)
+            self.assertAlmostEqual(results.outputs["tou_cost_normal"], 5.0)
+            self.assertAlmostEqual(results.outputs["tou_cost_offpeak"], 1.0)
+            self.assertAlmostEqual(results.outputs["grid_load_peak_mwh"], 0.01)
+            self.assertAlmostEqual(results.outputs["total_tou_cost"], 16.0)
+
+    def test_invalid_tou_codes_rejected(self):
+        for codes in ([0, 1, 3], [-1, 0, 2]):
+            with self.assertRaises(ValueError):
+                encode_tou_periods(np.array(codes))
+            with self.assertRaises(ValueError):
+                run_calc(
+                    self.datetime_series[:3], self.solar_kw[:3], self.load_kw[:3],
+                    np.array(codes), self.allow_discharge[:3], self.cfg
+                )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            run_calc(
+                self.datetime_series, self.solar_kw, self.load_kw,
+                self.period_flags, self.allow_discharge, self.cfg, backend="fortran"
+            )
+
+    @unittest.skipUnless(HAS_NUMBA, "numba not installed")
+    def test_numba_backend_matches_python(self):
+        rng = np.random.default_rng(0)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours)
+        self.period_flags = rng.choice(["P", "N", "O"], self.hours)
+
+        args = (
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        python_results = run_calc(*args, backend="python")
+        numba_results = run_calc(*args, backend="numba")
+
+        pd.testing.assert_frame_equal(python_results.hourly, numba_results.hourly, check_exact=True)
+        self.assertEqual(python_results.outputs, numba_results.outputs)
+
+    def test_outputs_only_matches_full_run(self):
+        rng = np.random.default_rng(2)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours)
+        self.period_flags = rng.choice(["P", "N", "O"], self.hours)
+
+        args = (
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        full = run_calc(*args)
+        lean = run_calc(*args, outputs_only=True)
+
+        self.assertIsNone(lean.hourly)
+        for key, value in full.outputs.items():
+            self.assertAlmostEqual(lean.outputs[key], value, places=9)
+
+    def test_chunked_matches_single_run(self):
+        rng = np.random.default_rng(3)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours).astype(np.float32)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours).astype(np.float32)
+
+        args = (
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        full = run_calc(*args)
+        chunks = []
+        chunked = run_calc_chunked(*args, chunk_steps=5, on_chunk=chunks.append)
+
+        self.assertEqual(len(chunks), 5)
+        np.testing.assert_array_equal(
+            np.concatenate([c.hourly["SOC_kWh"].to_numpy() for c in chunks]),
+            full.hourly["SOC_kWh"].to_numpy(),
+        )
+        for key, value in full.outputs.items():
+            self.assertAlmostEqual(chunked.outputs[key], value, places=9)
+
+    def test_resume_from_state(self):
+        rng = np.random.default_rng(4)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours)
+
+        full = run_calc(
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        first = run_calc(
+            self.datetime_series[:10], self.solar_kw[:10], self.load_kw[:10],
+            self.period_flags[:10], self.allow_discharge[:10], self.cfg
+        )
+        second = run_calc(
+            self.datetime_series[10:], self.solar_kw[10:], self.load_kw[10:],
+            self.period_flags[10:], self.allow_discharge[10:], self.cfg,
+            initial_soc_kwh=first.state.soc_kwh
+        )
+
+        self.assertEqual(first.state.steps, 10)
+        self.assertEqual(second.state.soc_kwh, full.state.soc_kwh)
+        np.testing.assert_array_equal(
+            second.hourly["SOC_kWh"].to_numpy(), full.hourly["SOC_kWh"].to_numpy()[10:]
+        )
+
+    def test_rerun_from_checkpoint_matches_fresh_run(self):
+        rng = np.random.default_rng(5)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours)
+        self.period_flags[8:12] = "P"
+
+        for outputs_only in (False, True):
+            previous = run_calc(
+                self.datetime_series, self.solar_kw, self.load_kw, self.period_flags,
+                self.allow_discharge, self.cfg, outputs_only=outputs_only, checkpoint_every=6
+            )
+            edited_load = self.load_kw.copy()
+            edited_load[15] += 40.0
+
+            args = (
+                self.datetime_series, self.solar_kw, edited_load,
+                self.period_flags, self.allow_discharge, self.cfg
+            )
+            fresh = run_calc(*args, outputs_only=outputs_only, checkpoint_every=6)
+            rerun = rerun_calc_from(previous, 15, *args)
+
+            self.assertEqual(rerun.state, fresh.state)
+            np.testing.assert_array_equal(rerun.checkpoints.soc_kwh, fresh.checkpoints.soc_kwh)
+            np.testing.assert_allclose(rerun.checkpoints.totals, fresh.checkpoints.totals)
+            for key, value in fresh.outputs.items():
+                self.assertAlmostEqual(rerun.outputs[key], value, places=9)
+            if not outputs_only:
+                pd.testing.assert_frame_equal(rerun.hourly, fresh.hourly)
+
+    def test_rerun_requires_checkpoints(self):
+        args = (
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        with self.assertRaises(ValueError):
+            rerun_calc_from(run_calc(*args), 0, *args)
+
+    def test_batch_matches_single_runs(self):
+        rng = np.random.default_rng(1)
+        self.solar_kw = rng.uniform(0.0, 120.0, self.hours)
+        self.load_kw = rng.uniform(0.0, 80.0, self.hours)
+        capacities = np.array([0.0, 50.0, 100.0, 400.0])
+        powers = np.array([50.0, 25.0, 50.0, 100.0])
+
+        batch = run_calc_batch(
+            self.solar_kw, self.load_kw, self.period_flags, self.allow_discharge,
+            self.cfg, bess_capacity_kwh=capacities, bess_power_kw=powers, backend="python"
+        )
+
+        for i in range(len(capacities)):
+            self.cfg.bess_capacity_kwh = capacities[i]
+            self.cfg.bess_power_kw = powers[i]
+            single = run_calc(
+                self.datetime_series, self.solar_kw, self.load_kw,
+                self.period_flags, self.allow_discharge, self.cfg
+            )
+            for key, value in single.outputs.items():
+                self.assertAlmostEqual(batch.outputs[key][i], value, places=9)
+
+    def test_batch_profile_stack(self):
+        self.solar_kw[0] = 100.0
+        stack = np.vstack([self.solar_kw, 2 * self.solar_kw])
+
+        batch = run_calc_batch(
+            stack, self.load_kw, self.period_flags, self.allow_discharge, self.cfg
+        )
+
+        np.testing.assert_allclose(batch.outputs["solar_gen_mwh"], [0.1, 0.2])
+        np.testing.assert_allclose(batch.outputs["charge_mwh"], [0.05, 0.05])
+
+
 if __name__ == "__main__":
     unittest.main()
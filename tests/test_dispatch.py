@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+import pandas as pd
+from excel_replica.model.calc_engine import CalcConfig, run_calc, run_calc_batch
+from excel_replica.model.dispatch import (
+    STRATEGIES,
+    apply_dispatch,
+    get_strategy,
+    prepare_dispatch,
+    run_strategy,
+)
+
+class TestDispatch(unittest.TestCase):
+    def setUp(self):
+        self.cfg = CalcConfig(
+            step_hours=1.0,
+            bess_capacity_kwh=100.0,
+            bess_power_kw=50.0,
+            bess_efficiency=0.9,
+            ca_peak=1.0,
+            ca_normal=0.5,
+            ca_offpeak=0.1
+        )
+        self.hours = 4
+        self.datetime_series = pd.date_range("2025-01-01", periods=self.hours, freq="h")
+        # Hour 0 charges 45 kWh; hours 1-3 have 40 kW net load
+        self.solar_kw = np.array([100.0, 0.0, 0.0, 0.0])
+        self.load_kw = np.array([0.0, 40.0, 40.0, 40.0])
+        self.period_flags = np.array(["N", "N", "P", "P"])
+        self.allow_discharge = np.ones(self.hours, dtype=bool)
+
+    def _run(self, strategy, **params):
+        return run_strategy(
+            strategy, self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg, **params
+        )
+
+    def test_registry(self):
+        self.assertTrue({"excel_clone", "peak_only", "reserve_held", "peak_shaving"} <= set(STRATEGIES))
+        self.assertIs(get_strategy(1), STRATEGIES["excel_clone"])
+        self.assertIs(get_strategy(1.0), STRATEGIES["excel_clone"])
+        with self.assertRaises(ValueError):
+            get_strategy("unknown")
+
+    def test_excel_clone_matches_run_calc(self):
+        results = self._run("excel_clone")
+        expected = run_calc(
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+        pd.testing.assert_frame_equal(results.hourly, expected.hourly)
+
+    def test_peak_only(self):
+        discharge = self._run("peak_only").hourly["DischargeEnergy_kWh"].to_numpy()
+        self.assertEqual(discharge[1], 0.0)
+        self.assertGreater(discharge[2], 0.0)
+
+    def test_reserve_held(self):
+        soc = self._run("reserve_held", reserve_soc_kwh=20.0).hourly["SOC_kWh"].to_numpy()
+        self.assertAlmostEqual(soc.min(), 20.0)
+
+    def test_peak_shaving(self):
+        results = self._run("peak_shaving", target_kw=30.0)
+        np.testing.assert_allclose(results.hourly["GridLoad_kW"].to_numpy()[1:], 30.0)
+        with self.assertRaises(ValueError):
+            self._run("peak_shaving")
+
+    def test_strategy_runs_in_batch(self):
+        allow, cfg = prepare_dispatch(
+            "peak_shaving", self.allow_discharge, self.period_flags, self.cfg, target_kw=30.0
+        )
+        batch = run_calc_batch(self.solar_kw, self.load_kw, self.period_flags, allow, cfg)
+        single = self._run("peak_shaving", target_kw=30.0)
+        self.assertAlmostEqual(batch.outputs["discharge_mwh"][0], single.outputs["discharge_mwh"])
+
+    def test_apply_dispatch(self):
+        calc_df = pd.DataFrame({
+            "DateTime": self.datetime_series,
+            "SolarGen_kW": self.solar_kw,
+            "Load_kW": self.load_kw,
+            "TimePeriodFlag": self.period_flags,
+        })
+        assumptions = {
+            "bess_capacity_kwh": 100.0,
+            "bess_power_kw": 50.0,
+            "bess_efficiency": 0.9,
+            "strategy_mode": 1,
+        }
+
+        hourly = apply_dispatch(calc_df, assumptions)
+
+        # Flag is 1 only where solar covers the load (NetLoadAfterSolar <= 0)
+        self.assertEqual(hourly["DischargeConditionFlag"].tolist(), [1, 0, 0, 0])
+        self.assertGreater(hourly["DischargeEnergy_kWh"].sum(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
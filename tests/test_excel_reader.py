@@ -0,0 +1,217 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from excel_replica.model.dppa import load_dppa_config_from_excel
+from excel_replica.model.financial import load_excel_dates, load_excel_ebitda, load_excel_net_fcfe
+from excel_replica.model.lifetime import load_degradation_from_excel
+from excel_replica.utils.excel_cache import CACHE_DIR_ENV
+from excel_replica.utils.excel_reader import ExcelReader
+
+
+def write_test_workbook(path):
+    """Small workbook with the cells the loaders read."""
+    wb = Workbook()
+    assumption = wb.active
+    assumption.title = "Assumption"
+    assumption["Q39"] = 1900.0  # Strike_Price
+    assumption["K9"] = 25000.0  # Exchange_rate
+
+    financial = wb.create_sheet("Financial")
+    for year in range(25):
+        financial.cell(row=6, column=11 + year, value=pd.Timestamp(2026 + year, 12, 31).to_pydatetime())
+        financial.cell(row=117, column=12 + year, value=1000.0 + year)
+        financial.cell(row=187, column=11 + year, value=-500.0 if year == 0 else 100.0)
+
+    loss = wb.create_sheet("Loss")
+    loss.append(["Year", "Battery Loss", "Battery", "PV Loss", "PV", "Battery wt Replacement"])
+    loss.append([None] * 6)
+    for year in range(25):
+        loss.append([year + 1, 0.02, 1.0, 0.005, 1.0 - 0.005 * year, 0.98])
+
+    calc = wb.create_sheet("Calc")
+    calc.append(["DateTime", "SolarGen_kW", "Load_kW", "TimePeriodFlag"])
+    for hour in range(3):
+        calc.append([pd.Timestamp(2025, 1, 1, hour).to_pydatetime(), 10.0 * hour, 5.0, "NPO"[hour]])
+
+    wb.save(path)
+
+
+class TestExcelReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.xlsx")
+        write_test_workbook(self.path)
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: self.cache_dir})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_loaders_accept_path_or_reader(self):
+        with ExcelReader(self.path) as reader:
+            self.assertEqual(load_excel_ebitda(reader), load_excel_ebitda(self.path))
+            self.assertEqual(load_excel_net_fcfe(reader), load_excel_net_fcfe(self.path))
+            self.assertEqual(load_excel_dates(reader), load_excel_dates(self.path))
+            np.testing.assert_array_equal(
+                load_degradation_from_excel(reader).pv_factor,
+                load_degradation_from_excel(self.path).pv_factor,
+            )
+
+        self.assertEqual(load_excel_ebitda(self.path)[:2], [1000.0, 1001.0])
+        self.assertEqual(load_excel_net_fcfe(self.path)[:2], [-500.0, 100.0])
+        self.assertEqual(load_excel_dates(self.path)[0], pd.Timestamp(2026, 12, 31))
+        self.assertAlmostEqual(load_degradation_from_excel(self.path).pv_factor[1], 0.995)
+
+    def test_session_opens_workbook_once(self):
+        with mock.patch("excel_replica.utils.excel_reader.pd.ExcelFile", wraps=pd.ExcelFile) as opened:
+            with ExcelReader(self.path) as reader:
+                load_excel_ebitda(reader)
+                load_excel_net_fcfe(reader)
+                load_excel_dates(reader)
+                load_degradation_from_excel(reader)
+                dppa_cfg = load_dppa_config_from_excel(reader)
+                calc_df = reader.get_df("Calc")
+                reader.get_df("Calc")
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(dppa_cfg.strike_price_vnd, 1900.0)
+        self.assertEqual(calc_df["Load_kW"].tolist(), [5.0, 5.0, 5.0])
+
+    def test_get_df_returns_copy(self):
+        with ExcelReader(self.path) as reader:
+            calc_df = reader.get_df("Calc")
+            calc_df["Load_kW"] = 0.0
+            self.assertEqual(reader.get_df("Calc")["Load_kW"].tolist(), [5.0, 5.0, 5.0])
+
+    def test_disk_cache_skips_workbook_parse(self):
+        with ExcelReader(self.path) as reader:
+            ebitda = load_excel_ebitda(reader)
+            strike = reader.get_value("Strike_Price")
+            calc_df = reader.get_df("Calc")
+
+        with mock.patch("excel_replica.utils.excel_reader.pd.ExcelFile") as opened:
+            with ExcelReader(self.path) as reader:
+                self.assertEqual(load_excel_ebitda(reader), ebitda)
+                self.assertEqual(reader.get_value("Strike_Price"), strike)
+                pd.testing.assert_frame_equal(reader.get_df("Calc"), calc_df)
+        opened.assert_not_called()
+
+    def test_disk_cache_invalidated_on_change(self):
+        with ExcelReader(self.path) as reader:
+            self.assertEqual(reader.get_value("Strike_Price"), 1900.0)
+
+        wb = load_workbook(self.path)
+        wb["Assumption"]["Q39"] = 2000.0
+        wb.save(self.path)
+
+        with ExcelReader(self.path) as reader:
+            self.assertEqual(reader.get_value("Strike_Price"), 2000.0)
+
+    def test_named_cells_read_without_parsing_sheets(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            with mock.patch.object(pd.ExcelFile, "parse") as parse:
+                strike = reader.get_value("Strike_Price")
+                exchange_rate = reader.get_value("Exchange_rate")
+                missing = reader.get_value("PCL", 163.2)
+            parse.assert_not_called()
+
+        with ExcelReader(self.path, use_cache=False) as reader:
+            reader.get_sheet("Assumption")
+            self.assertEqual(reader.get_value("Strike_Price"), strike)
+            self.assertEqual(reader.get_value("Exchange_rate"), exchange_rate)
+
+        self.assertEqual((strike, exchange_rate, missing), (1900.0, 25000.0, 163.2))
+
+    def test_unknown_sheet_returns_default(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            self.assertEqual(reader.get_value("Actual_installation_capacity", 40360.0), 40360.0)
+
+    def test_get_range_block_read(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            with mock.patch.object(pd.ExcelFile, "parse") as parse:
+                streamed = reader.get_range("Financial!$K$117:$M$117")
+                padded = reader.get_range("Financial!$AJ$187:$AL$188")
+            parse.assert_not_called()
+            reader.get_sheet("Financial")
+            sliced = reader.get_range("Financial!$K$117:$M$117")
+
+        np.testing.assert_array_equal(streamed, [[0.0, 1000.0, 1001.0]])
+        np.testing.assert_array_equal(sliced, streamed)
+        self.assertEqual(padded.shape, (2, 3))
+        self.assertEqual(padded.sum(), 0.0)
+
+    def test_get_range_keeps_only_numeric_cells(self):
+        # K6:L6 hold dates; M6 is numeric text
+        with ExcelReader(self.path, use_cache=False, overrides={"Financial!M6": "12"}) as reader:
+            streamed = reader.get_range("Financial!$K$6:$N$6")
+            reader.get_sheet("Financial")
+            sliced = reader.get_range("Financial!$K$6:$N$6", fill=-1.0)
+
+        np.testing.assert_array_equal(streamed, [[0.0, 0.0, 0.0, 0.0]])
+        np.testing.assert_array_equal(sliced, [[-1.0, -1.0, -1.0, -1.0]])
+
+    def test_get_range_named_and_invalid(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            self.assertEqual(reader.get_range("Strike_Price").tolist(), [[1900.0]])
+            with self.assertRaises(KeyError):
+                reader.get_range("No_Such_Name")
+
+    def test_preload_in_worker_processes(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            expected = (load_excel_ebitda(reader), load_dppa_config_from_excel(reader), reader.get_df("Calc"))
+
+        with ExcelReader(self.path, use_cache=False) as reader:
+            reader.preload(frames=["Calc"], ranges=["Financial!$L$117:$AJ$117"], max_workers=2)
+            with mock.patch("excel_replica.utils.excel_reader.pd.ExcelFile") as opened:
+                ebitda = load_excel_ebitda(reader)
+                dppa_cfg = load_dppa_config_from_excel(reader)
+                calc_df = reader.get_df("Calc")
+            opened.assert_not_called()
+
+        self.assertEqual(ebitda, expected[0])
+        self.assertEqual(dppa_cfg, expected[1])
+        pd.testing.assert_frame_equal(calc_df, expected[2])
+
+    def test_cell_overrides(self):
+        mtime = os.path.getmtime(self.path)
+        overrides = {"Assumption!Q39": 2100.0, "Financial!$L$117": 7.0, "Calc!B2": 99.0, "Calc!D1": "Flag"}
+        with ExcelReader(self.path, overrides=overrides) as reader:
+            self.assertEqual(reader.get_value("Strike_Price"), 2100.0)
+            self.assertEqual(load_excel_ebitda(reader)[:2], [7.0, 1001.0])
+            self.assertEqual(reader.get_sheet("Financial").iloc[116, 11], 7.0)
+            calc_df = reader.get_df("Calc")
+            self.assertEqual(calc_df["SolarGen_kW"].iloc[0], 99.0)
+            self.assertIn("Flag", calc_df.columns)
+            with self.assertRaises(ValueError):
+                reader.get_df("Calc", usecols="A:B")
+
+        with ExcelReader(self.path) as reader:
+            self.assertEqual(reader.get_value("Strike_Price"), 1900.0)
+            self.assertEqual(reader.get_sheet("Financial").iloc[116, 11], 1000.0)
+        self.assertEqual(os.path.getmtime(self.path), mtime)
+
+    def test_with_overrides_shares_parsed_data(self):
+        with ExcelReader(self.path) as base:
+            load_dppa_config_from_excel(base)
+            base.get_df("Calc")
+            with mock.patch("excel_replica.utils.excel_reader.pd.ExcelFile") as opened:
+                with base.with_overrides({"Assumption!K9": 20000.0}) as scenario:
+                    dppa_cfg = load_dppa_config_from_excel(scenario)
+                    scenario.get_df("Calc")
+                opened.assert_not_called()
+            self.assertEqual(dppa_cfg.exchange_rate, 20000.0)
+            self.assertEqual(load_dppa_config_from_excel(base).exchange_rate, 25000.0)
+
+    def test_cache_disabled(self):
+        with ExcelReader(self.path, use_cache=False) as reader:
+            reader.get_value("Strike_Price")
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
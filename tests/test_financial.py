@@ -1,7 +1,21 @@
 import unittest
 import numpy as np
+import numpy_financial as npf
 import pandas as pd
-from excel_replica.model.financial import FinancialConfig, run_financial_model
+from excel_replica.model.financial import (
+    GRADIENT_INPUTS,
+    FinancialConfig,
+    MRASchedule,
+    TaxHoliday,
+    calculate_financial_jacobian,
+    calculate_irr_batch,
+    calculate_xirr_batch,
+    calculate_xnpv,
+    calculate_xnpv_batch,
+    run_financial_batch,
+    run_financial_model,
+    year_fractions,
+)
 
 class TestFinancialModel(unittest.TestCase):
     def setUp(self):
@@ -36,5 +50,170 @@ class TestFinancialModel(unittest.TestCase):
         # Year 1 Revenue = 10000 * 50 = 500k
         self.assertAlmostEqual(results.yearly.iloc[0]["Revenue_USD"], 500000.0)
 
+    def test_vectorized_schedules_match_scalar_rules(self):
+        holiday = TaxHoliday()
+        self.assertEqual(holiday.get_rates(30).tolist(), [holiday.get_rate(y) for y in range(1, 31)])
+        mra = MRASchedule()
+        self.assertEqual(
+            mra.get_annual_contributions(12).tolist(),
+            [float(mra.get_annual_contribution(y)) for y in range(1, 13)],
+        )
+
+    def test_yearly_schedule(self):
+        cfg = FinancialConfig(
+            pv_cost_usd=10_000_000, om_pv_usd=100_000, leverage_ratio=0.5,
+            interest_rate=0.08, debt_tenor_years=3, target_dscr=1.25,
+            depreciation_years=20, project_years=25,
+        )
+        excel_ebitda = [400_000.0, -50_000.0]
+        yearly = run_financial_model(
+            self.lifetime_results, self.revenue_per_mwh, cfg, excel_ebitda=excel_ebitda,
+        ).yearly
+
+        # Excel EBITDA for the first two years, computed afterwards
+        self.assertEqual(yearly["EBITDA_USD"].tolist()[:2], excel_ebitda)
+        self.assertEqual(yearly["OPEX_USD"].tolist()[:2], [0.0, 0.0])
+        year3 = yearly.iloc[2]
+        self.assertAlmostEqual(year3["Revenue_USD"], 500_000.0 * 1.05 ** 2)
+        self.assertAlmostEqual(year3["OPEX_USD"], 100_000.0 * 1.04 ** 2)
+
+        # Debt service only in tenor years with positive CFADS
+        self.assertEqual(yearly["Debt_Service_USD"][1], 0.0)
+        self.assertAlmostEqual(yearly["Debt_Service_USD"][0], 400_000.0 / 1.25)
+        self.assertTrue((yearly["Debt_Service_USD"][3:] == 0.0).all())
+        # Year 1: dividends = CFADS + principal - interest, principal = DS - interest
+        interest = 5_000_000.0 * 0.08
+        self.assertAlmostEqual(yearly["FCFE_USD"][0], 400_000.0 + (320_000.0 - interest) - interest)
+        self.assertTrue((yearly["Tax_USD"] >= 0.0).all())
+        self.assertEqual(yearly["Year"].tolist(), list(range(1, 26)))
+
+    def test_batch_matches_single_runs(self):
+        params = {
+            "pv_cost_usd": np.array([5e6, 8e6, 3e6]),
+            "interest_rate": np.array([0.08, 0.0, 0.12]),
+            "debt_tenor_years": np.array([10, 15, 0]),
+            "target_dscr": np.array([1.3, 1.1, 1.5]),
+        }
+        prices = np.array([50.0, 35.0, 80.0])
+        batch = run_financial_batch(self.lifetime_results, prices, self.cfg, params)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.equity_cf.shape, (3, 26))
+
+        for i in range(3):
+            cfg = FinancialConfig(**{
+                **self.cfg.__dict__,
+                "pv_cost_usd": params["pv_cost_usd"][i],
+                "interest_rate": params["interest_rate"][i],
+                "debt_tenor_years": int(params["debt_tenor_years"][i]),
+                "target_dscr": params["target_dscr"][i],
+            })
+            single = run_financial_model(self.lifetime_results, prices[i], cfg)
+            for column, values in batch.yearly.items():
+                np.testing.assert_array_equal(values[i], single.yearly[column].to_numpy(), err_msg=column)
+            self.assertAlmostEqual(batch.project_irr[i], single.project_irr, places=12)
+            self.assertAlmostEqual(batch.equity_irr[i], single.equity_irr, places=12)
+            self.assertAlmostEqual(batch.npv[i], single.npv, delta=1e-6 * abs(single.npv))
+            self.assertEqual(batch.payback_years[i], single.payback_years)
+
+    def test_batch_rejects_per_scenario_project_years(self):
+        with self.assertRaises(ValueError):
+            run_financial_batch(self.lifetime_results, 50.0, self.cfg, {"project_years": np.array([20, 25])})
+        with self.assertRaises(ValueError):
+            run_financial_batch(self.lifetime_results, 50.0, self.cfg, {"capex": np.array([1.0])})
+
+    def test_irr_batch_matches_npf(self):
+        rng = np.random.default_rng(0)
+        cash_flows = rng.uniform(0.5, 2.0, (50, 26)) * 1e6
+        cash_flows[:, 0] = -cash_flows[:, 1:].sum(axis=1) * rng.uniform(0.4, 1.5, 50)
+        cash_flows[:5, 1:3] *= -1  # Negative early years, still one sign change
+        cash_flows[5, 4] = 0.0
+
+        result = calculate_irr_batch(cash_flows)
+        expected = [npf.irr(cf) for cf in cash_flows]
+        np.testing.assert_allclose(result.irr, expected, rtol=0, atol=1e-10)
+        self.assertFalse(result.multiple_roots.any())
+
+        # Warm start from neighbouring IRRs converges to the same roots
+        warm = calculate_irr_batch(cash_flows, guess=np.roll(result.irr, 1))
+        np.testing.assert_allclose(warm.irr, result.irr, rtol=0, atol=1e-12)
+
+    def test_irr_batch_flags_multiple_and_missing_roots(self):
+        cash_flows = np.array([
+            [-100.0, 230.0, -132.0],  # IRRs of 10% and 20%
+            [-100.0, -50.0, 0.0],  # No sign change
+            [-100.0, 0.0, 121.0],
+        ])
+        result = calculate_irr_batch(cash_flows)
+
+        self.assertAlmostEqual(result.irr[0], 0.1)
+        self.assertTrue(np.isnan(result.irr[1]))
+        self.assertAlmostEqual(result.irr[2], 0.1, places=12)
+        self.assertEqual(result.multiple_roots.tolist(), [True, False, False])
+
+    def test_xnpv_uses_year_fractions(self):
+        dates = [pd.Timestamp(2026, 12, 31), None, pd.Timestamp(2028, 12, 31), pd.Timestamp(2029, 12, 31)]
+        cash_flows = np.array([-1000.0, 999.0, 600.0, 600.0])
+        fractions = year_fractions(dates)
+        np.testing.assert_array_equal(fractions, [0.0, np.nan, 731 / 365, 1096 / 365])
+
+        expected = -1000.0 + 600.0 / 1.1 ** (731 / 365) + 600.0 / 1.1 ** (1096 / 365)
+        self.assertAlmostEqual(calculate_xnpv(cash_flows, dates, 0.1), expected, places=9)
+        batch = calculate_xnpv_batch(np.vstack([cash_flows, 2 * cash_flows]), fractions, np.array([0.1, 0.1]))
+        np.testing.assert_allclose(batch, [expected, 2 * expected])
+
+    def test_xirr_batch(self):
+        dates = [pd.Timestamp(2026, 12, 31) + pd.DateOffset(months=7 * k) for k in range(12)]
+        fractions = year_fractions(dates)
+        rng = np.random.default_rng(1)
+        cash_flows = rng.uniform(1.0, 2.0, (20, 12))
+        cash_flows[:, 0] = -cash_flows[:, 1:].sum(axis=1) * 0.8
+
+        result = calculate_xirr_batch(cash_flows, fractions)
+        np.testing.assert_allclose(calculate_xnpv_batch(cash_flows, fractions, result.irr), 0.0, atol=1e-12)
+
+        # Whole years reproduce IRR, including the multiple-root choice
+        flows = np.array([[-100.0, 230.0, -132.0], [-100.0, 0.0, 121.0]])
+        xirr = calculate_xirr_batch(flows, np.arange(3.0))
+        irr = calculate_irr_batch(flows)
+        np.testing.assert_allclose(xirr.irr, irr.irr, atol=1e-12)
+        self.assertEqual(xirr.multiple_roots.tolist(), [True, False])
+
+    def test_batch_xnpv_with_dates(self):
+        dates = [pd.Timestamp(2026, 12, 31) + pd.DateOffset(years=k) for k in range(25)]
+        batch = run_financial_batch(self.lifetime_results, np.array([50.0, 60.0]), self.cfg, dates=dates)
+        for i in range(2):
+            net_fcfe = batch.equity_cf[i, 1:].copy()
+            net_fcfe[0] += batch.equity_cf[i, 0]
+            self.assertAlmostEqual(batch.npv[i], calculate_xnpv(net_fcfe, dates, self.cfg.discount_rate), places=6)
+
+    def test_gradients_match_finite_differences(self):
+        params = {"pv_cost_usd": np.array([5e6, 7e6]), "interest_rate": np.array([0.08, 0.05])}
+        prices = np.array([80.0, 95.0])
+        batch = run_financial_batch(self.lifetime_results, prices, self.cfg, params, gradients=True)
+
+        for name in ("pv_cost_usd", "interest_rate", "target_dscr", "price_escalation", "discount_rate", "revenue_per_mwh"):
+            base = prices if name == "revenue_per_mwh" else params.get(name, getattr(self.cfg, name))
+            step = 1e-6 * np.abs(base)
+            bumped = []
+            for sign in (1, -1):
+                value = base + sign * step
+                if name == "revenue_per_mwh":
+                    bumped.append(run_financial_batch(self.lifetime_results, value, self.cfg, params))
+                else:
+                    bumped.append(run_financial_batch(self.lifetime_results, prices, self.cfg, {**params, name: value}))
+            for metric in ("project_irr", "equity_irr", "npv"):
+                expected = (getattr(bumped[0], metric) - getattr(bumped[1], metric)) / (2 * step)
+                np.testing.assert_allclose(batch.gradients[metric][name], expected, rtol=1e-5, atol=1e-12, err_msg=f"{metric}/{name}")
+
+    def test_financial_jacobian(self):
+        jacobian = calculate_financial_jacobian(self.lifetime_results, 80.0, self.cfg)
+
+        self.assertEqual(list(jacobian.index), list(GRADIENT_INPUTS))
+        self.assertEqual(list(jacobian.columns), ["Project_IRR", "Equity_IRR", "NPV_USD"])
+        # CAPEX components enter only through their sum
+        self.assertEqual(jacobian.loc["pv_cost_usd"].tolist(), jacobian.loc["land_cost_usd"].tolist())
+        self.assertLess(jacobian.loc["pv_cost_usd", "NPV_USD"], 0.0)
+        self.assertEqual(jacobian.loc["debt_tenor_years"].tolist(), [0.0, 0.0, 0.0])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from openpyxl import Workbook, load_workbook
+from test_excel_reader import write_test_workbook
+from excel_replica.utils.excel_cache import CACHE_DIR_ENV
+from excel_replica.utils.formula_engine import ExcelError, FormulaWorkbook, compile_formula
+from excel_replica.validation.scenario_runner import Scenario, ScenarioOverride, run_scenarios_recalculated
+
+
+def write_formula_workbook(path):
+    """Workbook with a small formula chain across two sheets."""
+    wb = Workbook()
+    inputs = wb.active
+    inputs.title = "Inputs"
+    inputs["A1"] = 10.0
+    inputs["A2"] = "=A1*2"
+    inputs["A3"] = "=SUM(A1:A2)+'Other Sheet'!B1"
+    inputs["A4"] = '=IFERROR(1/(A1-10),"div")'
+    inputs["A5"] = '=_xlfn.SWITCH(A1,10,"ten",20,"twenty","other")'
+    inputs["A6"] = "=UNKNOWNFN(A1)"
+    inputs["A7"] = "=B1*3"  # Does not depend on A1
+    inputs["B1"] = 7.0
+    other = wb.create_sheet("Other Sheet")
+    other["B1"] = 5.0
+    other["C1"] = "=SUM(Inputs!A:A)"
+    wb.save(path)
+
+
+class TestCompileFormula(unittest.TestCase):
+    def evaluate(self, formula):
+        compiled = compile_formula(formula, "Sheet")
+        self.assertIsNotNone(compiled.evaluate, compiled.error)
+        return compiled.evaluate(mock.Mock())
+
+    def test_excel_semantics(self):
+        self.assertEqual(self.evaluate("=-2^2"), 4.0)
+        self.assertEqual(self.evaluate("=ROUND(2.675,2)"), 2.68)
+        self.assertEqual(self.evaluate("=MOD(-3,2)"), 1.0)
+        self.assertEqual(self.evaluate('="A"="a"'), True)
+        self.assertEqual(self.evaluate("=50%*2"), 1.0)
+        self.assertEqual(self.evaluate('="x"&1.5&TRUE'), "x1.5TRUE")
+        self.assertEqual(self.evaluate("=EDATE(DATE(2024,1,31),1)"), 45351.0)  # 2024-02-29
+        with self.assertRaises(ExcelError):
+            self.evaluate("=1/0")
+
+    def test_references_collected(self):
+        compiled = compile_formula("=SUM('Other Sheet'!$B$1:$C$3)+A1+LET(x,1,x)", "Sheet")
+        self.assertIsNone(compiled.evaluate)
+        self.assertIn(("Sheet", 0, 0), compiled.cells)
+        self.assertEqual(len(compiled.ranges), 1)
+
+
+class TestFormulaWorkbook(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "formulas.xlsx")
+        write_formula_workbook(self.path)
+        self.engine = FormulaWorkbook(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_recalculates_dependents_only(self):
+        result = self.engine.recalculate({"Inputs!A1": 20.0})
+
+        self.assertEqual(result.values[("Inputs", 1, 0)], 40.0)
+        self.assertEqual(result.values[("Inputs", 2, 0)], 65.0)
+        self.assertEqual(result.values[("Inputs", 3, 0)], 0.1)
+        self.assertEqual(result.values[("Inputs", 4, 0)], "twenty")
+        self.assertNotIn(("Inputs", 6, 0), result.values)
+        # A2, A3, A4, A5 and the whole-column SUM; A7 is not a dependent
+        self.assertEqual(result.evaluated, 5)
+        self.assertEqual(set(result.stale), {("Inputs", 5, 0)})
+
+    def test_scenarios_are_independent(self):
+        self.engine.recalculate({"Inputs!A1": 20.0})
+        result = self.engine.recalculate({"Inputs!A1": 10.0})
+
+        self.assertEqual(result.values[("Inputs", 3, 0)], "div")
+        self.assertEqual(result.values[("Inputs", 4, 0)], "ten")
+        self.assertEqual(self.engine.values[("Inputs", 0, 0)], 10.0)
+
+    def test_errors_propagate(self):
+        result = self.engine.recalculate({"'Other Sheet'!B1": "text"})
+
+        self.assertEqual(result.values[("Inputs", 2, 0)], ExcelError("#VALUE!"))
+        self.assertEqual(result.overrides()["'Other Sheet'!C1"], "#VALUE!")
+
+    def test_circular_references_reported(self):
+        wb = load_workbook(self.path)
+        wb["Inputs"]["C1"] = "=C2+A1"
+        wb["Inputs"]["C2"] = "=C1+1"
+        wb.save(self.path)
+
+        result = FormulaWorkbook(self.path).recalculate({"Inputs!A1": 1.0})
+        self.assertIn("circular reference", result.stale.values())
+
+
+class TestRecalculatedScenarios(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.xlsx")
+        write_test_workbook(self.path)
+        wb = load_workbook(self.path)
+        calc = wb["Calc"]
+        for col, header in enumerate(["DischargeEnergy_kWh", "PowerSurplus_kW", "PVCharged_kWh"], start=5):
+            calc.cell(row=1, column=col, value=header)
+            for row in range(2, 5):
+                calc.cell(row=row, column=col, value=f"=B{row}/2")
+        financial = wb["Financial"]
+        financial["G123"] = "=Assumption!K9/1000000"  # Project IRR
+        financial["G189"], financial["G193"], financial["J96"] = 0.1, 1000.0, 5000.0
+        wb.save(self.path)
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.tmp.name, "cache")})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_audit_uses_recalculated_values(self):
+        scenarios = [
+            Scenario(name="fx", description="", overrides=[ScenarioOverride("Assumption", "K9", 30000.0)]),
+            Scenario(name="solar", description="", overrides=[ScenarioOverride("Calc", "B3", 40.0)]),
+        ]
+        output_dir = Path(self.tmp.name) / "out"
+        results = run_scenarios_recalculated(Path(self.path), scenarios, output_dir)
+
+        self.assertTrue(all(result["recalculated"] for result in results))
+        fx, solar = ({c.metric: c.excel_value for c in r["comparisons"]} for r in results)
+        # openpyxl saves no cached formula values, so only recalculated cells are non-blank
+        self.assertAlmostEqual(fx["project_irr"], 0.03)
+        self.assertEqual(fx["discharge_mwh"], 0.0)
+        self.assertEqual(solar["project_irr"], 0.0)
+        self.assertAlmostEqual(solar["discharge_mwh"], 40.0 / 2 / 1000)  # Only row 3 depends on B3
+        self.assertTrue((output_dir / "fx_audit.md").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
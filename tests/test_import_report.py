@@ -0,0 +1,43 @@
+import unittest
+from excel_replica.analysis.import_report import (
+    LAZY_PACKAGES,
+    measure_import,
+    parse_importtime,
+    summarize,
+)
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     numpy._core
+import time:      2000 |       2100 |   numpy
+import time:       300 |       3000 | mypkg.cli
+"""
+
+
+class TestImportReport(unittest.TestCase):
+    def test_parse_and_summarize(self):
+        timings = parse_importtime(SAMPLE)
+        self.assertEqual([t.module for t in timings], ["numpy._core", "numpy", "mypkg.cli"])
+        self.assertEqual(timings[0].depth, 2)
+
+        report = summarize("mypkg.cli", timings)
+        self.assertAlmostEqual(report.total_seconds, 0.003)
+        self.assertEqual(report.top(1), [("numpy", 0.0021)])
+
+    def test_nested_packages_counted_once(self):
+        sample = """import time:       100 |        100 |     numpy._core
+import time:      2000 |       2100 |   numpy
+import time:       500 |       2600 | pandas
+"""
+        report = summarize("pandas", parse_importtime(sample))
+        self.assertAlmostEqual(report.packages["numpy"], 0.0021)
+        self.assertAlmostEqual(report.packages["pandas"], 0.0005)
+        self.assertAlmostEqual(sum(report.packages.values()), report.total_seconds)
+
+    def test_pipeline_defers_heavy_imports(self):
+        report = measure_import("excel_replica.run_pipeline")
+        self.assertGreater(report.total_seconds, 0.0)
+        self.assertFalse(set(LAZY_PACKAGES) & set(report.packages))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import dataclasses
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from openpyxl import load_workbook
+from test_excel_reader import write_test_workbook
+from excel_replica.inputs.assumptions import load_assumptions, load_calc_config
+from excel_replica.inputs.loss_factors import load_loss_factors
+from excel_replica.inputs.profiles import import_profiles
+from excel_replica.inputs.other_inputs import load_other_inputs
+from excel_replica.inputs.project import load_project_inputs
+from excel_replica.run_pipeline import PipelineConfig, run_pipeline
+from excel_replica.utils.excel_cache import CACHE_DIR_ENV
+from excel_replica.validation.scenario_runner import Scenario, ScenarioOverride, run_scenarios_in_memory
+
+
+class TestInputs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.xlsx")
+        write_test_workbook(self.path)
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.tmp.name, "cache")})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_loaders(self):
+        assumptions = load_assumptions(self.path)
+        self.assertEqual(assumptions.exchange_rate, 25000.0)
+        self.assertEqual(assumptions.strategy_mode, 1)
+
+        cfg = load_calc_config(self.path)
+        self.assertAlmostEqual(cfg.bess_capacity_kwh, 66000.0 * 0.85)
+        self.assertAlmostEqual(cfg.ca_peak, 2162.0 / 25000.0)
+
+        factors = load_loss_factors(self.path)
+        self.assertEqual(factors["pv_factor"].shape, (25,))
+        self.assertAlmostEqual(factors["pv_factor"][1], 0.995)
+        self.assertAlmostEqual(factors["bess_factor"][0], 0.98)
+
+        self.assertEqual(load_other_inputs(self.path), {})
+
+    def test_project_inputs_immutable_and_picklable(self):
+        inputs = load_project_inputs(self.path)
+
+        self.assertEqual(len(inputs.profiles), 3)
+        self.assertEqual(inputs.profiles.period_flags.tolist(), ["N", "P", "O"])
+        self.assertEqual(inputs.excel_ebitda[:2], (1000.0, 1001.0))
+        self.assertEqual(inputs.dppa.strike_price_vnd, 1900.0)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            inputs.calc = None
+        with self.assertRaises(ValueError):
+            inputs.profiles.load_kw[0] = 0.0
+
+        restored = pickle.loads(pickle.dumps(inputs))
+        self.assertEqual(restored.calc, inputs.calc)
+        np.testing.assert_array_equal(restored.degradation.pv_factor, inputs.degradation.pv_factor)
+        self.assertFalse(restored.profiles.solar_kw.flags.writeable)
+
+    def test_pipeline_reuses_inputs(self):
+        inputs = load_project_inputs(self.path)
+        config = PipelineConfig(excel_path=self.path)
+        with mock.patch("excel_replica.inputs.project.load_profiles_from_excel") as loader:
+            results = run_pipeline(config, inputs=inputs)
+        loader.assert_not_called()
+        self.assertEqual(results.summary, run_pipeline(config).summary)
+
+    def test_stale_profile_bundle_rejected(self):
+        bundle = os.path.join(self.tmp.name, "profiles")
+        import_profiles(self.path, bundle)
+        inputs = load_project_inputs(self.path, profiles_path=bundle)
+        self.assertEqual(inputs.profiles.period_flags.tolist(), ["N", "P", "O"])
+
+        wb = load_workbook(self.path)
+        wb["Calc"]["C2"] = 7.0
+        wb.save(self.path)
+        with self.assertRaises(ValueError):
+            load_project_inputs(self.path, profiles_path=bundle)
+
+    def test_scenarios_run_in_memory(self):
+        scenario = Scenario(
+            name="small", description="", overrides=[ScenarioOverride("Assumption", "E25", 33000.0)],
+        )
+        with mock.patch("excel_replica.validation.scenario_runner.load_project_inputs",
+                        wraps=load_project_inputs) as loader:
+            results = run_scenarios_in_memory(self.path, [scenario])
+
+        self.assertEqual(results[0]["scenario"], "small")
+        scenario_reader = loader.call_args.args[0]
+        self.assertAlmostEqual(load_calc_config(scenario_reader).bess_capacity_kwh, 33000.0 * 0.85)
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["cache", "model.xlsx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from excel_replica.model.calc_engine import CalcConfig, run_calc
+from excel_replica.model.lifetime import (
+    DegradationSchedule,
+    simulate_lifetime,
+    simulate_lifetime_hourly,
+)
+
+class TestLifetime(unittest.TestCase):
+    def setUp(self):
+        self.cfg = CalcConfig(
+            step_hours=1.0,
+            bess_capacity_kwh=100.0,
+            bess_power_kw=50.0,
+            bess_efficiency=0.9,
+            ca_peak=1.0,
+            ca_normal=0.5,
+            ca_offpeak=0.1
+        )
+        hours = 48
+        rng = np.random.default_rng(0)
+        self.solar_kw = rng.uniform(0.0, 150.0, hours)
+        self.load_kw = rng.uniform(0.0, 80.0, hours)
+        self.period_flags = rng.choice(["P", "N", "O"], hours)
+        self.allow_discharge = np.ones(hours, dtype=bool)
+        self.degradation = DegradationSchedule(
+            pv_factor=np.array([1.0, 0.99, 0.98]),
+            bess_factor=np.array([1.0, 0.5, 1.0]),
+        )
+
+    def test_hourly_year1_matches_calc(self):
+        lifetime = simulate_lifetime_hourly(
+            self.solar_kw, self.load_kw, self.period_flags, self.allow_discharge,
+            self.cfg, self.degradation, project_years=3
+        )
+        year1 = run_calc(
+            None, self.solar_kw, self.load_kw, self.period_flags,
+            self.allow_discharge, self.cfg, outputs_only=True
+        )
+
+        self.assertEqual(len(lifetime.yearly), 3)
+        self.assertAlmostEqual(lifetime.yearly.iloc[0]["Discharge_MWh"], year1.outputs["discharge_mwh"])
+
+        # Year 2 re-dispatches degraded PV with half the BESS capacity
+        self.cfg.bess_capacity_kwh = 50.0
+        year2 = run_calc(
+            None, 0.99 * self.solar_kw, self.load_kw, self.period_flags,
+            self.allow_discharge, self.cfg, outputs_only=True
+        )
+        self.assertAlmostEqual(lifetime.yearly.iloc[1]["Discharge_MWh"], year2.outputs["discharge_mwh"])
+        self.assertAlmostEqual(lifetime.yearly.iloc[1]["Surplus_MWh"], year2.outputs["power_surplus_mwh"])
+
+        scaled = simulate_lifetime(year1.outputs, self.degradation, project_years=3)
+        self.assertAlmostEqual(
+            lifetime.totals["total_solar_gen_mwh"], scaled.totals["total_solar_gen_mwh"]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
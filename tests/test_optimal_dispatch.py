@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+import pandas as pd
+from excel_replica.model.calc_engine import CalcConfig, run_calc
+from excel_replica.model.optimal_dispatch import benchmark_dispatch, run_optimal_dispatch
+
+class TestOptimalDispatch(unittest.TestCase):
+    def setUp(self):
+        self.cfg = CalcConfig(
+            step_hours=1.0,
+            bess_capacity_kwh=100.0,
+            bess_power_kw=50.0,
+            bess_efficiency=0.9,
+            ca_peak=1.0,
+            ca_normal=0.5,
+            ca_offpeak=0.1
+        )
+        # Two days: solar at noon, normal-tariff load before the evening peak
+        hours = 48
+        hour_of_day = np.arange(hours) % 24
+        self.datetime_series = pd.date_range("2025-01-01", periods=hours, freq="h")
+        self.solar_kw = np.where(hour_of_day == 12, 150.0, 0.0)
+        self.load_kw = np.where((hour_of_day >= 14) & (hour_of_day < 20), 40.0, 0.0)
+        self.period_flags = np.where(hour_of_day >= 18, "P", "N")
+        self.period_flags[hour_of_day < 6] = "O"
+        self.allow_discharge = np.ones(hours, dtype=bool)
+        self.args = (
+            self.datetime_series, self.solar_kw, self.load_kw,
+            self.period_flags, self.allow_discharge, self.cfg
+        )
+
+    def test_optimal_saves_charge_for_peak(self):
+        rule = run_calc(*self.args)
+        optimal = run_optimal_dispatch(*self.args)
+
+        self.assertLess(optimal.calc.outputs["total_tou_cost"], rule.outputs["total_tou_cost"])
+        # The battery holds its energy until the peak hours
+        self.assertGreater(optimal.calc.outputs["discharge_peak_mwh"], rule.outputs["discharge_peak_mwh"])
+        self.assertEqual(optimal.windows, 2)
+
+    def test_schedule_respects_limits(self):
+        hourly = run_optimal_dispatch(*self.args).calc.hourly
+        soc = hourly["SOC_kWh"].to_numpy()
+        charge = hourly["ChargeEnergy_kWh"].to_numpy()
+        discharge = hourly["DischargeEnergy_kWh"].to_numpy()
+
+        self.assertTrue(np.all(soc <= self.cfg.bess_capacity_kwh + 1e-6))
+        self.assertTrue(np.all(charge <= self.cfg.bess_power_kw + 1e-9))
+        np.testing.assert_allclose(
+            soc, np.cumsum(charge * 0.9 - discharge / 0.9), atol=1e-6
+        )
+
+    def test_reserve_above_initial_soc_must_be_charged(self):
+        cfg = CalcConfig(**{**self.cfg.__dict__, "reserve_soc_kwh": 60.0})
+        args = self.args[:-1] + (cfg,)
+        hourly = run_optimal_dispatch(*args).calc.hourly
+        soc = hourly["SOC_kWh"].to_numpy()
+        charge = hourly["ChargeEnergy_kWh"].to_numpy()
+        discharge = hourly["DischargeEnergy_kWh"].to_numpy()
+
+        # Only energy charged above the reserve is discharged
+        np.testing.assert_allclose(soc, np.cumsum(charge * 0.9 - discharge / 0.9), atol=1e-6)
+        self.assertLessEqual(discharge.sum() / 0.9, charge.sum() * 0.9 - 60.0 + 1e-6)
+        self.assertEqual(discharge[:12].sum(), 0.0)
+
+    def test_benchmark(self):
+        benchmark, _ = benchmark_dispatch(*self.args)
+        self.assertGreaterEqual(benchmark.optimal_savings, benchmark.rule_savings)
+        self.assertLessEqual(benchmark.capture_ratio, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
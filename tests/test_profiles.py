@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from excel_replica.inputs.profiles import (
+    import_profiles,
+    is_stale,
+    load_profiles,
+    load_profiles_from_excel,
+)
+from excel_replica.model.calc_engine import CalcConfig, run_calc
+from excel_replica.utils.excel_cache import CACHE_DIR_ENV
+
+
+def write_calc_workbook(path, hours=48):
+    wb = Workbook()
+    calc = wb.active
+    calc.title = "Calc"
+    calc.append(["DateTime", "SolarGen_kW", "Load_kW", "TimePeriodFlag", "DischargeConditionFlag"])
+    for hour in range(hours):
+        flag = "P" if 17 <= hour % 24 < 20 else ("O" if hour % 24 < 4 else "n")
+        calc.append([
+            (pd.Timestamp(2025, 1, 1) + pd.Timedelta(hours=hour)).to_pydatetime(),
+            max(0.0, 80.0 - abs(hour % 24 - 12) * 12.0),
+            40.0,
+            flag,
+            int(flag != "O"),
+        ])
+    wb.save(path)
+
+
+class TestProfiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.xlsx")
+        self.bundle = os.path.join(self.tmp.name, "profiles")
+        write_calc_workbook(self.path)
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.tmp.name, "cache")})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_round_trip_is_memory_mapped(self):
+        imported = import_profiles(self.path, self.bundle)
+        loaded = load_profiles(self.bundle)
+
+        self.assertIsInstance(loaded.load_kw, np.memmap)
+        self.assertEqual(loaded.period_flags.dtype.kind, "U")
+        self.assertEqual(loaded.period_flags[0], "O")
+        self.assertEqual(loaded.period_flags[12], "N")
+        for name in ("datetime", "solar_kw", "load_kw", "period_flags", "allow_discharge"):
+            np.testing.assert_array_equal(getattr(loaded, name), getattr(imported, name))
+
+    def test_bundle_runs_like_workbook(self):
+        import_profiles(self.path, self.bundle)
+        cfg = CalcConfig(bess_capacity_kwh=100.0, bess_power_kw=30.0, bess_efficiency=0.9,
+                         ca_peak=1.0, ca_normal=0.5, ca_offpeak=0.1)
+
+        def calc(p):
+            return run_calc(p.datetime_series, p.solar_kw, p.load_kw, p.period_flags, p.allow_discharge, cfg)
+
+        expected = calc(load_profiles_from_excel(self.path))
+        actual = calc(load_profiles(self.bundle))
+        pd.testing.assert_frame_equal(actual.hourly, expected.hourly)
+
+    def test_is_stale(self):
+        self.assertTrue(is_stale(self.bundle, self.path))
+        import_profiles(self.path, self.bundle)
+        self.assertFalse(is_stale(self.bundle, self.path))
+        write_calc_workbook(self.path, hours=24)
+        self.assertTrue(is_stale(self.bundle, self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
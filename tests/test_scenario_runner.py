@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from openpyxl import load_workbook
+from test_excel_reader import write_test_workbook
+from excel_replica.inputs.assumptions import load_calc_config, load_financial_config
+from excel_replica.inputs.project import load_project_inputs
+from excel_replica.utils.excel_cache import CACHE_DIR_ENV
+from excel_replica.validation.scenario_runner import Scenario, ScenarioOverride, run_scenarios_in_memory
+
+
+class TestInMemoryScenarios(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "model.xlsx")
+        write_test_workbook(self.path)
+        wb = load_workbook(self.path)
+        assumption = wb["Assumption"]
+        # The loaders read the formula cells, not the scenario inputs
+        assumption["K18"], assumption["K19"] = 40.36, 66.0
+        assumption["E15"] = "=K18*1000"  # Actual_installation_capacity
+        assumption["E25"] = "=K19*1000"  # Total_BESS_Storage_Capacity
+        wb.save(self.path)
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.tmp.name, "cache")})
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_capacity_override_reaches_pipeline(self):
+        base = Scenario(name="base", description="", overrides=[
+            ScenarioOverride("Assumption", "K18", 40.36), ScenarioOverride("Assumption", "K19", 66.0),
+        ])
+        small = Scenario(name="small", description="", overrides=[
+            ScenarioOverride("Assumption", "K18", 30.0), ScenarioOverride("Assumption", "K19", 40.0),
+        ])
+        with mock.patch("excel_replica.validation.scenario_runner.load_project_inputs",
+                        wraps=load_project_inputs) as loader:
+            base_result, small_result = run_scenarios_in_memory(Path(self.path), [base, small])
+
+        self.assertTrue(small_result["recalculated"])
+        self.assertNotEqual(small_result["summary"], base_result["summary"])
+        small_reader = loader.call_args_list[1].args[0]
+        self.assertAlmostEqual(load_calc_config(small_reader).bess_capacity_kwh, 40000.0 * 0.85)
+        self.assertAlmostEqual(load_financial_config(small_reader).pv_cost_usd, 30.0 * 750_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
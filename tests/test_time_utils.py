@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+import pandas as pd
+from excel_replica.utils.time_utils import (
+    infer_step_hours,
+    resample_datetimes,
+    resample_flags,
+    resample_profile,
+)
+
+class TestTimeUtils(unittest.TestCase):
+    def test_infer_step_hours(self):
+        quarter_hourly = pd.Series(pd.date_range("2025-01-01", periods=8, freq="15min"))
+        self.assertEqual(infer_step_hours(quarter_hourly), 0.25)
+        self.assertEqual(infer_step_hours(quarter_hourly[:1]), 1.0)
+
+    def test_resample_profile_conserves_energy(self):
+        five_min = np.arange(24, dtype=float)
+        hourly = resample_profile(five_min, 5 / 60, 1.0)
+        np.testing.assert_allclose(hourly, [5.5, 17.5])
+        self.assertAlmostEqual(hourly.sum() * 1.0, five_min.sum() * 5 / 60)
+
+        quarter = resample_profile(hourly, 1.0, 0.25, dtype=np.float32)
+        self.assertEqual(quarter.dtype, np.float32)
+        self.assertEqual(len(quarter), 8)
+
+    def test_resample_flags_and_datetimes(self):
+        flags = np.array(["P", "O"])
+        np.testing.assert_array_equal(resample_flags(flags, 1.0, 0.5), ["P", "P", "O", "O"])
+
+        hourly = pd.Series(pd.date_range("2025-01-01", periods=2, freq="h"))
+        half_hourly = resample_datetimes(hourly, 1.0, 0.5)
+        self.assertEqual(list(half_hourly), list(pd.date_range("2025-01-01", periods=4, freq="30min")))
+
+    def test_non_integer_ratio(self):
+        with self.assertRaises(ValueError):
+            resample_profile(np.ones(4), 1.0, 0.4)
+
+if __name__ == "__main__":
+    unittest.main()